@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""measures the resident set size (RSS) of the current process across
+many calls to ``expect(X).to.equal(Y)`` to detect memory growth in
+:class:`sure.core.DeepComparison`.
+
+Usage:
+
+.. code:: bash
+
+   python benchmarks/deep_comparison_rss.py [CALLS] [--max-growth-mb MB]
+"""
+import gc
+import sys
+import argparse
+import resource
+from pathlib import Path
+
+from sure import expect
+
+
+def current_rss_mb() -> float:
+    """returns the current RSS in megabytes, falling back to the peak
+    RSS on platforms without ``/proc``"""
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        pages = int(statm.read_text().split()[1])
+        return pages * resource.getpagesize() / 1024 / 1024
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def fixture(index: int) -> dict:
+    return {
+        "id": index,
+        "name": f"item-{index}",
+        "tags": ["a", "b", "c"],
+        "price": float(index) / 3,
+        "nested": {"values": list(range(20))},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("calls", type=int, nargs="?", default=100000)
+    parser.add_argument("--max-growth-mb", type=float, default=20.0)
+    args = parser.parse_args()
+
+    warmup = max(args.calls // 10, 1)
+    for index in range(warmup):
+        expect(fixture(index)).to.equal(fixture(index))
+
+    gc.collect()
+    baseline = current_rss_mb()
+    for index in range(args.calls):
+        expect(fixture(index)).to.equal(fixture(index))
+
+    gc.collect()
+    growth = current_rss_mb() - baseline
+    print(f"{args.calls} calls: RSS {baseline:.1f}MB -> {baseline + growth:.1f}MB ({growth:+.1f}MB)")
+    if growth > args.max_growth_mb:
+        print(f"RSS grew more than {args.max_growth_mb}MB", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""measures the cost per scenario of reporting suites of increasing
+sizes with :class:`sure.reporters.feature.FeatureReporter` to detect
+bookkeeping whose cost grows along with the amount of scenarios
+already reported.
+
+Usage:
+
+.. code:: bash
+
+   python benchmarks/reporter_bookkeeping.py [SIZES...] [--max-ratio RATIO]
+"""
+import io
+import sys
+import time
+import argparse
+
+from sure.reporters import FeatureReporter
+from sure.runtime import RuntimeRole
+from sure.terminal import BufferedShell
+
+
+class Location(object):
+    def __init__(self, index: int):
+        self.name = f"test_{index}"
+        self.description = ""
+        self.path_and_lineno = f"~/tests/test_suite.py:{index}"
+
+
+class Scenario(object):
+    def __init__(self, index: int):
+        self.location = Location(index)
+        self.description = ""
+
+
+class Result(object):
+    is_success = True
+    is_failure = False
+    is_timeout = False
+    is_error = False
+    profile = None
+    memory = None
+    duration = 0.001
+    role = RuntimeRole.Unit
+
+    def __init__(self, scenario: Scenario):
+        self.location = scenario.location
+
+
+def report(size: int) -> float:
+    """returns the amount of seconds spent reporting the given amount
+    of scenarios"""
+    reporter = FeatureReporter(None)
+    reporter.sh = BufferedShell(io.StringIO())
+    scenarios = [Scenario(index) for index in range(size)]
+    results = [Result(scenario) for scenario in scenarios]
+
+    started = time.perf_counter()
+    for scenario, result in zip(scenarios, results):
+        reporter.on_scenario(scenario)
+        reporter.on_scenario_done(scenario, result)
+
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", type=int, nargs="*", default=[1000, 10000, 100000])
+    parser.add_argument("--max-ratio", type=float, default=3.0)
+    args = parser.parse_args()
+
+    costs = []
+    for size in sorted(args.sizes):
+        cost = report(size) / size
+        costs.append(cost)
+        print(f"{size:>7} scenarios: {cost * 1e6:.2f}µs per scenario")
+
+    ratio = costs[-1] / costs[0]
+    print(f"cost per scenario grew {ratio:.2f}x")
+    if ratio > args.max_ratio:
+        print(f"cost per scenario grew more than {args.max_ratio}x", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
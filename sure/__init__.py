@@ -20,24 +20,27 @@
 import re
 import os
 import sys
+import time
 import builtins
 import difflib
 import inspect
 import traceback
 import operator
 from functools import wraps, partial, reduce
-from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Union
 
 from sure.original import AssertionHelper
 from sure.original import Iterable
 
 from sure import registry
+from sure import timing
+from sure import memory
 from sure.core import DeepComparison
 from sure.core import Explanation
 from sure.core import identify_caller_location
 from sure.errors import SpecialSyntaxDisabledError
 from sure.errors import WrongUsageError
+from sure.errors import get_most_recent_call_frame
 from sure.errors import InternalRuntimeError
 from sure.doubles.dummies import anything
 from sure.loader import get_file_name
@@ -248,6 +251,13 @@ that_with_context = scenario
 
 
 def within(**units):
+    """decorator which fails the decorated function when it takes
+    longer than the amount of time described through its single
+    keyword-argument to return, e.g.: ``within(five=miliseconds)``.
+
+    Time is measured with :func:`time.perf_counter_ns`, see also
+    :meth:`~sure.AssertionBuilder.run_within`
+    """
     if len(units) != 1:
         raise WrongUsageError(
             "within() takes a single keyword argument where the argument must be "
@@ -262,28 +272,16 @@ def within(**units):
     timeout = convert_from(value)
 
     def dec(func):
-        exc = []
-
         @wraps(func)
         def wrap(*args, **kw):
-            start = datetime.utcnow()
-
-            try:
-                func(*args, **kw)
-
-            except Exception as e:
-                exc.append(e)
-
-            end = datetime.utcnow()
-            delta = end - start
-            took = convert_to(delta.microseconds)
+            start = time.perf_counter_ns()
+            func(*args, **kw)
+            took = time.perf_counter_ns() - start
 
             if not took < timeout:
                 raise AssertionError(
                     f"{identify_caller_location(func)} did not run within {word} {unit}"
                 )
-            if exc:
-                raise exc.pop(0)
 
         wrap.__name__ = func.__name__
         wrap.__doc__ = func.__doc__
@@ -293,22 +291,24 @@ def within(**units):
     return dec
 
 
+# pairs of functions converting from each unit to nanoseconds and
+# from nanoseconds to each unit, respectively
 UNITS = {
     "minutes": (
-        lambda from_num: from_num / 60.0,
-        lambda to_num: to_num * 6000000,
+        lambda from_num: from_num * 60 * timing.NANOSECONDS["s"],
+        lambda to_num: to_num / (60 * timing.NANOSECONDS["s"]),
     ),
     "seconds": (
-        lambda from_num: from_num,
-        lambda to_num: to_num / 100000,
+        lambda from_num: from_num * timing.NANOSECONDS["s"],
+        lambda to_num: to_num / timing.NANOSECONDS["s"],
     ),
     "miliseconds": (
-        lambda from_num: from_num * 1000,
-        lambda to_num: to_num / 100,
+        lambda from_num: from_num * timing.NANOSECONDS["ms"],
+        lambda to_num: to_num / timing.NANOSECONDS["ms"],
     ),
     "microseconds": (
-        lambda from_num: from_num * 100000,
-        lambda to_num: to_num,
+        lambda from_num: from_num * timing.NANOSECONDS["us"],
+        lambda to_num: to_num / timing.NANOSECONDS["us"],
     ),
 }
 
@@ -484,6 +484,31 @@ def action_for(context, provides=None, depends_on=None):  # pragma: no cover  #
     return decorate_and_absorb
 
 
+def timeout(seconds: float):
+    """decorator for test functions, methods or classes whose tests
+    must run within the given amount of seconds, otherwise they are
+    interrupted and reported as timed out.
+
+    Overrides the command-line option ``--timeout``
+
+    .. code:: python
+
+       from sure import timeout
+
+       @timeout(2.5)
+       def test_fetch_document():
+           ...
+    """
+    if not isinstance(seconds, (int, float)) or isinstance(seconds, bool) or seconds <= 0:
+        raise TypeError(f"timeout() takes a positive number of seconds, got {repr(seconds)}")
+
+    def decorate(test):
+        test.__sure_timeout__ = seconds
+        return test
+
+    return decorate
+
+
 def work_in_progress(func):
     @wraps(func)
     def wrapper(*args, **kws):
@@ -514,6 +539,30 @@ def assertionproperty(func):
 
 
 class AssertionBuilder(object):
+    """Entrypoint of assertions such as :data:`~sure.expect`.
+
+    Calling an instance returns a new :class:`~sure.AssertionBuilder`
+    holding the ``actual`` object, such that module-level builders
+    are never mutated and assertions may run concurrently in threads
+    or :mod:`asyncio` tasks.
+    """
+
+    __slots__ = (
+        "_name",
+        "negative",
+        "actual",
+        "_callable_args",
+        "_callable_kw",
+        # code object and line number of the most recent caller,
+        # resolved into a :class:`~sure.errors.CallerLocation` only
+        # when an assertion message needs it
+        "__caller_code__",
+        "__caller_lineno__",
+        "__caller_location__",
+        # :class:`~sure.original.AssertionHelper` built on first access of ``_that``
+        "__that__",
+    )
+
     def __init__(
         self,
         name: str,
@@ -538,7 +587,10 @@ class AssertionBuilder(object):
         if isinstance(and_kws, dict):
             self._callable_kw.update(and_kws)
 
-        self.__caller__ = None
+        self.__caller_code__ = None
+        self.__caller_lineno__ = None
+        self.__caller_location__ = None
+        self.__that__ = None
 
     def __call__(self,
                  actual,
@@ -546,28 +598,38 @@ class AssertionBuilder(object):
                  with_kws=None,
                  and_kws=None,
                  *args, **kw):
-        self.__caller__ = CallerLocation.most_recent()
+        if isinstance(actual, AssertionBuilder):
+            actual = actual.actual
 
-        if isinstance(actual, self.__class__):
-            self.actual = actual.actual
-            self._callable_args = actual._callable_args
-            self._callable_kw = actual._callable_kw
-        else:
-            self.actual = actual
+        builder = self.__class__(
+            self._name, self.negative, actual, with_args, with_kws, and_kws
+        )
+        frame = get_most_recent_call_frame()
+        builder.__caller_code__ = frame.f_code
+        builder.__caller_lineno__ = frame.f_lineno
+        del frame
+
+        if args or kw:
+            # eagerly validates arguments such as ``within_range``
+            builder.__that__ = AssertionHelper(actual, *args, **kw)
+
+        return builder
+
+    @builtins.property
+    def __caller__(self) -> Optional[CallerLocation]:
+        if self.__caller_location__ is None and self.__caller_code__ is not None:
+            self.__caller_location__ = CallerLocation.from_code(
+                self.__caller_code__, self.__caller_lineno__
+            )
 
-        self._callable_args = []
-        self._callable_kw = {}
-        if isinstance(with_args, (list, tuple)):
-            self._callable_args = list(with_args)
+        return self.__caller_location__
 
-        if isinstance(with_kws, dict):
-            self._callable_kw.update(with_kws)
+    @builtins.property
+    def _that(self) -> AssertionHelper:
+        if self.__that__ is None:
+            self.__that__ = AssertionHelper(self.actual)
 
-        if isinstance(and_kws, dict):
-            self._callable_kw.update(and_kws)
-
-        self._that = AssertionHelper(self.actual, *args, **kw)
-        return self
+        return self.__that__
 
     def __getattr__(self, attr):
         try:
@@ -1037,6 +1099,83 @@ class AssertionBuilder(object):
 
     returned_the_value = return_value
 
+    @assertionmethod
+    def run_within(self, percentile=100, warmup: int = 0, repeat: int = 1, **units):
+        """asserts that calling the callable under test takes less than
+        the amount of time given through a single keyword-argument
+        ``ns``, ``us``, ``ms`` or ``s``. Time is measured with
+        :func:`time.perf_counter_ns`.
+
+        :param percentile: percentile of the time taken by the calls which must be within the given time, e.g.: ``95`` or ``"p95"``. Defaults to ``100``, that is: the slowest call
+        :param warmup: amount of calls which precede and are excluded from the measurement
+        :param repeat: amount of calls measured
+
+        .. code:: python
+
+           expect(parse).when.called_with(document).to.run_within(ms=5, warmup=10, repeat=100, percentile="p95")
+        """
+        if not callable(self.actual):
+            raise WrongUsageError(f"{repr(self.actual)} should be callable in order to measure how long it runs")
+        if not isinstance(repeat, int) or repeat < 1 or not isinstance(warmup, int) or warmup < 0:
+            raise WrongUsageError(
+                f"run_within() takes a positive int `repeat' and a non-negative int `warmup' but got repeat={repr(repeat)} and warmup={repr(warmup)}"
+            )
+
+        limit = timing.parse_limit(**units)
+        rank = timing.parse_percentile(percentile)
+        samples = timing.measure(
+            self.actual,
+            self._callable_args,
+            self._callable_kw,
+            warmup=warmup,
+            repeat=repeat,
+        )
+        took = timing.percentile_of(samples, rank)
+        name = getattr(self.actual, "__name__", repr(self.actual))
+        description = (
+            f"took {timing.format_nanoseconds(took)} at p{rank:g} of {repeat} call{'s' if repeat > 1 else ''}"
+        )
+        if self.negative:
+            if took < limit:
+                raise AssertionError(
+                    f"`{name}' should not run within {timing.format_nanoseconds(limit)} but {description}"
+                )
+        elif not took < limit:
+            raise AssertionError(
+                f"`{name}' should run within {timing.format_nanoseconds(limit)} but {description}"
+            )
+
+        return True
+
+    @assertionmethod
+    def allocate_less_than(self, **units):
+        """asserts that the peak of memory allocated while calling the
+        callable under test, measured with :mod:`tracemalloc`, is less
+        than the amount given through a single keyword-argument ``b``,
+        ``kb``, ``mb`` or ``gb``.
+
+        .. code:: python
+
+           expect(load_fixtures).when.called_with("users.json").to.allocate_less_than(mb=5)
+        """
+        if not callable(self.actual):
+            raise WrongUsageError(f"{repr(self.actual)} should be callable in order to measure how much memory it allocates")
+
+        limit = memory.parse_size(**units)
+        trace = memory.measure_allocations(self.actual, self._callable_args, self._callable_kw)
+        name = getattr(self.actual, "__name__", repr(self.actual))
+        if self.negative:
+            if trace.peak < limit:
+                raise AssertionError(
+                    f"`{name}' should not allocate less than {memory.format_bytes(limit)} but allocated {memory.format_bytes(trace.peak)} at its peak"
+                )
+        elif not trace.peak < limit:
+            raise AssertionError(
+                f"`{name}' should allocate less than {memory.format_bytes(limit)} but allocated {memory.format_bytes(trace.peak)} at its peak"
+            )
+
+        return True
+
     @assertionmethod
     def look_like(self, value):
         if self.negative:
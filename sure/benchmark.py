@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""micro-benchmarks: functions and methods whose names start with
+``bench`` run repeatedly with an automatically calibrated amount of
+iterations, their statistics are compared against those recorded in
+a JSON baseline within the cache directory of :mod:`sure`"""
+
+import time
+import inspect
+import statistics
+
+from typing import Callable, Dict, List, Optional
+
+from sure.cache import JSONCache
+from sure.errors import WrongUsageError
+from sure.timing import format_nanoseconds
+
+# minimum duration, in seconds, of each round of iterations. Rounds
+# this short are easily slowed down by a few percent, and sometimes by
+# far more, by whatever else the machine runs, hence benchmarks are
+# compared against their baseline by their fastest round, see
+# :attr:`sure.benchmark.Benchmark.change`
+MIN_ROUND_TIME = 0.005
+# amount of measured rounds of each benchmark
+ROUNDS = 5
+# maximum amount of iterations of each round
+MAX_ITERATIONS = 1 << 24
+
+__BASELINES__ = {}
+
+
+def calibrate(function: Callable, min_time: float = MIN_ROUND_TIME) -> int:
+    """returns the smallest power of two of iterations of the given
+    function which take at least ``min_time`` seconds"""
+    iterations = 1
+    while iterations < MAX_ITERATIONS:
+        if run_iterations(function, iterations) >= min_time * 1e9:
+            break
+        iterations *= 2
+
+    return iterations
+
+
+def run_iterations(function: Callable, iterations: int) -> int:
+    """calls the given function the given amount of times and returns
+    the total of nanoseconds taken"""
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        function()
+
+    return time.perf_counter_ns() - started
+
+
+class Benchmark(object):
+    """statistics of a benchmark in nanoseconds per iteration"""
+
+    def __init__(self, key: str, name: str, iterations: int, samples: List[float]):
+        self.key = key
+        self.name = name
+        self.iterations = iterations
+        self.samples = list(samples)
+        self.baseline: Optional[float] = None
+
+    def __repr__(self):
+        return f"<Benchmark {self.key} {format_nanoseconds(self.mean)}>"
+
+    @classmethod
+    def measure(
+        cls,
+        function: Callable,
+        key: Optional[str] = None,
+        rounds: int = ROUNDS,
+        min_time: float = MIN_ROUND_TIME,
+    ) -> "Benchmark":
+        """calibrates the amount of iterations of the given function
+        and measures the given amount of rounds of those iterations"""
+        if inspect.iscoroutinefunction(function):
+            raise WrongUsageError(f"benchmark {function.__qualname__} must not be a coroutine function")
+
+        iterations = calibrate(function, min_time)
+        samples = [run_iterations(function, iterations) / iterations for _ in range(rounds)]
+        return cls(key or get_benchmark_key(function), function.__name__, iterations, samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def stddev(self) -> float:
+        if len(self.samples) < 2:
+            return 0.0
+        return statistics.stdev(self.samples)
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def ops_per_second(self) -> float:
+        return 1e9 / self.mean if self.mean else float("inf")
+
+    @property
+    def change(self) -> Optional[float]:
+        """percentage by which the fastest round differs from the
+        fastest round of the baseline. Interference from other
+        processes only ever slows rounds down, making the fastest
+        round far steadier across runs than the mean"""
+        if not self.baseline:
+            return None
+        return (self.min - self.baseline) / self.baseline * 100
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "mean": self.mean,
+            "stddev": self.stddev,
+            "min": self.min,
+            "ops_per_second": self.ops_per_second,
+            "iterations": self.iterations,
+        }
+
+    def summary(self) -> str:
+        summary = (
+            f"{format_nanoseconds(self.mean)} ± {format_nanoseconds(self.stddev)} "
+            f"(min {format_nanoseconds(self.min)}, {self.ops_per_second:,.0f} ops/sec, "
+            f"{len(self.samples)} rounds of {self.iterations})"
+        )
+        if self.change is not None:
+            summary = f"{summary} {self.change:+.1f}% of baseline"
+        return summary
+
+
+def get_benchmark_key(function: Callable) -> str:
+    return f"{function.__module__}.{function.__qualname__}"
+
+
+class Baseline(object):
+    """statistics of benchmarks recorded during previous test runs,
+    keyed by the module and qualified name of each benchmark"""
+
+    def __init__(self, cache: Optional[JSONCache] = None):
+        self.cache = cache or JSONCache("benchmarks")
+        self.benchmarks = self.cache.load().get("benchmarks") or {}
+        self.dirty = False
+
+    def __repr__(self):
+        return f"<Baseline {len(self.benchmarks)} benchmarks>"
+
+    def check(self, benchmark: Benchmark, threshold: Optional[float]):
+        """attaches the fastest round recorded, or the mean of
+        baselines which lack it, to the given benchmark
+
+        :param threshold: percentage by which the fastest round of the benchmark may exceed the recorded one, ``None`` disables the check
+        :raises AssertionError: when the benchmark regressed by more than the given threshold
+        """
+        recorded = self.benchmarks.get(benchmark.key)
+        if not recorded:
+            return
+
+        benchmark.baseline = recorded.get("min", recorded.get("mean"))
+        if threshold is not None and benchmark.change > threshold:
+            raise AssertionError(
+                f"benchmark {benchmark.name} regressed by {benchmark.change:.1f}%, from "
+                f"{format_nanoseconds(benchmark.baseline)} to {format_nanoseconds(benchmark.min)} "
+                f"per iteration, which exceeds the threshold of {threshold:g}%"
+            )
+
+    def record(self, benchmark: Benchmark, overwrite: bool = False):
+        """records the given benchmark unless already recorded, or
+        regardless when ``overwrite`` is set"""
+        if benchmark.key in self.benchmarks and not overwrite:
+            return
+
+        self.benchmarks[benchmark.key] = benchmark.to_dict()
+        self.dirty = True
+
+    def save(self):
+        if self.dirty:
+            self.cache.save({"benchmarks": self.benchmarks})
+            self.dirty = False
+
+
+def get_baseline() -> Baseline:
+    """returns the :class:`~sure.benchmark.Baseline` of the current
+    cache directory, loading it once per process"""
+    cache = JSONCache("benchmarks")
+    baseline = __BASELINES__.get(cache.path)
+    if baseline is None:
+        baseline = __BASELINES__[cache.path] = Baseline(cache)
+
+    return baseline
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""persistent caches of :mod:`sure` stored as JSON files within the
+directory ``.sure_cache`` or the one defined by the environment
+variable ``SURE_CACHE_DIR``. Setting ``SURE_NO_CACHE`` disables
+persisting any cache.
+"""
+import os
+import json
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+def get_cache_dir() -> Path:
+    return Path(os.getenv("SURE_CACHE_DIR") or ".sure_cache")
+
+
+def cache_enabled() -> bool:
+    return not os.getenv("SURE_NO_CACHE")
+
+
+class JSONCache(object):
+    """JSON file within the cache directory of :mod:`sure` whose
+    contents are discarded whenever ``version`` changes"""
+
+    def __init__(
+        self,
+        name: str,
+        version: int = 1,
+        directory: Optional[Union[str, Path]] = None,
+    ):
+        self.name = name
+        self.version = version
+        self.path = Path(directory or get_cache_dir()).joinpath(f"{name}.json")
+
+    def __repr__(self):
+        return f"<JSONCache {self.path}>"
+
+    def load(self) -> Dict[str, Any]:
+        try:
+            with self.path.open() as fd:
+                contents = json.load(fd)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(contents, dict) or contents.get("version") != self.version:
+            return {}
+
+        return contents.get("data") or {}
+
+    def save(self, data: Dict[str, Any]) -> bool:
+        """atomically writes the given data into the cache file
+
+        :returns: ``True`` when the data was written
+        """
+        if not cache_enabled():
+            return False
+
+        temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with temporary.open("w") as fd:
+                json.dump({"version": self.version, "data": data}, fd)
+            os.replace(temporary, self.path)
+        except OSError:
+            return False
+
+        return True
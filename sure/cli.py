@@ -29,11 +29,33 @@ import sure.reporters
 
 from sure.loader import resolve_path                                               # pragma: no cover
 from sure.runner import Runner                                                     # pragma: no cover
-from sure.runtime import RuntimeOptions                                            # pragma: no cover
+from sure.runtime import CONCURRENCY, RuntimeOptions                               # pragma: no cover
 from sure.reporters import gather_reporter_names                                   # pragma: no cover
+from sure.scheduler import SCHEDULES, parse_shard                                  # pragma: no cover
+from sure.loader.dependencies import get_changed_files                             # pragma: no cover
+from sure.watcher import Watcher                                                   # pragma: no cover
 from sure.errors import ExitError, ExitFailure, InternalRuntimeError, treat_error  # pragma: no cover
 
 
+def parse_shard_option(value):                                                     # pragma: no cover
+    if value is None:
+        return None
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def parse_changed_since_option(value):                                             # pragma: no cover
+    if value is None:
+        return None
+    try:
+        get_changed_files(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    return value
+
+
 @click.command(no_args_is_help=True)                                               # pragma: no cover
 @click.argument("paths", nargs=-1)
 @click.option("-c", "--with-coverage", is_flag=True)
@@ -59,6 +81,7 @@ from sure.errors import ExitError, ExitFailure, InternalRuntimeError, treat_erro
     help="default=feature",
     type=click.Choice(gather_reporter_names()),
 )
+@click.option("--report-file", type=click.Path(dir_okay=False, writable=True), default=None, help="path of the file, or number of an open file descriptor, wherein machine-readable reporters, such as junit and jsonl, write their report. Default to stdout")
 @click.option("--cover-branches", is_flag=True)
 @click.option("--cover-include", multiple=True, help="includes paths or patterns in the coverage")
 @click.option("--cover-omit", multiple=True, help="omits paths or patterns from the coverage")
@@ -66,6 +89,22 @@ from sure.errors import ExitError, ExitFailure, InternalRuntimeError, treat_erro
 @click.option("--cover-erase", is_flag=True, help="erases coverage data prior to running tests")
 @click.option("--cover-concurrency", help="indicates the concurrency library used in measured code", type=click.Choice(["greenlet", "eventlet", "gevent", "multiprocessing", "thread"]), default="thread")
 @click.option("--reap-warnings", is_flag=True, help="reaps warnings during runtime and report only at the end of test session")
+@click.option("-w", "--workers", type=click.IntRange(min=1), default=1, help="runs features in parallel within the given amount of processes. Default=1")
+@click.option("--concurrency", type=click.Choice(CONCURRENCY), default="none", help="runs the scenarios of 'async def' test functions of each feature concurrently within its event loop when set to asyncio, or every scenario of each feature within a pool of threads when set to threads. Default=none")
+@click.option("--concurrency-limit", type=click.IntRange(min=1), default=10, help="maximum amount of scenarios running concurrently within a feature. Default=10")
+@click.option("--benchmark-threshold", type=click.FloatRange(min=0), default=20.0, help="fails benchmarks whose fastest round, in time per iteration, exceeds the one recorded in the baseline by more than the given percentage. Default=20")
+@click.option("--benchmark-save", is_flag=True, help="overwrites the baseline of benchmarks with the results of this run")
+@click.option("--profile", type=click.Path(dir_okay=False, writable=True), default=None, help="profiles each test with cProfile and aggregates the statistics into the given file, readable by pstats, e.g.: sure.prof")
+@click.option("--profile-top", type=click.IntRange(min=0), default=5, help="amount of functions with the highest internal time listed for each test when profiling. Default=5")
+@click.option("--trace-memory", is_flag=True, help="measures the peak of memory allocated by each test as well as the memory it retained with tracemalloc")
+@click.option("--memory-threshold", type=click.FloatRange(min=0), default=1.0, help="megabytes retained by a test beyond which it is flagged when tracing memory. Default=1")
+@click.option("--durations", type=click.IntRange(min=0), default=0, metavar="N", help="lists the N slowest scenarios and features along with a histogram of the durations of every scenario")
+@click.option("--timeout", type=click.FloatRange(min=0, min_open=True), default=None, help="reports each test which runs for longer than the given amount of seconds as timed out and moves on to the next one")
+@click.option("--watch", is_flag=True, help="keeps running and re-runs the test modules affected by each change of the files which they import")
+@click.option("--changed-since", callback=lambda ctx, param, value: parse_changed_since_option(value), help="runs only the test modules which transitively import files changed since the given git ref or since the modification time of the given file")
+@click.option("--shard", callback=lambda ctx, param, value: parse_shard_option(value), help="runs only the test modules of the K-th out of N shards, in the form K/N, e.g.: 1/4")
+@click.option("--shard-durations", type=click.Path(exists=True, dir_okay=False), default=None, help="balances shards by the durations recorded within the given file, e.g.: a copy of .sure_cache/durations.json, which is only read. Default: shards are assigned by a stable hash of the path of each test module")
+@click.option("--schedule", type=click.Choice(SCHEDULES), default="path", help="orders features by path or by the durations recorded in previous runs. Default=path")
 def entrypoint(
     paths,
     reporter,
@@ -82,6 +121,23 @@ def entrypoint(
     cover_erase,
     cover_concurrency,
     reap_warnings,
+    workers,
+    schedule,
+    shard,
+    shard_durations,
+    changed_since,
+    watch,
+    concurrency,
+    concurrency_limit,
+    timeout,
+    benchmark_threshold,
+    benchmark_save,
+    profile,
+    profile_top,
+    trace_memory,
+    memory_threshold,
+    durations,
+    report_file,
 ):
     if not paths:
         paths = glob("test*/**")
@@ -99,10 +155,30 @@ def entrypoint(
         "source": cover_module,
     }
 
-    options = RuntimeOptions(immediate=immediate, ignore=ignore, reap_warnings=reap_warnings)
+    options = RuntimeOptions(
+        immediate=immediate,
+        ignore=ignore,
+        reap_warnings=reap_warnings,
+        workers=workers,
+        schedule=schedule,
+        shard=shard,
+        shard_durations=shard_durations,
+        changed_since=changed_since,
+        concurrency=concurrency,
+        concurrency_limit=concurrency_limit,
+        timeout=timeout,
+        benchmark_threshold=benchmark_threshold,
+        benchmark_save=benchmark_save,
+        profile=profile,
+        profile_top=profile_top,
+        trace_memory=trace_memory,
+        memory_threshold=memory_threshold,
+        durations=durations,
+        report_file=report_file,
+    )
     runner = Runner(resolve_path(os.getcwd()), reporter, options)
 
-    cov = with_coverage and coverage.Coverage(**coverageopts) or None
+    cov = with_coverage and not watch and coverage.Coverage(**coverageopts) or None
     if cov:
         cover_erase and cov.erase()
         cov.load()
@@ -111,6 +187,13 @@ def entrypoint(
     if special_syntax:
         sure.enable_special_syntax()
 
+    if watch:
+        try:
+            Watcher(runner, paths).watch()
+        except KeyboardInterrupt:
+            pass
+        return
+
     try:
         result = runner.run(paths)
     except Exception as e:
@@ -19,7 +19,7 @@ import types
 from pprint import pformat
 from typing import Union, List, Dict, Tuple
 from collections import OrderedDict
-from functools import cache
+from itertools import count
 
 from sure.terminal import yellow, red, green
 from sure.doubles.dummies import Anything
@@ -43,76 +43,111 @@ class Explanation(str):
         raise self.get_assertion(X, Y, *args, **kw)
 
 
+class ComparisonContext(object):
+    """key-paths of the values currently being compared by
+    :class:`~sure.core.DeepComparison` relative to its operands"""
+
+    def __init__(self, path: List, parent):
+        self.current_X_keys = format_key_path(path)
+        self.current_Y_keys = self.current_X_keys
+        self.parent = parent
+
+
+def format_key_path(path: List) -> str:
+    if not path:
+        return ''
+
+    return '[{0}]'.format(']['.join(map(repr, path)))
+
+
+def safe_format_repr(string):
+    "Escape '{' and '}' in string for use with str.format()"
+    if not isinstance(string, (str, bytes)):
+        return string
+
+    if isinstance(string, bytes):
+        return string.replace(b'{', b'{{').replace(b'}', b'}}')
+
+    return string.replace('{', '{{').replace('}', '}}')
+
+
+def shallow_equals(X, Y) -> bool:
+    """returns ``X == Y`` or ``False`` when the builtin comparison of
+    deeply nested datastructures exceeds the recursion limit, in which
+    case :class:`~sure.core.DeepComparison` compares each nested value
+    on its own"""
+    try:
+        return X == Y
+    except RecursionError:
+        return False
+
+
 class DeepComparison(object):
-    """Performs a deep comparison between Python objects in the sense that complex or nested datastructures, such as :external+python:ref:`mappings <mapping>` of :external+python:ref:`sequences <sequence>`, :external+python:ref:`sequences <sequence>` of :external+python:ref:`mappings <mapping>`, :external+python:ref:`mappings <mapping>` of :external+python:ref:`sequences <sequence>` containing :external+python:ref:`mappings <mapping>` or sequences :external+python:ref:`sequences <sequence>` and so on, are recursively compared and reaching farthest accessible edges.
+    """Performs a deep comparison between Python objects in the sense that complex or nested datastructures, such as :external+python:ref:`mappings <mapping>` of :external+python:ref:`sequences <sequence>`, :external+python:ref:`sequences <sequence>` of :external+python:ref:`mappings <mapping>`, :external+python:ref:`mappings <mapping>` of :external+python:ref:`sequences <sequence>` containing :external+python:ref:`mappings <mapping>` or sequences :external+python:ref:`sequences <sequence>` and so on, are compared reaching farthest accessible edges.
+
+    Nested values are visited iteratively, with an explicit stack,
+    such that the depth of the compared datastructures is not bound
+    to the recursion limit of the Python interpreter.
     """
-    def __init__(self, X, Y, epsilon=None, parent=None):
-        self.complex_cmp_funcs = {
-            float: self.compare_floats,
-            dict: self.compare_ordered_dicts,
-            list: self.compare_iterables,
-            set: self.compare_iterables,
-            frozenset: self.compare_iterables,
-            tuple: self.compare_iterables,
-            OrderedDict: self.compare_ordered_dicts
-        }
 
+    # dispatch table shared by every instance, keyed by the exact type
+    # of the operands, see :meth:`compare_complex_instances`
+    complex_cmp_funcs = {}
+
+    def __init__(self, X, Y, epsilon=None, parent=None):
         self.operands = X, Y
         self.epsilon = epsilon
         self.parent = parent
-        self._context = None
+        self._path = []
+        self._contexts = {}
 
     def is_simple(self, obj):
         return isinstance(obj, (
             str, int, bytes, bytearray, Anything
         ))
 
-    @cache
     def get_context(self):
-        X_keys = []
-        Y_keys = []
+        """returns a :class:`~sure.core.ComparisonContext` for the
+        values currently being compared.
 
-        comp = self
-        while comp.parent:
-            X_keys.insert(0, comp.parent.key_X)
-            Y_keys.insert(0, comp.parent.key_Y)
-            comp = comp.parent
+        Contexts are memoized per key-path for the duration of
+        :meth:`~sure.core.DeepComparison.compare` only.
+        """
+        key = tuple(self._path)
+        context = self._contexts.get(key)
+        if context is None:
+            context = self._contexts[key] = ComparisonContext(list(key), self)
 
-        def get_keys(i):
-            if not i:
-                return ''
-
-            return '[{0}]'.format(']['.join(map(repr, i)))
-
-        class ComparisonContext:
-            current_X_keys = get_keys(X_keys)
-            current_Y_keys = get_keys(Y_keys)
-            parent = comp
-
-        return ComparisonContext()
+        return context
 
     def is_complex(self, obj):
-        return isinstance(obj, tuple(self.complex_cmp_funcs.keys()))
+        return isinstance(obj, COMPLEX_TYPES)
 
     def compare_complex_instances(self, X, Y):
-        return self.complex_cmp_funcs.get(type(X), self.compare_generic)(X, Y)
+        """returns ``True``, ``None`` or an
+        :class:`~sure.core.Explanation` when ``X`` and ``Y`` can be
+        compared right away or a 2-item tuple containing an iterator
+        of ``(key, value_X, value_Y)`` and a callable performing the
+        final comparison once all nested values are compared.
+        """
+        return self.complex_cmp_funcs.get(type(X), DeepComparison.compare_generic)(self, X, Y)
 
     def compare_generic(self, X, Y, msg_format='X{0} != Y{1}'):
-        c = self.get_context()
         if X == Y:
             return True
         else:
+            c = self.get_context()
             msg = msg_format.format(red(c.current_X_keys), green(c.current_Y_keys))
             return Explanation(msg)
 
     def compare_floats(self, X, Y):
-        c = self.get_context()
         if self.epsilon is None:
             return self.compare_generic(X, Y)
 
         if abs(X - Y) <= self.epsilon:
             return True
         else:
+            c = self.get_context()
             msg = 'X{0}±{1} != Y{2}±{3}'.format(
                 red(c.current_X_keys),
                 self.epsilon, green(c.current_Y_keys),
@@ -121,14 +156,13 @@ class DeepComparison(object):
             return Explanation(msg)
 
     def compare_ordered_dicts(self, X, Y):
-        c = self.get_context()
-
         x_keys = list(X.keys())
         y_keys = list(Y.keys())
 
         diff_x = list(set(x_keys).difference(set(y_keys)))
         diff_y = list(set(y_keys).difference(set(x_keys)))
         if diff_x:
+            c = self.get_context()
             msg = "X{0} has the key {1!r} whereas Y{2} does not".format(
                 red(c.current_X_keys),
                 repr(diff_x[0]),
@@ -137,6 +171,7 @@ class DeepComparison(object):
             return Explanation(msg)
 
         elif diff_y:
+            c = self.get_context()
             msg = "X{0} does not have the key {1!r} whereas Y{2} has it".format(
                 red(c.current_X_keys),
                 repr(diff_y[0]),
@@ -144,87 +179,61 @@ class DeepComparison(object):
             )
             return Explanation(msg)
 
-        elif X == Y:
+        elif shallow_equals(X, Y):
             return True
 
-        else:
-            for key_X in x_keys:
-                self.key_X = key_X
-                self.key_Y = key_X
-                value_X = X[key_X]
-                value_Y = Y[key_X]
-                instance = DeepComparison(
-                    value_X,
-                    value_Y,
-                    epsilon=self.epsilon,
-                    parent=self,
-                ).compare()
-                if isinstance(instance, Explanation):
-                    return instance
-
-        for i, j in zip(X.items(), Y.items()):
-            if i[0] != j[0]:
+        nested = zip(x_keys, map(X.__getitem__, x_keys), map(Y.__getitem__, x_keys))
+        return nested, lambda: self.compare_order_of_keys(X, Y)
+
+    def compare_order_of_keys(self, X, Y):
+        for i, j in zip(X, Y):
+            if i != j:
                 c = self.get_context()
                 msg = f"X{red(c.current_X_keys)} and Y{green(c.current_Y_keys)} appear have keys in different order"
                 return Explanation(msg)
         return True
 
     def compare_iterables(self, X, Y):
-        c = self.get_context()
         len_X, len_Y = map(len, (X, Y))
         if len_X > len_Y:
+            c = self.get_context()
             if len_Y == 0:
                 msg = f"X{red(c.current_X_keys)} has {len_X} items whereas Y{green(c.current_Y_keys)} is empty"
             else:
                 msg = f"X{red(c.current_X_keys)} has {len_X} items whereas Y{green(c.current_Y_keys)} has only {len_Y}"
             return Explanation(msg)
         elif len_X < len_Y:
+            c = self.get_context()
             if len_X == 0:
                 msg = f"Y{green(c.current_Y_keys)} has {len_Y} items whereas X{red(c.current_X_keys)} is empty"
             else:
                 msg = f"Y{green(c.current_Y_keys)} has {len_Y} items whereas X{red(c.current_X_keys)} has only {len_X}"
 
             return Explanation(msg)
-        elif X == Y:
+        elif shallow_equals(X, Y):
             return True
-        else:
-            for i, (value_X, value_Y) in enumerate(zip(X, Y)):
-                self.key_X = self.key_Y = i
-                instance = DeepComparison(
-                    value_X,
-                    value_Y,
-                    epsilon=self.epsilon,
-                    parent=self,
-                ).compare()
-                if isinstance(instance, Explanation):
-                    return instance
 
-    def compare(self):
-        X, Y = self.operands
+        return zip(count(), X, Y), lambda: None
 
+    def compare_operands(self, X, Y):
+        """compares ``X`` and ``Y`` at the current key-path, see
+        :meth:`~sure.core.DeepComparison.compare_complex_instances`
+        for possible return values.
+
+        :raises AssertionError: when ``X`` and ``Y`` are not complex
+          and differ.
+        """
         if isinstance(X, MockCallListType):
             X = list(X)
 
         if isinstance(Y, MockCallListType):
             Y = list(Y)
 
-        c = self.get_context()
-        if self.is_complex(X) and type(X) is type(Y):
+        if type(X) is type(Y) and self.is_complex(X):
             return self.compare_complex_instances(X, Y)
 
-        def safe_format_repr(string):
-            "Escape '{' and '}' in string for use with str.format()"
-            if not isinstance(string, (str, bytes)):
-                return string
-
-            orig_str_type = type(string)
-            if isinstance(string, bytes):
-                safe_repr = string.replace(b'{', b'{{').replace(b'}', b'}}')
-            else:
-                safe_repr = string.replace('{', '{{').replace('}', '}}')
-
-            # NOTE: str.replace() automatically converted the 'string' to 'unicode' in Python 2
-            return orig_str_type(safe_repr)
+        if X == Y:
+            return True
 
         # get safe representation for X and Y
         safe_X, safe_Y = safe_format_repr(X), safe_format_repr(Y)
@@ -239,11 +248,59 @@ class DeepComparison(object):
         exp = self.compare_generic(X, Y, **kws)
 
         if isinstance(exp, Explanation):
-            original_X, original_Y = c.parent.operands
+            original_X, original_Y = self.operands
             raise exp.as_assertion(original_X, original_Y)
 
         return exp
 
+    def compare(self):
+        """
+        :returns: ``True`` (or ``None``) when the operands are deeply
+          equal or an :class:`~sure.core.Explanation` of the first
+          difference found between complex values
+        :raises AssertionError: when a difference is found between
+          values which are not complex
+        """
+        path = self._path = []
+        frames = []
+        try:
+            result = self.compare_operands(*self.operands)
+            while True:
+                if isinstance(result, Explanation):
+                    return result
+
+                if isinstance(result, tuple):
+                    frames.append(result)
+                elif frames:
+                    path.pop()
+                else:
+                    return result
+
+                nested, finish = frames[-1]
+                for key, value_X, value_Y in nested:
+                    path.append(key)
+                    result = self.compare_operands(value_X, value_Y)
+                    break
+                else:
+                    frames.pop()
+                    result = finish()
+        finally:
+            # contexts reference this instance, releasing them avoids
+            # reference cycles which would keep the operands alive
+            self._contexts.clear()
+
+
+DeepComparison.complex_cmp_funcs.update({
+    float: DeepComparison.compare_floats,
+    dict: DeepComparison.compare_ordered_dicts,
+    list: DeepComparison.compare_iterables,
+    set: DeepComparison.compare_iterables,
+    frozenset: DeepComparison.compare_iterables,
+    tuple: DeepComparison.compare_iterables,
+    OrderedDict: DeepComparison.compare_ordered_dicts,
+})
+COMPLEX_TYPES = tuple(DeepComparison.complex_cmp_funcs.keys())
+
 
 def itemize_length(items):
     length = len(items)
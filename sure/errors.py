@@ -17,9 +17,12 @@
 import os
 import re
 import sys
-import inspect
+import types
+import pickle
+import linecache
 import traceback
 import warnings
+from sys import _getframe
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 from functools import reduce
@@ -39,22 +42,22 @@ def send_runtime_warning(message: str):
     warnings.showwarning(message, RuntimeWarning, filename=caller.filename, lineno=caller.lineno)
 
 
-def get_stack_frames():
-    return list(
-        filter(
-            lambda sf: not sf.filename.startswith(__sure_package_path__),
-            traceback.extract_stack(inspect.currentframe()),
-        )
-    )
-
-
 def xor(lhs, rhs):
     return lhs ^ rhs
 
 
-def get_most_recent_call_frame() -> traceback.FrameSummary:
-    stack = get_stack_frames()
-    return stack[-1]
+def get_most_recent_call_frame() -> types.FrameType:
+    """walks back the frames of the current stack and returns the
+    first one which does not belong to :mod:`sure`, without
+    formatting the whole stack in the process
+    """
+    caller = frame = _getframe(1)
+    while frame is not None:
+        if not frame.f_code.co_filename.startswith(__sure_package_path__):
+            return frame
+        frame = frame.f_back
+
+    return caller
 
 
 def exit_code(codeword: str) -> int:
@@ -146,6 +149,20 @@ class WrongUsageError(BaseSureError):
     """
 
 
+class ScenarioTimeout(BaseSureError):
+    """raised within a test which runs for longer than the amount of
+    seconds given to :func:`sure.timeout` or to the command-line
+    option ``--timeout``
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        super().__init__(f"timed out after {seconds} seconds")
+
+    def __reduce__(self):
+        return self.__class__, (self.seconds,)
+
+
 class SpecialSyntaxDisabledError(Exception):
     """raised when a :class:`AttributeError` occurs and the traceback
     contains evidence indicating that the probable cause is an attempt
@@ -156,23 +173,85 @@ class SpecialSyntaxDisabledError(Exception):
         super().__init__(f"{message}")
 
 
+class PortableException(Exception):
+    """stand-in for exceptions which cannot be transferred from worker
+    processes back to the :class:`~sure.runner.Runner`, such as
+    instances of classes defined within test modules. Preserves the
+    module and qualified name of the original exception class as well
+    as its message.
+    """
+
+    def __init__(self, module: str, qualname: str, message: str):
+        self.module = module
+        self.qualname = qualname
+        self.message = message
+        super().__init__(message)
+
+    def __reduce__(self):
+        return self.__class__, (self.module, self.qualname, self.message)
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"{self.qualname}({repr(self.message)})"
+
+
+class PortableAssertionError(PortableException, AssertionError):
+    """:class:`~sure.errors.PortableException` for failures"""
+
+
+def portable_exception(exc: Optional[BaseException]) -> Optional[BaseException]:
+    """returns the given exception if it is builtin or belongs to
+    :mod:`sure` and survives a round-trip through :mod:`pickle`, an
+    instance of :class:`~sure.errors.PortableException` otherwise.
+    """
+    if exc is None:
+        return None
+
+    cls = exc.__class__
+    if cls.__module__ == "builtins" or cls.__module__.split(".")[0] == "sure":
+        try:
+            return pickle.loads(pickle.dumps(exc))
+        except Exception:
+            pass
+
+    portable = isinstance(exc, AssertionError) and PortableAssertionError or PortableException
+    return portable(cls.__module__, cls.__qualname__, str(exc))
+
+
 class CallerLocation(object):
-    def __init__(self, name: str, filename: str, lineno: int, display_info: str):
+    def __init__(
+        self, name: str, filename: str, lineno: int, display_info: Optional[str] = None
+    ):
         self.name = name
         self.filename = filename
         self.lineno = lineno
-        self.display_info = display_info
+        self.__display_info__ = display_info
 
     @classmethod
     def most_recent(cls):
-        summary = get_most_recent_call_frame()
+        frame = get_most_recent_call_frame()
+        return cls.from_code(frame.f_code, frame.f_lineno)
+
+    @classmethod
+    def from_code(cls, code: types.CodeType, lineno: int):
         return cls(
-            name=summary.name,
-            filename=summary.filename,
-            lineno=summary.lineno,
-            display_info=summary.line,
+            name=code.co_name,
+            filename=code.co_filename,
+            lineno=lineno,
         )
 
+    @property
+    def display_info(self) -> str:
+        """the source line of the caller location, read lazily from
+        :mod:`linecache` since it is only needed when rendering
+        messages"""
+        if self.__display_info__ is None:
+            self.__display_info__ = linecache.getline(self.filename, self.lineno).strip()
+
+        return self.__display_info__
+
     @property
     def path_and_lineno(self):
         return collapse_path(f"{self.filename}:{self.lineno}")
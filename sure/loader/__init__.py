@@ -34,7 +34,8 @@ from sure.errors import (
     collapse_path,
     send_runtime_warning,
 )
-from .astutil import gather_class_definitions_from_module_path
+from .astutil import index_class_definitions_from_module_path
+from .manifest import get_discovery_manifest
 
 __MODULES__ = {}
 __MODULE_SPECS__ = {}
@@ -124,9 +125,8 @@ def get_type_definition_filename_and_firstlineno(type_object: type) -> Tuple[Pat
         return f"<{module_name}>", -1
 
     path = Path(module.__file__)
-    called_location = CallerLocation.most_recent()
-    classes = gather_class_definitions_from_module_path(
-        path, nearest_line=called_location.lineno
+    classes = index_class_definitions_from_module_path(
+        path, fallback=get_discovery_manifest().class_definitions
     )
     __TEST_CLASSES__[path] = classes
     lineno, base_class_names = classes[name]
@@ -157,8 +157,37 @@ class loader(object):
                     f"{path} does not match pattern {repr(glob_pattern)}"
                 )
 
+        for path in cls.find_python_paths(path, glob_pattern, excludes):
+            modules.extend(cls.load_python_path(path))
+
+        get_discovery_manifest().save()
+        return sorted(modules, key=lambda mod: mod.__file__)
+
+    @classmethod
+    def find_python_paths(
+        cls,
+        path: Union[str, Path],
+        glob_pattern: str = "***.py",
+        excludes: Optional[List[Union[str, Path]]] = None,
+    ) -> List[Path]:
+        """finds the paths of python files matching ``glob_pattern``
+        without importing them.
+
+        Directories whose modification time did not change since the
+        last run are not listed again, see
+        :class:`~sure.loader.manifest.DiscoveryManifest`.
+
+        :returns: sorted :class:`list` of :class:`~pathlib.Path`
+        """
+        excludes = excludes or []
+        path = Path(path)
+        if path.is_file():
+            return fnmatch(path, glob_pattern) and [path] or []
+
+        paths = []
         base_path = Path(path).expanduser().absolute()
-        for directory, _, files in os.walk(base_path):
+        manifest = get_discovery_manifest()
+        for directory, _, files in manifest.walk(base_path):
             if any(
                 [path in directory or fnmatch(directory, path) for path in excludes]
             ):
@@ -170,10 +199,10 @@ class loader(object):
                     continue
 
                 if fnmatch(path, glob_pattern):
-                    path = directory.joinpath(path)
-                    modules.extend(cls.load_python_path(path))
+                    paths.append(directory.joinpath(path))
 
-        return sorted(modules, key=lambda mod: mod.__file__)
+        manifest.save()
+        return sorted(paths, key=str)
 
     @classmethod
     def load_python_path(cls, path: Union[str, Path]) -> List[types.ModuleType]:
@@ -213,8 +242,8 @@ class loader(object):
         __MODULES__[fqdn] = module
         __MODULE_SPECS__[module] = spec
         cdfs = {}
-        for name, metadata in gather_class_definitions_from_module_path(
-            path, None
+        for name, metadata in index_class_definitions_from_module_path(
+            path, fallback=get_discovery_manifest().class_definitions
         ).items():
             lineno, bases = metadata
             if any(filter(name_appears_to_indicate_test, [name] + list(bases))):
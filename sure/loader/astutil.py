@@ -17,10 +17,12 @@
 """astutils (Abstract Syntax-Tree Utils)"""
 import ast
 
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 from sure.errors import send_runtime_warning
 
+__CLASS_DEFINITIONS__ = {}
+
 
 def is_classdef(node: ast.stmt) -> bool:
     """
@@ -86,3 +88,68 @@ def gather_class_definitions_from_module_path(
         node = ast.parse(f.read())
 
     return gather_class_definitions_node(node, {}, nearest_line=nearest_line)
+
+
+def gather_imports_from_module_path(path: Path) -> List[Tuple[int, str, Tuple[str]]]:
+    """parses the Python file at the given path and returns a list of
+    3-item tuples indicating the relative level, the name of the
+    imported module and a tuple of names imported from it for each
+    ``import`` statement, at any depth, of the given file.
+
+    For example ``from ..base import Model`` yields ``(2, "base", ("Model",))``
+    whereas ``import os.path`` yields ``(0, "os.path", ())``
+    """
+    path = Path(path)
+
+    if path.is_symlink() and not path.resolve().exists():  # avoid loading broken symlinks
+        send_runtime_warning(f"parsing skipped of irregular file `{path.absolute()}'")
+        return []
+
+    with path.open() as f:
+        node = ast.parse(f.read())
+
+    imports = []
+    for subnode in ast.walk(node):
+        if isinstance(subnode, ast.Import):
+            imports.extend((0, alias.name, ()) for alias in subnode.names)
+        elif isinstance(subnode, ast.ImportFrom):
+            names = tuple(alias.name for alias in subnode.names if alias.name != "*")
+            imports.append((subnode.level, subnode.module or "", names))
+
+    return imports
+
+
+def index_class_definitions_from_module_path(
+    path: Path,
+    fallback: Optional[
+        Callable[[Path, Tuple[int, int]], Dict[str, Tuple[int, Tuple[str]]]]
+    ] = None,
+) -> Dict[str, Tuple[int, Tuple[str]]]:
+    """cached version of
+    :func:`~sure.loader.astutil.gather_class_definitions_from_module_path`
+    which parses the given path only once per modification time and
+    size of its file.
+
+    :param fallback: optional callable which receives the path and a
+      2-item tuple with the modification time in nanoseconds and size
+      of the file, called in place of
+      :func:`~sure.loader.astutil.gather_class_definitions_from_module_path`
+      when the path is not yet indexed.
+    :returns: a copy of the cached mapping, so that callers may mutate it
+    """
+    path = Path(path).absolute()
+    try:
+        stat = path.stat()
+    except OSError:
+        return gather_class_definitions_from_module_path(path)
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached_key, classes = __CLASS_DEFINITIONS__.get(path, (None, None))
+    if cached_key != key:
+        if fallback is None:
+            classes = gather_class_definitions_from_module_path(path)
+        else:
+            classes = fallback(path, key)
+        __CLASS_DEFINITIONS__[path] = (key, classes)
+
+    return dict(classes)
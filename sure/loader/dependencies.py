@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""static import graph of python files used to find which test
+modules are affected by changes of source files without importing
+them.
+
+Imports of each file are recorded in ``dependencies.json`` within
+the cache directory of :mod:`sure`, see :mod:`sure.cache`, and
+only files whose modification time or size changed are parsed again.
+"""
+import os
+import sys
+import subprocess
+
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Union
+
+from sure.cache import JSONCache
+from .astutil import gather_imports_from_module_path
+
+
+__GRAPH__ = {}
+
+
+def get_import_roots() -> List[str]:
+    """returns the directories of :data:`sys.path` which are within
+    the current working directory, followed by the current working
+    directory itself, such that imports of third-party packages and of
+    the standard library are not followed"""
+    cwd = os.getcwd()
+    roots = []
+    for path in sys.path + [cwd]:
+        path = os.path.abspath(path or cwd)
+        if path not in roots and os.path.isdir(path) and "site-packages" not in path and (
+            path == cwd or path.startswith(cwd + os.sep)
+        ):
+            roots.append(path)
+
+    return roots
+
+
+def resolve_module_parts(directory: Path, parts: Iterable[str]) -> List[str]:
+    """returns the paths of the files executed when importing the
+    dotted ``parts`` from the given directory, i.e.: the ``__init__.py``
+    of each package followed by the path of the innermost module"""
+    found = []
+    for part in parts:
+        package = directory.joinpath(part)
+        if package.joinpath("__init__.py").is_file():
+            found.append(str(package.joinpath("__init__.py")))
+            directory = package
+        elif directory.joinpath(f"{part}.py").is_file():
+            found.append(str(directory.joinpath(f"{part}.py")))
+            break
+        elif package.is_dir():
+            directory = package
+        else:
+            break
+
+    return found
+
+
+class DependencyGraph(object):
+    """Records the paths of python files imported by each python file
+    keyed by their absolute paths along with their modification time
+    and size."""
+
+    def __init__(
+        self,
+        roots: Optional[List[str]] = None,
+        cache: Optional[JSONCache] = None,
+    ):
+        self.cache = cache or JSONCache("dependencies")
+        self.roots = list(roots or get_import_roots())
+        data = self.cache.load()
+        self.files = data.get("roots") == self.roots and data.get("files") or {}
+        self.dirty = False
+
+    def __repr__(self):
+        return f"<DependencyGraph {self.cache.path}>"
+
+    def resolve_imports(self, path: Union[str, Path]) -> List[str]:
+        """parses the given file and returns the sorted paths of the
+        python files within :attr:`roots` which it imports"""
+        path = Path(path)
+        dependencies = set()
+        for level, module, names in gather_imports_from_module_path(path):
+            parts = module and module.split(".") or []
+            if level:
+                directory = path.parent
+                for _ in range(level - 1):
+                    directory = directory.parent
+                init = directory.joinpath("__init__.py")
+                if init.is_file():
+                    dependencies.add(str(init))
+            else:
+                directory = None
+                for root in map(Path, self.roots):
+                    if root.joinpath(parts[0]).is_dir() or root.joinpath(f"{parts[0]}.py").is_file():
+                        directory = root
+                        break
+                if directory is None:
+                    continue
+
+            dependencies.update(resolve_module_parts(directory, parts))
+            for name in names:
+                # ``from package import module``
+                dependencies.update(resolve_module_parts(directory, parts + [name]))
+
+        dependencies.discard(str(path))
+        return sorted(dependencies)
+
+    def dependencies_of(self, path: Union[str, Path]) -> List[str]:
+        """returns the paths imported by the given file, parsing it
+        only when its modification time or size has changed since it
+        was recorded"""
+        path = str(Path(path).absolute())
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return []
+
+        record = self.files.get(path)
+        if record and record["mtime_ns"] == stat.st_mtime_ns and record["size"] == stat.st_size:
+            return record["imports"]
+
+        try:
+            imports = self.resolve_imports(path)
+        except (SyntaxError, ValueError, UnicodeDecodeError):
+            imports = []
+
+        self.files[path] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "imports": imports,
+        }
+        self.dirty = True
+        return imports
+
+    def affected(
+        self,
+        paths: Iterable[Union[str, Path]],
+        is_changed: Callable[[str], bool],
+    ) -> List[Union[str, Path]]:
+        """returns the given paths which are changed or which
+        transitively import any changed file"""
+        affected = {}
+
+        def is_affected(path: str) -> bool:
+            visited = {path}
+            pending = [path]
+            while pending:
+                current = pending.pop()
+                if affected.get(current) or is_changed(current):
+                    return True
+                for dependency in self.dependencies_of(current):
+                    if dependency not in visited:
+                        visited.add(dependency)
+                        pending.append(dependency)
+
+            # nothing reachable from ``path`` changed, neither did anything reachable from the visited files
+            for current in visited:
+                affected[current] = False
+
+            return False
+
+        result = []
+        for path in paths:
+            absolute = str(Path(path).absolute())
+            if affected.get(absolute) is None:
+                affected[absolute] = is_affected(absolute)
+            if affected[absolute]:
+                result.append(path)
+
+        return result
+
+    def save(self):
+        """persists the graph if anything changed since it was loaded"""
+        if not self.dirty:
+            return
+
+        for path in [p for p in self.files if not os.path.exists(p)]:
+            del self.files[path]
+
+        self.cache.save({"roots": self.roots, "files": self.files})
+        self.dirty = False
+
+
+def git(*args: str) -> str:
+    try:
+        process = subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=False
+        )
+    except OSError as e:
+        raise ValueError(f"could not run git: {e}")
+
+    if process.returncode != 0:
+        raise ValueError(process.stderr.strip() or f"git {' '.join(args)} failed")
+
+    return process.stdout
+
+
+def get_dependency_graph() -> DependencyGraph:
+    """returns the :class:`~sure.loader.dependencies.DependencyGraph`
+    of the current cache directory and import roots, loading it once
+    per process"""
+    cache = JSONCache("dependencies")
+    roots = get_import_roots()
+    key = (cache.path, tuple(roots))
+    graph = __GRAPH__.get(key)
+    if graph is None:
+        graph = __GRAPH__[key] = DependencyGraph(roots, cache)
+
+    return graph
+
+
+def get_changed_files(since: Union[str, Path]) -> Callable[[str], bool]:
+    """returns a callable which indicates whether the given absolute
+    path has changed ``since`` either:
+
+    - the modification time of an existing file, e.g.: a file touched at the end of the last test run.
+    - a git ref, in which case every file which differs between the ref and the working tree, as well as untracked files, are considered changed.
+
+    :raises ValueError: when ``since`` is neither an existing file nor a valid git ref
+    """
+    if os.path.isfile(since):
+        mtime_ns = os.stat(since).st_mtime_ns
+
+        def is_changed(path: str) -> bool:
+            try:
+                return os.stat(path).st_mtime_ns > mtime_ns
+            except OSError:
+                return False
+
+        return is_changed
+
+    toplevel = Path(git("rev-parse", "--show-toplevel").strip())
+    names = git("diff", "--name-only", str(since), "--").splitlines()
+    names.extend(git("ls-files", "--others", "--exclude-standard", "--full-name", str(toplevel)).splitlines())
+    changed = set(os.path.realpath(toplevel.joinpath(name)) for name in names if name)
+    return lambda path: os.path.realpath(path) in changed
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""discovery manifest persisted across test runs such that only
+changed files are parsed and unchanged directories are not listed.
+
+The manifest is stored in ``discovery.json`` within the cache
+directory of :mod:`sure`, see :mod:`sure.cache`.
+"""
+import os
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from sure.cache import JSONCache
+from .astutil import gather_class_definitions_from_module_path
+
+
+class DiscoveryManifest(object):
+    """Records the listing of directories and the class definitions
+    of python files keyed by their absolute paths along with their
+    modification time and size."""
+
+    def __init__(self, cache: Optional[JSONCache] = None):
+        self.cache = cache or JSONCache("discovery")
+        data = self.cache.load()
+        self.files = data.get("files") or {}
+        self.directories = data.get("directories") or {}
+        self.dirty = False
+
+    def __repr__(self):
+        return f"<DiscoveryManifest {self.cache.path}>"
+
+    def list_directory(self, directory: Union[str, Path]) -> Tuple[List[str], List[str]]:
+        """returns a 2-item tuple with the names of subdirectories
+        and files of the given directory, listing it only when its
+        modification time has changed since it was recorded.
+        """
+        directory = str(directory)
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return [], []
+
+        record = self.directories.get(directory)
+        if record and record["mtime_ns"] == mtime_ns:
+            return record["directories"], record["files"]
+
+        directories = []
+        files = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_directory = entry.is_dir()
+                    except OSError:
+                        is_directory = False
+
+                    if not is_directory:
+                        files.append(entry.name)
+                    elif not entry.is_symlink():
+                        directories.append(entry.name)
+        except OSError:
+            return [], []
+
+        directories.sort()
+        files.sort()
+        self.directories[directory] = {
+            "mtime_ns": mtime_ns,
+            "directories": directories,
+            "files": files,
+        }
+        self.dirty = True
+        return directories, files
+
+    def walk(self, path: Union[str, Path]) -> Iterable[Tuple[str, List[str], List[str]]]:
+        """top-down equivalent of :func:`os.walk` backed by
+        :meth:`~sure.loader.manifest.DiscoveryManifest.list_directory`"""
+        pending = [str(path)]
+        while pending:
+            directory = pending.pop()
+            directories, files = self.list_directory(directory)
+            yield directory, directories, files
+            pending.extend(
+                os.path.join(directory, name) for name in reversed(directories)
+            )
+
+    def class_definitions(
+        self, path: Path, key: Tuple[int, int]
+    ) -> Dict[str, Tuple[int, Tuple[str]]]:
+        """returns the class definitions recorded for the given path
+        if its modification time and size match the given ``key``,
+        parses the file and records its class definitions otherwise.
+
+        Meant as ``fallback`` of
+        :func:`~sure.loader.astutil.index_class_definitions_from_module_path`
+        """
+        mtime_ns, size = key
+        record = self.files.get(str(path))
+        if record and record["mtime_ns"] == mtime_ns and record["size"] == size:
+            return dict(
+                (name, (lineno, tuple(bases)))
+                for name, (lineno, bases) in record["classes"].items()
+            )
+
+        classes = gather_class_definitions_from_module_path(path)
+        self.files[str(path)] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "classes": classes,
+        }
+        self.dirty = True
+        return classes
+
+    def save(self):
+        """persists the manifest if anything changed since it was loaded"""
+        if not self.dirty:
+            return
+
+        for path in [p for p in self.files if not os.path.exists(p)]:
+            del self.files[path]
+
+        for path in [p for p in self.directories if not os.path.isdir(p)]:
+            del self.directories[path]
+
+        self.cache.save({"files": self.files, "directories": self.directories})
+        self.dirty = False
+
+
+__MANIFEST__ = {}
+
+
+def get_discovery_manifest() -> DiscoveryManifest:
+    """returns the :class:`~sure.loader.manifest.DiscoveryManifest` of
+    the current cache directory, loading it once per process"""
+    cache = JSONCache("discovery")
+    manifest = __MANIFEST__.get(cache.path)
+    if manifest is None:
+        manifest = __MANIFEST__[cache.path] = DiscoveryManifest(cache)
+
+    return manifest
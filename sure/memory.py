@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""":mod:`tracemalloc` instrumentation of each test, see the
+command-line option ``--trace-memory``, as well as of callables, see
+:meth:`sure.AssertionBuilder.allocate_less_than`"""
+
+import tracemalloc
+
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from sure.errors import WrongUsageError
+
+BYTES = {
+    "b": 1,
+    "kb": 1024,
+    "mb": 1024 * 1024,
+    "gb": 1024 * 1024 * 1024,
+}
+
+
+def parse_size(**units: Union[int, float]) -> int:
+    """returns the amount of bytes described by a single
+    keyword-argument whose name is one of the keys of
+    :data:`~sure.memory.BYTES`, e.g.: ``parse_size(mb=5)``
+    """
+    if len(units) != 1 or not set(units).issubset(BYTES):
+        raise WrongUsageError(
+            f"expected a single keyword-argument among {', '.join(BYTES)}, e.g.: mb=5 "
+            f"but got {', '.join(units) or 'none'}"
+        )
+
+    ((unit, value),) = units.items()
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+        raise WrongUsageError(f"{unit}={repr(value)} is not a positive number")
+
+    return int(value * BYTES[unit])
+
+
+def format_bytes(amount: Union[int, float]) -> str:
+    """returns a human-readable representation of the given amount of
+    bytes in the largest unit wherein it is at least 1"""
+    for unit in ("gb", "mb", "kb"):
+        if abs(amount) >= BYTES[unit]:
+            return f"{amount / BYTES[unit]:.1f}{unit.upper()}"
+
+    return f"{amount}B"
+
+
+# absolute peaks of memory allocated within each instance of
+# :class:`~sure.memory.MemoryTrace` currently entered, outermost first,
+# such that nested instances, which reset the peak of
+# :mod:`tracemalloc`, do not hide the peaks of enclosing ones
+entered_peaks = []
+
+
+class MemoryTrace(object):
+    """:term:`python:context manager` which measures, through
+    :mod:`tracemalloc`, the peak of memory allocated by the code
+    running within it as well as the memory it retained once done.
+    Statistics accumulate across each time it is entered.
+
+    Starts tracing memory allocations when not yet tracing, see
+    :func:`~sure.memory.stop_tracing`.
+
+    The peak of an instance entered within another, such as that of
+    :meth:`sure.AssertionBuilder.allocate_less_than` within a test
+    running with ``--trace-memory``, counts towards the peak of the
+    enclosing instance as well.
+
+    .. note:: :mod:`tracemalloc` traces the whole process, therefore
+       the memory of tests running concurrently within threads is
+       attributed to one another.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.tracing = False
+        self.started = 0
+        self.peak = 0
+        self.retained = 0
+
+    def __repr__(self):
+        return f"<MemoryTrace peak={format_bytes(self.peak)} retained={format_bytes(self.retained)}>"
+
+    def __enter__(self):
+        if self.enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            if entered_peaks:
+                entered_peaks[-1] = max(entered_peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self.started, _ = tracemalloc.get_traced_memory()
+            entered_peaks.append(self.started)
+            self.tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, entered_peaks.pop())
+            if entered_peaks:
+                entered_peaks[-1] = max(entered_peaks[-1], peak)
+            self.peak = max(self.peak, self.retained + peak - self.started)
+            self.retained += current - self.started
+            self.tracing = False
+
+    @property
+    def traced(self) -> bool:
+        return self.enabled and not self.tracing and (self.peak > 0 or self.retained != 0)
+
+
+def measure_allocations(
+    function: Callable,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> MemoryTrace:
+    """calls the given function and returns the
+    :class:`~sure.memory.MemoryTrace` of that call, tracing memory
+    allocations only for the duration of the call unless already
+    tracing"""
+    already_tracing = tracemalloc.is_tracing()
+    try:
+        with MemoryTrace() as trace:
+            function(*args, **(kwargs or {}))
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    return trace
+
+
+def stop_tracing():
+    """stops tracing memory allocations started by
+    :class:`~sure.memory.MemoryTrace`"""
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""":mod:`cProfile` instrumentation of each test, see the
+command-line option ``--profile``"""
+
+import pstats
+import cProfile
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from sure.errors import collapse_path
+
+# modules whose functions wrap every test and are therefore omitted
+# from :meth:`~sure.profiling.ScenarioProfile.top`
+INSTRUMENTATION = tuple(
+    str(Path(__file__).parent.joinpath(name)) for name in ("profiling.py", "memory.py", "runtime.py")
+)
+
+
+class ScenarioProfile(object):
+    """:term:`python:context manager` which profiles the code running
+    within it unless disabled, statistics accumulate across each time
+    it is entered. Once exited it retains only the
+    :mod:`pstats`-compatible statistics such that it can travel from
+    worker processes back to the :class:`~sure.runner.Runner`.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.profiler: Optional[cProfile.Profile] = None
+        self.stats: Dict[tuple, tuple] = {}
+
+    def __repr__(self):
+        return f"<ScenarioProfile {len(self.stats)} functions>"
+
+    def __enter__(self):
+        if self.enabled:
+            self.profiler = cProfile.Profile()
+            try:
+                self.profiler.enable()
+            except ValueError:
+                # another profiler is already active, e.g.: within
+                # another thread running scenarios concurrently
+                self.profiler = None
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.create_stats()
+            for function, timings in self.profiler.stats.items():
+                if function[2] == "<method 'disable' of '_lsprof.Profiler' objects>":
+                    continue
+                if function in self.stats:
+                    timings = pstats.add_func_stats(self.stats[function], timings)
+                self.stats[function] = timings
+            self.profiler = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["profiler"] = None
+        return state
+
+    def create_stats(self):
+        """allows instances to be given to :class:`pstats.Stats`"""
+
+    def clone(self) -> "ScenarioProfile":
+        """returns a copy of this profile, meant to be given to
+        :class:`pstats.Stats` which discards the statistics of the
+        profiles given to it"""
+        clone = self.__class__(enabled=False)
+        clone.stats = dict(self.stats)
+        return clone
+
+    def top(self, amount: int) -> List[Tuple[str, int, float]]:
+        """returns the given amount of functions with the highest
+        internal time as 3-item tuples: location, calls, seconds"""
+        ranked = sorted(
+            (item for item in self.stats.items() if item[0][0] not in INSTRUMENTATION),
+            key=lambda item: item[1][2],
+            reverse=True,
+        )
+        return [
+            (format_function(function), timings[1], timings[2])
+            for function, timings in ranked[:amount]
+        ]
+
+    @property
+    def profiled(self) -> bool:
+        return len(self.stats) > 0
+
+
+def format_function(function: Tuple[str, int, str]) -> str:
+    filename, line, name = function
+    if filename == "~" and line == 0:
+        return name
+
+    return f"{collapse_path(filename)}:{line}({name})"
+
+
+def dump_profiles(profiles: Iterable[ScenarioProfile], path: Union[str, Path]) -> Optional[pstats.Stats]:
+    """aggregates the given profiles into a single file readable by
+    :mod:`pstats` and returns the aggregated :class:`pstats.Stats` or
+    ``None`` when none of the given profiles contains statistics"""
+    profiles = [profile for profile in profiles if profile.profiled]
+    if not profiles:
+        return None
+
+    stats = pstats.Stats(*(profile.clone() for profile in profiles))
+    stats.dump_stats(str(path))
+    return stats
@@ -14,12 +14,64 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import sys
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, TextIO, Union
 from sure.meta import MetaReporter, get_reporter, gather_reporter_names
 from sure.types import Runner, Feature, FeatureResult, RuntimeContext
 
 
+# maximum amount of seconds during which the output of reporters
+# which write into a :class:`~sure.reporter.ReportFile` remains
+# buffered, such that partial results survive an abrupt interruption
+FLUSH_INTERVAL = 1.0
+
+
+def open_report_file(path: Optional[Union[str, int, Path]]) -> TextIO:
+    """opens the file given to the command-line option
+    ``--report-file`` for writing, creating its parent directories as
+    needed. Integers, as well as strings of digits, are treated as
+    file descriptors already open, e.g.: ``--report-file 3``. Returns
+    :data:`sys.stdout` when no path is given.
+    """
+    if path is None or path == "":
+        return sys.stdout
+
+    if isinstance(path, int) or str(path).isdigit():
+        return os.fdopen(int(path), "w", encoding="utf-8", closefd=False)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.open("w", encoding="utf-8")
+
+
+class ReportFile(object):
+    """Buffered writer of machine-readable reports into the file given
+    to :func:`~sure.reporter.open_report_file`, flushed at least
+    every :data:`~sure.reporter.FLUSH_INTERVAL` seconds while written.
+    """
+
+    def __init__(self, path: Optional[Union[str, int, Path]]):
+        self.stream = open_report_file(path)
+        self.last_flush = time.monotonic()
+
+    def write(self, data: str):
+        self.stream.write(data)
+        if time.monotonic() - self.last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        self.stream.flush()
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+
 class Reporter(object, metaclass=MetaReporter):
     """Base class for reporters.
 
@@ -47,8 +99,12 @@ class Reporter(object, metaclass=MetaReporter):
 
     def __init__(self, runner: Runner, *args, **kw):
         self.runner = runner
-        self.tests_started = []
-        self.tests_finished = []
+        # scenarios, or their locations, are kept within sets, which
+        # hash them by identity, such that checking whether they were
+        # already reported takes constant time regardless of the size
+        # of the test suite
+        self.tests_started = set()
+        self.tests_finished = set()
         self.successes = []
         self.failures = []
         self.errors = []
@@ -215,6 +271,22 @@ class Reporter(object, metaclass=MetaReporter):
         """
         raise NotImplementedError
 
+    def on_benchmark(self, scenario, result):
+        """Called when a benchmark, that is: a function or method
+        whose name starts with ``bench``, has been measured. Optional,
+        the statistics are available through
+        :attr:`~sure.runtime.ScenarioResult.benchmark`, an instance
+        of :class:`~sure.benchmark.Benchmark`.
+        """
+
+    def on_timeout(self, scenario_result, error):
+        """Called when a scenario runs for longer than allowed by
+        :func:`sure.timeout` or by the command-line option
+        ``--timeout``. Optional, defaults to
+        :meth:`~sure.reporter.Reporter.on_error`.
+        """
+        return self.on_error(scenario_result, error)
+
     def on_finish(self, context: RuntimeContext):
         """Called as soon as `sure' finishes running.
 
@@ -283,3 +355,61 @@ class Reporter(object, metaclass=MetaReporter):
            reporter = Reporter.from_name_and_runner('feature', runner)
         """
         return cls.from_name(name)(runner)
+
+
+class EventRecorder(Reporter):
+    """Reporter which merely records every event it receives such that
+    they can later be replayed, in the very same order, into another
+    :class:`~sure.reporter.Reporter` via
+    :meth:`~sure.reporter.EventRecorder.replay`.
+
+    Primarily designed for running tests outside of the main flow of
+    execution, e.g.: within worker processes, whilst keeping the
+    reporter callbacks serialized.
+    """
+
+    def initialize(self, *args, **kw):
+        self.events = []
+
+    def record(self, name: str, *args):
+        self.events.append((name, args))
+
+    def replay(self, reporter: Reporter):
+        for name, args in self.events:
+            getattr(reporter, name)(*args)
+
+    def on_start(self):
+        self.record("on_start")
+
+    def on_feature(self, feature: Feature):
+        self.record("on_feature", feature)
+
+    def on_feature_done(self, feature: Feature, result: FeatureResult):
+        self.record("on_feature_done", feature, result)
+
+    def on_scenario(self, scenario):
+        self.record("on_scenario", scenario)
+
+    def on_scenario_done(self, scenario, result):
+        self.record("on_scenario_done", scenario, result)
+
+    def on_failure(self, scenario_result, error):
+        self.record("on_failure", scenario_result, error)
+
+    def on_success(self, scenario):
+        self.record("on_success", scenario)
+
+    def on_internal_runtime_error(self, context, exception: Exception):
+        self.record("on_internal_runtime_error", context, exception)
+
+    def on_error(self, scenario_result, error):
+        self.record("on_error", scenario_result, error)
+
+    def on_timeout(self, scenario_result, error):
+        self.record("on_timeout", scenario_result, error)
+
+    def on_benchmark(self, scenario, result):
+        self.record("on_benchmark", scenario, result)
+
+    def on_finish(self, context: RuntimeContext):
+        self.record("on_finish", context)
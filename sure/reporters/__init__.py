@@ -18,3 +18,5 @@
 from ..meta import get_reporter, gather_reporter_names
 from .feature import FeatureReporter
 from .test import TestReporter
+from .junit import JUnitReporter
+from .jsonl import JSONLinesReporter
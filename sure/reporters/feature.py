@@ -15,15 +15,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import sys
-from couleur import Shell
-from typing import Union
+from typing import List, Tuple, Union
 from sure.errors import (
     ImmediateFailure,
     InternalRuntimeError,
     SpecialSyntaxDisabledError,
     BaseSureError,
+    collapse_path,
 )
 from sure.reporter import Reporter
+from sure.terminal import BufferedShell
+from sure.memory import BYTES, format_bytes
 from sure.runtime import (
     Feature,
     FeatureResult,
@@ -33,12 +35,37 @@ from sure.runtime import (
     TestLocation,
     ErrorStack,
     RuntimeContext,
+    RuntimeRole,
 )
 
 
 checkmark = "✓"
 ballot = "✗"
 
+# upper bounds, in seconds, of the buckets of the histogram of
+# durations displayed along with the slowest tests, see ``--durations``
+DURATION_BUCKETS = (
+    ("< 1ms", 0.001),
+    ("< 10ms", 0.01),
+    ("< 100ms", 0.1),
+    ("< 1s", 1.0),
+    ("< 10s", 10.0),
+    (">= 10s", float("inf")),
+)
+
+
+def duration_histogram(durations: List[float]) -> List[Tuple[str, int]]:
+    """returns the amount of the given durations within each of the
+    :data:`~sure.reporters.feature.DURATION_BUCKETS`"""
+    counts = [0] * len(DURATION_BUCKETS)
+    for duration in durations:
+        for index, (label, bound) in enumerate(DURATION_BUCKETS):
+            if duration < bound:
+                counts[index] += 1
+                break
+
+    return [(label, count) for (label, bound), count in zip(DURATION_BUCKETS, counts)]
+
 
 class FeatureReporter(Reporter):
     """Test Reporter inspired by the output of Behaviour-driven-development tools *du jour*"""
@@ -46,9 +73,15 @@ class FeatureReporter(Reporter):
     name = "feature"
 
     def initialize(self, *args, **kw):
-        self.sh = Shell()
-        self.reported_errors = []
+        self.sh = BufferedShell()
+        # hashes of the stacks of errors already reported
+        self.reported_errors = set()
         self.indentation = 0
+        self.profiled = []
+        self.traced = []
+        self.scenario_durations = []
+        self.feature_durations = []
+        self.last_result = None
 
     def on_start(self):
         self.sh.reset("\n")
@@ -63,14 +96,21 @@ class FeatureReporter(Reporter):
         self.sh.reset(" ")
 
     def on_feature_done(self, feature: Feature, result: FeatureResult):
+        if getattr(feature, "path", None):
+            self.feature_durations.append(
+                (result.duration, feature.title, collapse_path(feature.path))
+            )
         self.sh.reset("\n\n")
         self.indentation = 0
 
     def on_scenario(self, scenario: Scenario):
         test = scenario.location
+        # scenarios are about to run and whatever they print straight
+        # into :data:`sys.stdout` must come after the text so far
         if test in self.tests_started:
+            self.sh.flush()
             return
-        self.tests_started.append(test)
+        self.tests_started.add(test)
         self.indentation += 2
         self.sh.reset(" " * self.indentation)
         if test.description:
@@ -81,10 +121,17 @@ class FeatureReporter(Reporter):
             self.sh.green(f"\n{' ' * self.indentation} Test: ")
             self.sh.normal(test.name)
         self.sh.reset(" ")
+        self.sh.flush()
 
     def on_scenario_done(
         self, scenario: Scenario, result: Union[ScenarioResult, ScenarioResultSet]
     ):
+        # results of setups and teardowns are reported as well as
+        # results of tests within classes with multiple tests, which
+        # are reported more than once in a row
+        if result.role == RuntimeRole.Unit and result is not self.last_result:
+            self.record(result)
+        self.last_result = result
         if scenario in self.tests_finished:
             return
         self.indentation -= 2
@@ -97,10 +144,25 @@ class FeatureReporter(Reporter):
             self.sh.reset("")
         elif result.is_failure:
             pass  # handled by :meth:`~sure.reporters.feature.FeatureReporter.on_failure`
+        elif result.is_timeout:
+            pass  # handled by :meth:`~sure.reporters.feature.FeatureReporter.on_timeout`
         elif result.is_error:
             pass  # handled by :meth:`~sure.reporters.feature.FeatureReporter.on_error`
 
-        self.tests_finished.append(scenario)
+        self.tests_finished.add(scenario)
+
+    def record(self, result: ScenarioResult):
+        """keeps track of the durations, profiles and memory traces
+        of the given result of a test"""
+        if result.profile is not None:
+            self.profiled.append(result)
+        if result.memory is not None:
+            self.traced.append(result)
+        location = getattr(result, "location", None)
+        if location is not None:
+            self.scenario_durations.append(
+                (result.duration, location.name, location.path_and_lineno)
+            )
 
     def on_failure(self, test: Scenario, result: ScenarioResult):
         self.failures.append(test)
@@ -130,7 +192,7 @@ class FeatureReporter(Reporter):
 
     def on_error(self, test: Scenario, result: ScenarioResult):
         fullstack = result.stack.full()
-        if fullstack in self.reported_errors:
+        if hash(fullstack) in self.reported_errors:
             # avoid reporting the same error twice
             return
 
@@ -146,7 +208,85 @@ class FeatureReporter(Reporter):
         self.indentation -= 2
         self.errors.append(test)
         self.failures.append(test)
-        self.reported_errors.append(fullstack)
+        self.reported_errors.add(hash(fullstack))
+
+    def on_benchmark(self, test: Scenario, result: ScenarioResult):
+        self.sh.reset("\n")
+        self.sh.reset(" " * (self.indentation + 2))
+        self.sh.bold_blue(f"Benchmark {result.benchmark.name}: ")
+        self.sh.normal(result.benchmark.summary())
+
+    def on_timeout(self, test: Scenario, result: ScenarioResult):
+        self.indentation += 2
+        self.sh.reset("\n")
+        self.sh.bold_red(f"Timeout: {result.error}\n")
+        self.sh.reset(" " * self.indentation)
+        self.sh.bold_red(f"{result.location.path_and_lineno}\n")
+        self.indentation -= 2
+        self.errors.append(test)
+        self.failures.append(test)
+
+    def report_profiles(self, context: RuntimeContext):
+        top = context.options.profile_top
+        if not self.profiled or not top:
+            return
+
+        self.sh.bold_blue(f"\nTop {top} functions by internal time per test ")
+        self.sh.normal(f"(aggregated into {context.options.profile})\n")
+        for result in self.profiled:
+            self.sh.bold_white(f"\n  {result.location.name} ")
+            self.sh.bold_black(f"{result.location.path_and_lineno}\n")
+            for function, calls, seconds in result.profile.top(top):
+                self.sh.yellow(f"    {seconds:10.6f}s ")
+                self.sh.normal(f"{calls:>8} calls  {function}\n")
+
+        self.sh.reset("\n")
+
+    def report_durations(self, context: RuntimeContext):
+        amount = context.options.durations
+        if not amount or not self.scenario_durations:
+            return
+
+        for kind, durations in (
+            ("scenarios", self.scenario_durations),
+            ("features", self.feature_durations),
+        ):
+            if not durations:
+                continue
+            slowest = sorted(durations, key=lambda item: item[0], reverse=True)[:amount]
+            self.sh.bold_blue(f"\nSlowest {len(slowest)} {kind}\n")
+            for duration, name, location in slowest:
+                self.sh.yellow(f"  {duration:10.3f}s ")
+                self.sh.normal(f"{name} ")
+                self.sh.bold_black(f"{location}\n")
+
+        histogram = duration_histogram([item[0] for item in self.scenario_durations])
+        widest = max(count for label, count in histogram)
+        self.sh.bold_blue(f"\nDurations of {len(self.scenario_durations)} scenarios\n")
+        for label, count in histogram:
+            bar = "█" * (round(count / widest * 40) if count else 0)
+            self.sh.normal(f"  {label:>8} ")
+            self.sh.green(bar)
+            self.sh.normal(f" {count}\n")
+
+        self.sh.reset("\n")
+
+    def report_memory(self, context: RuntimeContext):
+        threshold = context.options.memory_threshold * BYTES["mb"]
+        leaking = [result for result in self.traced if result.memory.retained > threshold]
+        if not leaking:
+            return
+
+        leaking.sort(key=lambda result: result.memory.retained, reverse=True)
+        self.sh.bold_yellow(
+            f"\n{len(leaking)} tests retained more than {format_bytes(threshold)}\n"
+        )
+        for result in leaking:
+            self.sh.yellow(f"  {format_bytes(result.memory.retained):>10} retained ")
+            self.sh.normal(f"{format_bytes(result.memory.peak):>10} peak  {result.location.name} ")
+            self.sh.bold_black(f"{result.location.path_and_lineno}\n")
+
+        self.sh.reset("\n")
 
     def on_internal_runtime_error(self, context: RuntimeContext, error: InternalRuntimeError):
         if isinstance(error.exception, SpecialSyntaxDisabledError):
@@ -175,7 +315,13 @@ class FeatureReporter(Reporter):
             self.sh.reset("\n")
 
         self.sh.reset("")
+        self.report_profiles(context)
+        self.report_memory(context)
+        self.report_durations(context)
+        self.report_warnings(context)
+        self.sh.flush()
 
+    def report_warnings(self, context: RuntimeContext):
         warning_count = len(context.warnings)
         if warning_count == 0:
             return
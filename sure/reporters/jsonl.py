@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Union
+from sure.reporter import Reporter, ReportFile
+from sure.runtime import (
+    Feature,
+    FeatureResult,
+    Scenario,
+    ScenarioResult,
+    ScenarioResultSet,
+    TestLocation,
+    RuntimeContext,
+    RuntimeRole,
+)
+
+
+def location_record(location: Optional[TestLocation]) -> Optional[Dict[str, Any]]:
+    if location is None:
+        return None
+
+    return {
+        "name": location.name,
+        "filename": location.filename,
+        "line": location.line,
+        "description": location.description,
+    }
+
+
+def feature_record(feature: Feature) -> Dict[str, Any]:
+    return {
+        "title": feature.title,
+        "path": feature.path,
+    }
+
+
+def result_record(result: ScenarioResult) -> Dict[str, Any]:
+    return {
+        "label": result.label.lower(),
+        "duration": result.duration,
+        "location": location_record(getattr(result, "location", None)),
+    }
+
+
+def error_record(error: Optional[BaseException], result: ScenarioResult) -> Dict[str, Any]:
+    return {
+        "type": error.__class__.__name__,
+        "message": str(error),
+        "stack": result.stack.full(),
+    }
+
+
+class JSONLinesReporter(Reporter):
+    """Writes one JSON object per line for each event of the test
+    session into the path or file descriptor given to the
+    command-line option ``--report-file`` or to :data:`sys.stdout`.
+
+    Every object contains the name of the ``event``, the wall-clock
+    ``time`` and the ``monotonic`` time at which it occurred, which
+    are meant for ordering and measuring events respectively, along
+    with the fields specific to the event.
+    """
+
+    name = "jsonl"
+
+    def initialize(self, *args, **kw):
+        self.output = None
+        self.started = None
+        self.last_result = None
+        self.labels = Counter()
+
+    def emit(self, event: str, **fields):
+        # the command-line reports the result of failed sessions once
+        # again after finishing
+        if self.output is None:
+            return
+
+        record = {"event": event, "time": time.time(), "monotonic": time.monotonic()}
+        record.update(fields)
+        self.output.write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+
+    def on_start(self):
+        self.output = ReportFile(self.runner.options.report_file)
+        self.started = time.monotonic()
+        self.last_result = None
+        self.labels.clear()
+        self.emit("on_start")
+
+    def on_feature(self, feature: Feature):
+        self.emit("on_feature", feature=feature_record(feature))
+
+    def on_feature_done(self, feature: Feature, result: FeatureResult):
+        self.emit(
+            "on_feature_done",
+            feature=feature_record(feature),
+            label=result.label.lower(),
+            duration=result.duration,
+        )
+        self.output.flush()
+
+    def on_scenario(self, scenario: Scenario):
+        self.emit(
+            "on_scenario",
+            scenario=scenario.name,
+            location=location_record(scenario.location),
+        )
+
+    def on_scenario_done(
+        self, scenario: Scenario, result: Union[ScenarioResult, ScenarioResultSet]
+    ):
+        # scenarios of classes with multiple tests report the same
+        # result more than once in a row and results of setups and
+        # teardowns are not counted as tests
+        if result is not self.last_result and result.role == RuntimeRole.Unit:
+            self.labels[result.label.lower()] += 1
+        self.last_result = result
+        self.emit("on_scenario_done", scenario=scenario.name, **result_record(result))
+
+    def on_success(self, scenario: Scenario):
+        self.emit("on_success", scenario=scenario.name)
+
+    def on_failure(self, scenario: Scenario, result: ScenarioResult):
+        self.emit(
+            "on_failure",
+            scenario=scenario.name,
+            failure=error_record(result.failure, result),
+            **result_record(result),
+        )
+
+    def on_error(self, scenario: Scenario, result: ScenarioResult):
+        self.emit(
+            "on_error",
+            scenario=scenario.name,
+            error=error_record(result.error, result),
+            **result_record(result),
+        )
+
+    def on_timeout(self, scenario: Scenario, result: ScenarioResult):
+        self.emit(
+            "on_timeout",
+            scenario=scenario.name,
+            error=error_record(result.error, result),
+            **result_record(result),
+        )
+
+    def on_benchmark(self, scenario: Scenario, result: ScenarioResult):
+        self.emit(
+            "on_benchmark",
+            scenario=scenario.name,
+            benchmark=dict(name=result.benchmark.name, **result.benchmark.to_dict()),
+            **result_record(result),
+        )
+
+    def on_internal_runtime_error(self, context: RuntimeContext, error):
+        self.output = self.output or ReportFile(self.runner.options.report_file)
+        self.emit("on_internal_runtime_error", error=str(error))
+        self.output.flush()
+
+    def on_finish(self, context: RuntimeContext):
+        self.emit(
+            "on_finish",
+            duration=time.monotonic() - self.started,
+            results=dict(self.labels),
+        )
+        self.output.close()
+        self.output = None
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import re
+from pathlib import Path
+from typing import Optional, Union
+from xml.sax.saxutils import escape, quoteattr
+from sure.reporter import Reporter, ReportFile
+from sure.runtime import (
+    Feature,
+    FeatureResult,
+    Scenario,
+    ScenarioResult,
+    ScenarioResultSet,
+    RuntimeContext,
+    RuntimeRole,
+)
+
+# characters which are not allowed anywhere within an XML 1.0 document
+ILLEGAL_XML_CHARACTERS = re.compile(
+    "[^\x09\x0a\x0d\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+
+def xml_text(value) -> str:
+    return escape(ILLEGAL_XML_CHARACTERS.sub("?", str(value)))
+
+
+def xml_attribute(value) -> str:
+    return quoteattr(ILLEGAL_XML_CHARACTERS.sub("?", str(value)))
+
+
+def report_path(path: Union[str, Path, None]) -> str:
+    """the absolute path of the given file, which may have been
+    collapsed into ``~``, see :func:`sure.errors.collapse_path`"""
+    if not path:
+        return ""
+
+    return str(Path(path).expanduser().absolute())
+
+
+class JUnitReporter(Reporter):
+    """Writes a JUnit XML report to the path given to the command-line
+    option ``--report-file`` or to :data:`sys.stdout`.
+
+    Each ``<testcase>`` element is written as soon as its scenario
+    finishes rather than accumulated until the end of the test
+    session, and written elements are flushed at the end of each
+    feature as well as by :class:`~sure.reporter.ReportFile`.
+    """
+
+    name = "junit"
+
+    def initialize(self, *args, **kw):
+        self.output = None
+        self.feature = None
+        self.last_result = None
+
+    def write(self, data: str):
+        self.output.write(data)
+
+    def on_start(self):
+        self.output = ReportFile(self.runner.options.report_file)
+        self.last_result = None
+        self.write('<?xml version="1.0" encoding="utf-8"?>\n<testsuites name="sure">\n')
+
+    def on_feature(self, feature: Feature):
+        self.feature = feature
+        self.write(
+            f"  <testsuite name={xml_attribute(feature.title)}"
+            f" file={xml_attribute(report_path(feature.path))}>\n"
+        )
+
+    def on_feature_done(self, feature: Feature, result: FeatureResult):
+        self.write("  </testsuite>\n")
+        self.output.flush()
+        self.feature = None
+
+    def on_scenario(self, scenario: Scenario):
+        pass
+
+    def on_scenario_done(
+        self, scenario: Scenario, result: Union[ScenarioResult, ScenarioResultSet]
+    ):
+        # failures and errors are written as soon as they are reported
+        if result.is_success and result.role == RuntimeRole.Unit:
+            self.write_testcase(result)
+
+    def on_success(self, scenario: Scenario):
+        pass
+
+    def on_failure(self, scenario: Scenario, result: ScenarioResult):
+        self.write_testcase(result, "failure", result.failure)
+
+    def on_error(self, scenario: Scenario, result: ScenarioResult):
+        self.write_testcase(result, "error", result.error)
+
+    def on_timeout(self, scenario: Scenario, result: ScenarioResult):
+        self.write_testcase(result, "error", result.error)
+
+    def write_testcase(
+        self,
+        result: ScenarioResult,
+        kind: Optional[str] = None,
+        exception: Optional[BaseException] = None,
+    ):
+        # scenarios of classes with multiple tests report the same
+        # result more than once in a row and the command-line reports
+        # the result of failed sessions once again after finishing
+        if result is self.last_result or self.output is None:
+            return
+        # setups and teardowns are not test cases
+        if result.role != RuntimeRole.Unit:
+            return
+        self.last_result = result
+
+        location = result.location
+        self.write(
+            f"    <testcase classname={xml_attribute(location.classname)}"
+            f" name={xml_attribute(location.name)}"
+            f" file={xml_attribute(report_path(location.filename))}"
+            f" line={xml_attribute(location.line)}"
+            f' time="{result.duration:.6f}"'
+        )
+        if kind is None:
+            self.write("/>\n")
+            return
+
+        self.write(
+            f">\n      <{kind} type={xml_attribute(exception.__class__.__name__)}"
+            f" message={xml_attribute(exception)}>"
+            f"{xml_text(result.stack.full())}</{kind}>\n"
+            "    </testcase>\n"
+        )
+
+    def on_internal_runtime_error(self, context: RuntimeContext, error):
+        self.output = self.output or ReportFile(self.runner.options.report_file)
+        comment = re.sub(r"-(?=-)", "- ", ILLEGAL_XML_CHARACTERS.sub("?", str(error)))
+        self.write(f"  <!-- {comment} -->\n")
+        self.output.flush()
+
+    def on_finish(self, context: RuntimeContext):
+        self.write("</testsuites>\n")
+        self.output.close()
+        self.output = None
@@ -69,6 +69,12 @@ class TestReporter(Reporter):
     def on_error(self, test: Scenario, result: ScenarioResult):
         events["on_error"].append((time.time(), test.name, result.label.lower()))
 
+    def on_timeout(self, test: Scenario, result: ScenarioResult):
+        events["on_timeout"].append((time.time(), test.name, result.label.lower()))
+
+    def on_benchmark(self, test: Scenario, result: ScenarioResult):
+        events["on_benchmark"].append((time.time(), result.benchmark.name, result.label.lower()))
+
     def on_internal_runtime_error(self, context: RuntimeContext, error: ErrorStack):
         events["on_internal_runtime_error"].append((time.time(), context, error))
 
@@ -17,6 +17,7 @@
 import os
 import re
 import sys
+import copy
 import types
 import inspect
 import unittest
@@ -32,7 +33,9 @@ from typing import (
     Iterable,
 )
 from functools import lru_cache, cached_property
+from concurrent.futures import ProcessPoolExecutor
 
+from sure import registry
 from sure.errors import ExitError, ExitFailure, ImmediateError, ImmediateFailure
 from sure.runtime import (
     Feature,
@@ -52,7 +55,12 @@ from sure.loader import (
     loader,
     object_belongs_to_sure,
 )
-from sure.reporter import Reporter
+from sure.loader.dependencies import get_changed_files, get_dependency_graph
+from sure.reporter import Reporter, EventRecorder
+from sure.scheduler import Durations, iterate_scenario_results, schedule, select_shard
+from sure.benchmark import Baseline, get_baseline
+from sure.profiling import ScenarioProfile, dump_profiles
+from sure.memory import stop_tracing
 
 
 Candidate = TypeVar("Candidate")
@@ -70,12 +78,19 @@ class Runner(object):
     def __repr__(self):
         return f"<Runner base_path={repr(self.base_path)} reporter={self.reporter}>"
 
-    def get_reporter(self, name) -> Reporter:
+    def get_reporter(self, name: Union[str, Reporter]) -> Reporter:
+        if not isinstance(name, str):
+            return name
+
         return Reporter.from_name_and_runner(name, self)
 
     def find_candidates(
         self, lookup_paths: Iterable[Union[str, Path]]
     ) -> List[types.ModuleType]:
+        if self.options.shard is not None or self.options.changed_since:
+            # only modules of the current shard or affected by changes are imported
+            lookup_paths = self.find_candidate_paths(lookup_paths)
+
         candidate_modules = []
         for path in lookup_paths:
             modules = loader.load_recursive(
@@ -87,6 +102,39 @@ class Runner(object):
 
         return candidate_modules
 
+    def find_candidate_paths(
+        self, lookup_paths: Iterable[Union[str, Path]]
+    ) -> List[Path]:
+        """Similar to :meth:`~sure.runner.Runner.find_candidates` but
+        returns the paths of candidate modules without importing them.
+
+        Only paths within :attr:`~sure.runtime.RuntimeOptions.shard`
+        are returned when sharding and only paths of modules affected
+        by files changed since
+        :attr:`~sure.runtime.RuntimeOptions.changed_since` when so
+        specified.
+        """
+        candidate_paths = []
+        for path in lookup_paths:
+            paths = loader.find_python_paths(
+                path,
+                glob_pattern=self.options.glob_pattern,
+                excludes=self.options.ignore,
+            )
+            candidate_paths.extend(paths)
+
+        if self.options.changed_since:
+            graph = get_dependency_graph()
+            candidate_paths = graph.affected(
+                candidate_paths, get_changed_files(self.options.changed_since)
+            )
+            graph.save()
+
+        if self.options.shard is not None:
+            candidate_paths = select_shard(candidate_paths, self.options.shard, self.shard_durations)
+
+        return candidate_paths
+
     def is_runnable_test(self, item) -> bool:
         if object_belongs_to_sure(item):
             return False
@@ -123,17 +171,139 @@ class Runner(object):
             feature.read_scenarios(executables)
             features.append(feature)
 
-        return features
+        return self.schedule(features, lambda feature: feature.path)
+
+    def schedule(self, items: List[Candidate], get_path) -> List[Candidate]:
+        """orders the given features or paths according to
+        :attr:`~sure.runtime.RuntimeOptions.schedule`"""
+        if self.options.schedule == "path":
+            return items
+
+        return schedule(
+            items,
+            lambda item: self.durations.estimate(get_path(item)),
+            mode=self.options.schedule,
+            buckets=self.options.workers,
+        )
+
+    @cached_property
+    def durations(self) -> Durations:
+        return Durations()
+
+    @cached_property
+    def shard_durations(self) -> Optional[Durations]:
+        """durations by which shards are balanced, read from the file
+        given as :attr:`~sure.runtime.RuntimeOptions.shard_durations`
+        rather than from the cache rewritten by every run, such that
+        every shard of the same suite is selected from the same
+        durations"""
+        if not self.options.shard_durations:
+            return None
+
+        return Durations.read(self.options.shard_durations)
+
+    @cached_property
+    def baseline(self) -> Baseline:
+        return get_baseline()
+
+    @cached_property
+    def profiles(self) -> List[ScenarioProfile]:
+        return []
+
+    def record_profiles(self, result: FeatureResult):
+        if not self.options.profile:
+            return
+
+        for scenario_result in iterate_scenario_results(result):
+            profile = getattr(scenario_result, "profile", None)
+            if profile is not None:
+                self.profiles.append(profile)
+
+    def record_benchmarks(self, result: FeatureResult):
+        for scenario_result in iterate_scenario_results(result):
+            benchmark = getattr(scenario_result, "benchmark", None)
+            if benchmark is not None and scenario_result.is_success:
+                self.baseline.record(benchmark, overwrite=self.options.benchmark_save)
+
+    def execute_features(
+        self, lookup_paths: List[Union[Path, str]]
+    ) -> Iterable[Tuple[Feature, FeatureResult]]:
+        if self.options.workers > 1:
+            yield from self.execute_features_in_parallel(lookup_paths)
+            return
+
+        for feature in self.load_features(lookup_paths):
+            self.reporter.on_feature(feature)
+            yield feature, feature.run(self.reporter, runtime=self.options)
+
+    def execute_features_in_parallel(
+        self, lookup_paths: List[Union[Path, str]]
+    ) -> Iterable[Tuple[Feature, FeatureResult]]:
+        """Runs each feature within a pool of
+        :attr:`~sure.runtime.RuntimeOptions.workers` processes, each
+        worker imports only the modules of the features which it
+        runs.
+
+        The reporter events of each feature are recorded within the
+        worker and replayed in order as soon as that feature is
+        done, results are yielded in the same order in which the
+        candidate paths are found.
+
+        Exceptions raised within workers, e.g.: while importing a
+        test module, do not prevent the results of other workers
+        from being reported. The first such exception is re-raised
+        at the end just as it would have been in a serial run.
+        """
+        paths = self.schedule(self.find_candidate_paths(lookup_paths), lambda path: path)
+        options = copy.copy(self.options)
+        # :class:`sure.errors.ImmediateExit` calls :func:`sys.exit`
+        # which is why "immediate" failures are treated exclusively
+        # by the parent process
+        options.immediate = False
+        options.workers = 1
+        # paths are already selected by the parent process, workers
+        # must neither select shards of single paths again nor
+        # recompute changes
+        options.shard = None
+        options.changed_since = None
+
+        pool = ProcessPoolExecutor(
+            max_workers=min(self.options.workers, max(len(paths), 1)),
+            initializer=initialize_worker,
+            initargs=(bool(registry.context.get("special_syntax_enabled")),),
+        )
+        futures = [
+            pool.submit(execute_feature_in_worker, self.base_path, path, options)
+            for path in paths
+        ]
+        error = None
+        try:
+            for future in futures:
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+
+                for feature, events, result in outcome:
+                    self.reporter.on_feature(feature)
+                    for name, args in events:
+                        getattr(self.reporter, name)(*args)
+
+                    yield feature, result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        if error is not None:
+            # suppresses the :class:`concurrent.futures.process._RemoteTraceback`
+            raise error from None
 
     def execute(self, lookup_paths=Iterable[Union[Path, str]]) -> FeatureResultSet:
         results = []
         self.reporter.on_start()
         lookup_paths = list(lookup_paths)
 
-        for feature in self.load_features(lookup_paths):
-            self.reporter.on_feature(feature)
-
-            result = feature.run(self.reporter, runtime=self.options)
+        for feature, result in self.execute_features(lookup_paths):
             if self.options.immediate:
                 if result.is_failure:
                     raise ExitFailure(self.context, result)
@@ -142,9 +312,18 @@ class Runner(object):
                     raise ExitError(self.context, result)
 
             results.append(result)
+            self.durations.record(feature, result)
+            self.record_benchmarks(result)
+            self.record_profiles(result)
 
             self.reporter.on_feature_done(feature, result)
 
+        self.durations.save()
+        self.baseline.save()
+        if self.options.profile:
+            dump_profiles(self.profiles, self.options.profile)
+        if self.options.trace_memory:
+            stop_tracing()
         self.reporter.on_finish(self.context)
         return FeatureResultSet(results)
 
@@ -162,3 +341,34 @@ class Runner(object):
     @cached_property
     def context(self):
         return RuntimeContext(self.reporter, self.options)
+
+
+def initialize_worker(special_syntax: bool):
+    if special_syntax:
+        import sure
+
+        sure.enable_special_syntax()
+
+
+def execute_feature_in_worker(
+    base_path: Path, path: Path, options: RuntimeOptions
+) -> List[Tuple[Feature, List[Tuple[str, tuple]], FeatureResult]]:
+    """Loads and runs the features of the module located at the given
+    path within a worker process of
+    :meth:`~sure.runner.Runner.execute_features_in_parallel`.
+
+    :returns: a :class:`list` of 3-item tuples containing each
+      feature, the reporter events recorded during its execution and
+      its result. Runtime objects drop references to modules, test
+      objects and tracebacks when pickled, see
+      :func:`~sure.runtime.portable_state`.
+    """
+    recorder = EventRecorder(None)
+    runner = Runner(base_path, recorder, options)
+    outcome = []
+    for feature in runner.load_features([path]):
+        recorder.events = []
+        result = feature.run(recorder, runtime=options)
+        outcome.append((feature, recorder.events, result))
+
+    return outcome
@@ -17,6 +17,11 @@
 import os
 import re
 import sys
+import copy
+import time
+import signal
+import asyncio
+import threading
 import types
 import inspect
 import logging
@@ -25,9 +30,13 @@ import traceback
 
 from pathlib import Path
 from functools import reduce
-from typing import Dict, List, Optional, Any, Callable, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Any, Callable, Tuple, Union
 
-from sure.reporter import Reporter
+from sure.reporter import Reporter, EventRecorder
+from sure.benchmark import Benchmark, get_baseline
+from sure.profiling import ScenarioProfile
+from sure.memory import MemoryTrace
 from sure.errors import InternalRuntimeError
 from sure.special import WarningReaper
 from sure import types as stypes
@@ -42,7 +51,9 @@ from sure.errors import (
     ExceptionManager,
     treat_error,
     collapse_path,
-    send_runtime_warning
+    portable_exception,
+    send_runtime_warning,
+    ScenarioTimeout,
 )
 from sure.loader import (
     loader,
@@ -60,6 +71,22 @@ class BaseContainer(object):
     """base-class for runtime containers"""
 
 
+def portable_state(instance: object, *unportable: str) -> Dict[str, Any]:
+    """returns a copy of the ``__dict__`` of the given instance with
+    the given attribute names set to ``None``.
+
+    Meant for implementing ``__getstate__`` in runtime objects which
+    travel from worker processes back to the
+    :class:`~sure.runner.Runner` and therefore must not carry
+    references to modules, test objects or tracebacks.
+    """
+    state = dict(instance.__dict__)
+    for name in unportable:
+        state[name] = None
+
+    return state
+
+
 class RuntimeRole:
     Setup = reduce(lambda L, R: L ^ R, b"Setup")
     Unit = reduce(lambda L, R: L ^ R, b"Unit")
@@ -109,7 +136,11 @@ def seem_to_indicate_teardown(name: str) -> bool:
 
 
 def seem_to_indicate_test(name: str) -> bool:
-    return bool(re.search(r"^(Test|Spec|Scenario)[\w_]+$", name or "", re.I))
+    return bool(re.search(r"^(Test|Spec|Scenario)[\w_]+$", name or "", re.I)) or seem_to_indicate_benchmark(name)
+
+
+def seem_to_indicate_benchmark(name: str) -> bool:
+    return bool(re.search(r"^bench[\w_]+$", name or "", re.I))
 
 
 def appears_to_be_runnable(name: str) -> bool:
@@ -127,6 +158,17 @@ def appears_to_be_runnable(name: str) -> bool:
     )
 
 
+CONCURRENCY = (
+    # scenarios run one after another
+    "none",
+    # scenarios of ``async def`` test functions run concurrently within
+    # the event loop of their feature, see :meth:`~sure.runtime.Feature.run_scenarios_concurrently`
+    "asyncio",
+    # scenarios run within a pool of threads, see :meth:`~sure.runtime.Feature.run_scenarios_in_threads`
+    "threads",
+)
+
+
 class RuntimeOptions(object):
     """Container for command-line options which originate at
     :mod:`sure.cli`. The goal is to isolate options specific to
@@ -144,24 +186,88 @@ class RuntimeOptions(object):
     - ``ignore`` - optional list of paths to be ignored
     - ``glob_pattern`` - optional string representing a valid :mod:`fnmatch` pattern to be matched against every "full" :class:`~pathlib.Path` in lookup paths of :meth:`~sure.runner.Runner.find_candidates` and :class:`~sure.loader.loader`. Defaults to ``**test*.py``
     - ``reap_warnings`` - optional bool to flag that warnings should be reaped, captured during runtime and displayed by the chosen reporter at the end of the test execution session. Defaults to ``False``
+    - ``workers`` - optional int indicating the amount of processes in which features should run in parallel. Defaults to ``1``, that is: features run serially within the current process
+    - ``schedule`` - optional string indicating the order in which features run based on durations recorded in previous runs, see :data:`sure.scheduler.SCHEDULES`. Defaults to ``"path"``
+    - ``changed_since`` - optional git ref or path of a file whose modification time indicates that only test modules affected by files changed since then should run, see :func:`sure.loader.dependencies.get_changed_files`. Defaults to ``None``
+    - ``shard`` - optional 2-item tuple ``(K, N)`` indicating that only the test modules of the K-th out of N shards should be imported and run, see :func:`sure.scheduler.select_shard`. Defaults to ``None``
+    - ``shard_durations`` - optional path of a file of durations, such as a copy of ``.sure_cache/durations.json``, by which shards are balanced instead of being assigned by a stable hash of each path, see :func:`sure.scheduler.select_shard`. The file is only read. Defaults to ``None``
+    - ``concurrency`` - optional string indicating how the scenarios of each feature run, see :data:`sure.runtime.CONCURRENCY`. Test modules may override it with a module-level ``concurrency`` attribute. Defaults to ``"none"``, that is: scenarios run one after another. Ignored when ``immediate`` is set
+    - ``concurrency_limit`` - optional int indicating the maximum amount of scenarios which run concurrently within a feature. Test modules may override it with a module-level ``concurrency_limit`` attribute. Defaults to ``10``
+    - ``benchmark_threshold`` - optional float indicating the percentage by which the fastest round of each benchmark, in time per iteration, may exceed the one recorded in the baseline before failing, see :class:`sure.benchmark.Baseline`. ``None`` disables the check. Defaults to ``20``
+    - ``benchmark_save`` - optional bool to flag that the results of benchmarks should overwrite those recorded in the baseline. Defaults to ``False``, that is: only benchmarks absent from the baseline are recorded
+    - ``profile`` - optional path of the file wherein the :mod:`cProfile` statistics of every test are aggregated, see :func:`sure.profiling.dump_profiles`. Defaults to ``None``, that is: tests are not profiled
+    - ``profile_top`` - optional int indicating the amount of functions with the highest internal time listed for each profiled test by the reporter. Defaults to ``5``
+    - ``trace_memory`` - optional bool to flag that the peak of memory allocated by each test as well as the memory it retained should be measured with :mod:`tracemalloc`, see :class:`sure.memory.MemoryTrace`. Defaults to ``False``
+    - ``memory_threshold`` - optional float indicating the amount of megabytes retained by a test beyond which the reporter flags it when ``trace_memory`` is set. Defaults to ``1.0``
+    - ``durations`` - optional int indicating the amount of slowest scenarios and features listed by the reporter along with a histogram of the durations of every scenario. Defaults to ``0``, that is: not listed
+    - ``report_file`` - optional path of the file wherein reporters which produce machine-readable output, such as :class:`sure.reporters.junit.JUnitReporter`, write their report. Defaults to ``None``, that is: such reports are written to :data:`sys.stdout`
+    - ``timeout`` - optional float indicating the maximum amount of seconds each test may run for before being reported as timed out. Tests decorated with :func:`sure.timeout` override it. Defaults to ``None``, that is: tests may run indefinitely
     """
 
     immediate: bool
     ignore: Optional[List[Union[str, Path]]]
     glob_pattern: str
     reap_warnings: bool
+    workers: int
+    schedule: str
+    shard: Optional[Tuple[int, int]]
+    shard_durations: Optional[str]
+    changed_since: Optional[str]
+    concurrency: str
+    concurrency_limit: int
+    timeout: Optional[float]
+    profile: Optional[str]
+    profile_top: int
+    trace_memory: bool
+    memory_threshold: float
+    durations: int
+    report_file: Optional[str]
+    benchmark_threshold: Optional[float]
+    benchmark_save: bool
 
     def __init__(
         self,
         immediate: bool,
         ignore: Optional[List[Union[str, Path]]] = None,
         glob_pattern: str = "**test*.py",
-        reap_warnings: bool = False
+        reap_warnings: bool = False,
+        workers: int = 1,
+        schedule: str = "path",
+        shard: Optional[Tuple[int, int]] = None,
+        shard_durations: Optional[str] = None,
+        changed_since: Optional[str] = None,
+        concurrency: str = "none",
+        concurrency_limit: int = 10,
+        timeout: Optional[float] = None,
+        benchmark_threshold: Optional[float] = 20.0,
+        benchmark_save: bool = False,
+        profile: Optional[str] = None,
+        profile_top: int = 5,
+        trace_memory: bool = False,
+        memory_threshold: float = 1.0,
+        durations: int = 0,
+        report_file: Optional[str] = None,
     ):
         self.immediate = bool(immediate)
         self.ignore = ignore and list(ignore) or []
         self.glob_pattern = glob_pattern
         self.reap_warnings = bool(reap_warnings)
+        self.workers = max(int(workers or 1), 1)
+        self.schedule = schedule or "path"
+        self.shard = shard and tuple(shard) or None
+        self.shard_durations = shard_durations and str(shard_durations) or None
+        self.changed_since = changed_since
+        self.concurrency = concurrency or "none"
+        self.concurrency_limit = max(int(concurrency_limit or 1), 1)
+        self.timeout = timeout and float(timeout) or None
+        self.benchmark_threshold = benchmark_threshold
+        self.benchmark_save = bool(benchmark_save)
+        self.profile = profile and str(profile) or None
+        self.profile_top = max(int(profile_top or 0), 0)
+        self.trace_memory = bool(trace_memory)
+        self.memory_threshold = float(memory_threshold)
+        self.durations = max(int(durations or 0), 0)
+        self.report_file = report_file and str(report_file) or None
 
     def __repr__(self):
         return f"<RuntimeOptions immediate={self.immediate} glob_pattern={repr(self.glob_pattern)} reap_warnings={repr(self.reap_warnings)}>"
@@ -177,6 +283,7 @@ class RuntimeContext(object):
     reporter: Reporter
     options: RuntimeOptions
     unittest_testcase_method_name: str
+    __loop__: Optional[asyncio.AbstractEventLoop] = None
 
     def __init__(
         self,
@@ -198,8 +305,48 @@ class RuntimeContext(object):
     def warnings(self):
         return self.warning_reaper.warnings
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """event loop in which coroutines of tests run, created on
+        first use and shared by every scenario of a feature"""
+        if self.__loop__ is None:
+            self.__loop__ = asyncio.new_event_loop()
+
+        return self.__loop__
+
+    def isolated(self) -> "RuntimeContext":
+        """returns a copy of this context whose reporter records
+        events rather than reporting them and which creates its own
+        event loop, such that scenarios may run concurrently"""
+        context = copy.copy(self)
+        context.reporter = EventRecorder(None)
+        context.__loop__ = None
+        return context
+
+    def run_until_complete(self, awaitable) -> Any:
+        return self.loop.run_until_complete(awaitable)
+
+    def close(self):
+        """closes the event loop, if any was created"""
+        loop, self.__loop__ = self.__loop__, None
+        if loop is None:
+            return
+
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
 
 class ErrorStack(object):
+    """Renders the traceback of a failure or error. The traceback is
+    formatted at most once, as soon as any of the methods which
+    render it is called, and the formatted lines are reused by every
+    other method thereafter.
+    """
+
+    formatted_traceback: Optional[List[str]] = None
+
     def __init__(
         self, location: stypes.TestLocation, exc: Exception, exception_info=None
     ):
@@ -208,37 +355,75 @@ class ErrorStack(object):
         self.exception = exc
         self.location = location
         self.code = exit_code(str(exc))
+        self.__collapsed__ = None
+        self.__full__ = None
+
+    def format_traceback(self) -> List[str]:
+        if self.formatted_traceback is None:
+            self.formatted_traceback = (
+                traceback.format_tb(self.traceback) if self.traceback is not None else []
+            )
+
+        return self.formatted_traceback
+
+    def collapsed_traceback(self) -> List[str]:
+        """the lines of :meth:`~sure.runtime.ErrorStack.format_traceback`
+        with the home directory collapsed into ``~``"""
+        if self.__collapsed__ is None:
+            self.__collapsed__ = [collapse_path(e) for e in self.format_traceback()]
+
+        return self.__collapsed__
 
     def full(self) -> str:
-        return "\n".join(
-            [collapse_path(e) for e in traceback.format_tb(self.traceback)]
-        )
+        if self.__full__ is None:
+            self.__full__ = "\n".join(self.collapsed_traceback())
+
+        return self.__full__
 
     def location_specific_stack(self) -> List[str]:
         return [
-            collapse_path(e)
-            for e in traceback.format_tb(self.traceback)
+            e
+            for e in self.collapsed_traceback()
             if self.location.name in e
         ]
 
     def location_specific_error(self) -> str:
         stack = self.location_specific_stack()
-        return collapse_path(stack[-1])
+        return stack[-1]
 
     def nonlocation_specific_stack(self) -> List[str]:
         return [
-            collapse_path(e)
-            for e in traceback.format_tb(self.traceback)
+            e
+            for e in self.collapsed_traceback()
             if self.location.name not in e
         ]
 
     def nonlocation_specific_error(self) -> List[str]:
         stack = self.nonlocation_specific_stack()
-        return collapse_path(stack[-1])
+        return stack[-1]
 
     def __str__(self):
         return self.full()
 
+    def __getstate__(self):
+        state = portable_state(self, "exception_info", "traceback")
+        state["exception"] = portable_exception(self.exception)
+        state["formatted_traceback"] = self.format_traceback()
+        return state
+
+
+def classname_of(test: object) -> str:
+    """returns the dotted name of the class which defines the given
+    test or of the module of test functions"""
+    if isinstance(test, types.FunctionType):
+        return test.__module__
+
+    owner = getattr(test, "__self__", test)
+    if not isinstance(owner, type):
+        owner = owner.__class__
+
+    return object_name(owner)
+
 
 class TestLocation(object):
     def __init__(self, test, module_or_instance=None):
@@ -281,6 +466,7 @@ class TestLocation(object):
         if self.description == inspect.getdoc(unittest.TestCase):
             self.description = ""
         self.module_or_instance = module_or_instance
+        self.classname = classname_of(test)
         self.ancestral_description = getattr(
             module_or_instance, "description", inspect.getdoc(module_or_instance)
         )
@@ -301,6 +487,79 @@ class TestLocation(object):
     def path_and_lineno(self):
         return collapse_path(f"{self.filename}:{self.line}")
 
+    def __getstate__(self):
+        return portable_state(self, "test", "kind", "module_or_instance")
+
+
+def get_timeout(*sources: Any, default: Optional[float] = None) -> Optional[float]:
+    """returns the amount of seconds given to :func:`sure.timeout` by
+    the first of the given test functions, methods or classes which
+    has been decorated thusly, or the given default.
+    """
+    for source in sources:
+        seconds = getattr(source, "__sure_timeout__", None)
+        if seconds is not None:
+            return seconds
+
+    return default
+
+
+def call_with_timeout(function: Callable, seconds: Optional[float]) -> Any:
+    """calls the given function and returns its return value or
+    raises :class:`~sure.errors.ScenarioTimeout` if it doesn't return
+    within the given amount of seconds.
+
+    Within the main thread the call is interrupted by a
+    :data:`signal.SIGALRM`, otherwise it happens within a daemon
+    watchdog thread which is abandoned once the time is up.
+    """
+    if not seconds:
+        return function()
+
+    if threading.current_thread() is threading.main_thread() and hasattr(signal, "setitimer"):
+        def interrupt(signum, frame):
+            raise ScenarioTimeout(seconds)
+
+        previous = signal.signal(signal.SIGALRM, interrupt)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+        try:
+            return function()
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    outcome = {}
+
+    def watched():
+        try:
+            outcome["return_value"] = function()
+        except BaseException as e:
+            outcome["error"] = e
+
+    watchdog = threading.Thread(target=watched, name=f"sure-watchdog-{function}", daemon=True)
+    watchdog.start()
+    watchdog.join(seconds)
+    if watchdog.is_alive():
+        raise ScenarioTimeout(seconds)
+    if "error" in outcome:
+        raise outcome["error"]
+
+    return outcome.get("return_value")
+
+
+async def await_with_timeout(awaitable: Any, seconds: Optional[float]) -> Any:
+    """awaits the given awaitable and returns its result or raises
+    :class:`~sure.errors.ScenarioTimeout` if it doesn't complete
+    within the given amount of seconds.
+    """
+    if not seconds:
+        return await awaitable
+
+    try:
+        return await asyncio.wait_for(awaitable, seconds)
+    except asyncio.TimeoutError:
+        raise ScenarioTimeout(seconds) from None
+
 
 class Container(BaseContainer):
     module_or_instance: Optional[object]
@@ -334,6 +593,49 @@ class Container(BaseContainer):
         )
 
 
+def new_container(context, **kw) -> Container:
+    """returns a :class:`~sure.runtime.BenchmarkContainer` when the
+    given name indicates a benchmark or a
+    :class:`~sure.runtime.Container` otherwise"""
+    if seem_to_indicate_benchmark(kw["name"]):
+        threshold = getattr(context.options, "benchmark_threshold", None)
+        if getattr(context.options, "benchmark_save", False):
+            # benchmarks about to overwrite the baseline are not compared against it
+            threshold = None
+        return BenchmarkContainer(threshold=threshold, **kw)
+
+    return Container(**kw)
+
+
+class BenchmarkContainer(Container):
+    """:class:`~sure.runtime.Container` of a function or method whose
+    name starts with ``bench``, its :attr:`~sure.runtime.BenchmarkContainer.unit`
+    measures the runnable and compares the resulting
+    :class:`~sure.benchmark.Benchmark` against the
+    :class:`~sure.benchmark.Baseline`
+    """
+
+    benchmark: Optional[Benchmark] = None
+
+    def __init__(self, *args, threshold: Optional[float] = None, **kw):
+        super().__init__(*args, **kw)
+        self.threshold = threshold
+
+    @property
+    def unit(self):
+        return self.measure
+
+    def measure(self) -> Benchmark:
+        self.benchmark = Benchmark.measure(self.runnable)
+        get_baseline().check(self.benchmark, self.threshold)
+        return self.benchmark
+
+    def __repr__(self):
+        return (
+            f"<BenchmarkContainer of {repr(self.runnable)} at {self.location.path_and_lineno}>"
+        )
+
+
 class ScenarioArrangement(BaseContainer):
     """Thought with the goal of providing a hermetically isolated
     environment where the runtime context and associated reporters are
@@ -376,7 +678,8 @@ class ScenarioArrangement(BaseContainer):
         elif isinstance(source, (types.FunctionType, types.MethodType)):
             test_methods.insert(
                 0,
-                Container(
+                new_container(
+                    context,
                     name=source.__name__,
                     runnable=source,
                     module_or_instance=source.__module__,
@@ -405,6 +708,18 @@ class ScenarioArrangement(BaseContainer):
     def __repr__(self):
         return f"<ScenarioArrangement:{self.name} {self.location}>"
 
+    def __getstate__(self):
+        return portable_state(
+            self,
+            "source_instance",
+            "context",
+            "log",
+            "setup_methods",
+            "teardown_methods",
+            "test_methods",
+            "nested_containers",
+        )
+
     @classmethod
     def from_generic_object(
         cls, some_object, context: RuntimeContext, scenario: stypes.Scenario
@@ -488,7 +803,8 @@ class ScenarioArrangement(BaseContainer):
                     )
                 elif seem_to_indicate_test(name):
                     test_methods.append(
-                        Container(
+                        new_container(
+                            context,
                             name=name,
                             runnable=runnable,
                             module_or_instance=module_or_instance,
@@ -538,7 +854,7 @@ class ScenarioArrangement(BaseContainer):
     def run(self, context):
         for setup_container in self.setup_methods:
             yield self.invoke_contextualized(
-                setup_container, context
+                setup_container, context, RuntimeRole.Setup
             ), RuntimeRole.Setup
 
         for container in self.tests:
@@ -551,7 +867,7 @@ class ScenarioArrangement(BaseContainer):
 
         for teardown_container in self.teardown_methods:
             yield self.invoke_contextualized(
-                teardown_container, context
+                teardown_container, context, RuntimeRole.Teardown
             ), RuntimeRole.Teardown
 
     def run_container(self, container, context):
@@ -568,7 +884,19 @@ class ScenarioArrangement(BaseContainer):
 
         yield result, RuntimeRole.Unit
 
-    def invoke_contextualized(self, container, context):
+    def get_timeout(self, container, context) -> Optional[float]:
+        """returns the amount of seconds within which the given
+        container must run, either given to :func:`sure.timeout` via
+        test function, method or class or to the command-line option
+        ``--timeout``.
+        """
+        return get_timeout(
+            container.runnable,
+            self.source_instance,
+            default=getattr(context.options, "timeout", None),
+        )
+
+    def invoke_contextualized(self, container, context, role: int = RuntimeRole.Unit):
         """Calls the unit of code within *container* - :attr:`~sure.runtime.Container.unit` - and returns a :class:`~sure.runtime.ScenarioResult`.
 
         If a python exception happens during that call then a
@@ -581,20 +909,83 @@ class ScenarioArrangement(BaseContainer):
 
         :param container: :class:`~sure.runtime.Container`
         :param context: :class:`~sure.runtime.RuntimeContext`
+        :param role: :class:`~sure.runtime.RuntimeRole` of the container
         :param name: :class:`str`
         :param location: :class:`~sure.runtime.TestLocation`
         """
+        started = time.perf_counter()
+        timeout = self.get_timeout(container, context)
+        profile = ScenarioProfile(enabled=bool(context.options.profile))
+        memory = MemoryTrace(enabled=context.options.trace_memory)
         try:
-            return_value = container.unit()
-            return ScenarioResult(
-                self, container.location, context, return_value=return_value
+            with profile, memory:
+                return_value = call_with_timeout(container.unit, timeout)
+            if inspect.isawaitable(return_value):
+                with profile, memory:
+                    return_value = context.run_until_complete(
+                        await_with_timeout(return_value, timeout)
+                    )
+
+            return self.new_result(
+                container, context, started, profile, memory, return_value=return_value, role=role
             )
 
-        except AssertionError as failure:
-            return ScenarioResult(self, container.location, context, failure)
+        except Exception as error:
+            return self.new_result(container, context, started, profile, memory, error, role=role)
+
+    async def invoke_contextualized_async(self, container, context):
+        """Coroutine counterpart of
+        :meth:`~sure.runtime.ScenarioArrangement.invoke_contextualized`
+        which awaits the return value of
+        :attr:`~sure.runtime.Container.unit` within the event loop
+        already running rather than running it to completion.
+        """
+        started = time.perf_counter()
+        timeout = self.get_timeout(container, context)
+        profile = ScenarioProfile(enabled=bool(context.options.profile))
+        memory = MemoryTrace(enabled=context.options.trace_memory)
+        try:
+            with profile, memory:
+                return_value = container.unit()
+            if inspect.isawaitable(return_value):
+                with profile, memory:
+                    return_value = await await_with_timeout(return_value, timeout)
+
+            return self.new_result(
+                container, context, started, profile, memory, return_value=return_value
+            )
 
         except Exception as error:
-            return ScenarioResult(self, container.location, context, error)
+            return self.new_result(container, context, started, profile, memory, error)
+
+    def new_result(
+        self,
+        container: Container,
+        context: RuntimeContext,
+        started: float,
+        profile: ScenarioProfile,
+        memory: MemoryTrace,
+        error: Optional[Exception] = None,
+        return_value: Any = None,
+        role: int = RuntimeRole.Unit,
+    ) -> stypes.ScenarioResult:
+        """returns the :class:`~sure.runtime.ScenarioResult` of the
+        given container whose invocation started at the given
+        :func:`time.perf_counter`. Must be called within the
+        ``except`` clause which caught the given error, if any.
+        """
+        return ScenarioResult(
+            self,
+            container.location,
+            context,
+            error,
+            return_value=return_value,
+            duration=time.perf_counter() - started,
+            benchmark=getattr(container, "benchmark", None),
+            profile=profile if profile.profiled else None,
+            memory=memory if memory.traced else None,
+            role=role,
+        )
 
 
 class Feature(object):
@@ -617,6 +1008,7 @@ class Feature(object):
         self.title = stripped(title)
         self.description = stripped(description)
 
+        self.path = getattr(module, "__file__", None)
         self.module = module
         self.ready = False
         self.scenarios = []
@@ -627,6 +1019,9 @@ class Feature(object):
         else:
             return f'<Feature "{self.title}">'
 
+    def __getstate__(self):
+        return portable_state(self, "module", "scenarios")
+
     def read_scenarios(self, suts):
         self.scenarios = list(map((lambda e: Scenario(e, self)), suts))
         self.ready = True
@@ -635,21 +1030,135 @@ class Feature(object):
     def run(self, reporter: Reporter, runtime: RuntimeOptions) -> stypes.FeatureResult:
         results = []
         context = RuntimeContext(reporter, runtime)
+        started = time.perf_counter()
+        try:
+            for scenario, result in self.run_scenarios(context):
+                results.append(result)
+                # failures and errors within a :class:`ScenarioResultSet`
+                # have already been reported one by one by :meth:`Scenario.run`
+                reported = isinstance(result, ScenarioResultSet)
+                if result.is_failure:
+                    if not reported:
+                        reporter.on_failure(scenario, result)
+                    if runtime.immediate:
+                        raise ExitFailure(context, result)
+
+                elif result.is_error:
+                    if not reported:
+                        reporter.on_error(scenario, result)
+                    if runtime.immediate:
+                        raise ExitError(context, result)
+        finally:
+            context.close()
+
+        result = FeatureResult(results)
+        result.duration = time.perf_counter() - started
+        return result
+
+    def get_concurrency(self, runtime: RuntimeOptions) -> Tuple[str, int]:
+        """returns a 2-item tuple with the concurrency mode and limit
+        of this feature, see :data:`~sure.runtime.CONCURRENCY`"""
+        if runtime.immediate:
+            return "none", 1
+
+        concurrency = getattr(self.module, "concurrency", None)
+        if not isinstance(concurrency, str):
+            concurrency = runtime.concurrency
+
+        if concurrency not in CONCURRENCY:
+            raise ValueError(
+                f"{self.title}: invalid concurrency {repr(concurrency)}, options are: {', '.join(CONCURRENCY)}"
+            )
+
+        limit = getattr(self.module, "concurrency_limit", None)
+        if not isinstance(limit, int):
+            limit = runtime.concurrency_limit
+
+        return concurrency, max(limit, 1)
+
+    def run_scenarios(
+        self, context: RuntimeContext
+    ) -> Iterable[Tuple[stypes.Scenario, stypes.ScenarioResult]]:
+        concurrency, limit = self.get_concurrency(context.options)
+        if concurrency == "asyncio":
+            yield from self.run_scenarios_concurrently(context, limit)
+            return
+
+        if concurrency == "threads":
+            yield from self.run_scenarios_in_threads(context, limit)
+            return
+
         for scenario in self.scenarios:
-            result = scenario.run(context)
+            yield scenario, scenario.run(context)
 
-            results.append(result)
-            if result.is_failure:
-                reporter.on_failure(scenario, result)
-                if runtime.immediate:
-                    raise ExitFailure(context, result)
+    def run_scenarios_concurrently(
+        self, context: RuntimeContext, limit: int
+    ) -> Iterable[Tuple[stypes.Scenario, stypes.ScenarioResult]]:
+        """runs scenarios of ``async def`` test functions with
+        :func:`asyncio.gather`, at most ``limit`` at a time, followed
+        by the remaining scenarios one after another.
 
-            elif result.is_error:
-                reporter.on_error(result.scenario, result)
-                if runtime.immediate:
-                    raise ExitError(context, result)
+        The reporter events of each concurrent scenario are recorded
+        and replayed in the order in which scenarios are declared.
+        """
+        concurrent = [
+            scenario
+            for scenario in self.scenarios
+            if inspect.iscoroutinefunction(scenario.object)
+        ]
 
-        return FeatureResult(results)
+        async def run_scenario(scenario, semaphore):
+            async with semaphore:
+                scenario_context = context.isolated()
+                result = await scenario.run_async(scenario_context)
+                return result, scenario_context.reporter
+
+        async def gather():
+            semaphore = asyncio.Semaphore(limit)
+            return await asyncio.gather(
+                *[run_scenario(scenario, semaphore) for scenario in concurrent]
+            )
+
+        outcomes = dict(zip(concurrent, context.run_until_complete(gather())))
+        for scenario in self.scenarios:
+            if scenario not in outcomes:
+                yield scenario, scenario.run(context)
+                continue
+
+            result, recorder = outcomes[scenario]
+            recorder.replay(context.reporter)
+            yield scenario, result
+
+    def run_scenarios_in_threads(
+        self, context: RuntimeContext, limit: int
+    ) -> Iterable[Tuple[stypes.Scenario, stypes.ScenarioResult]]:
+        """runs each scenario within a pool of ``limit`` threads.
+
+        The reporter events of each scenario are recorded and
+        replayed as soon as it and every scenario declared before it
+        are done, such that reporters receive events serially and in
+        the order in which scenarios are declared.
+        """
+
+        def run_scenario(scenario):
+            scenario_context = context.isolated()
+            try:
+                return scenario.run(scenario_context), scenario_context.reporter
+            finally:
+                scenario_context.close()
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(limit, max(len(self.scenarios), 1)),
+            thread_name_prefix=f"sure-{self.title}",
+        )
+        futures = [pool.submit(run_scenario, scenario) for scenario in self.scenarios]
+        try:
+            for scenario, future in zip(self.scenarios, futures):
+                result, recorder = future.result()
+                recorder.replay(context.reporter)
+                yield scenario, result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
 
 class Scenario(object):
@@ -672,6 +1181,9 @@ class Scenario(object):
 
         self.feature = feature
 
+    def __getstate__(self):
+        return portable_state(self, "log", "object", "object_ancestor")
+
     def run(self, context: RuntimeContext):
         collectors = ScenarioArrangement.from_generic_object(
             self.object,
@@ -687,28 +1199,60 @@ class Scenario(object):
                 if role == RuntimeRole.Unit:
                     collector_results.append(result)
 
-                if not result.is_success:
-                    if result.is_failure:
-                        context.reporter.on_failure(result.scenario, result)
-                        if context.options.immediate:
-                            raise ExitFailure(context, result)
+                self.report(collector, result, context)
+            results.extend(collector_results)
+        return ScenarioResultSet(results, context)
 
-                    elif result.is_error:
-                        context.reporter.on_error(result.scenario, result)
-                        if context.options.immediate:
-                            raise ExitError(context, result, report=False)
+    async def run_async(self, context: RuntimeContext):
+        """runs a scenario of an ``async def`` test function within
+        the event loop already running, see
+        :meth:`~sure.runtime.Feature.run_scenarios_concurrently`"""
+        collector = ScenarioArrangement.from_generic_object(
+            self.object,
+            context,
+            self,
+        )
+        results = []
+        context.reporter.on_scenario(collector.scenario)
+        for container in collector.tests:
+            result = await collector.invoke_contextualized_async(container, context)
+            results.append(result)
+            self.report(collector, result, context)
 
-                context.reporter.on_scenario_done(
-                    collector.scenario, result
-                )
-            results.extend(collector_results)
         return ScenarioResultSet(results, context)
 
+    def report(self, collector: ScenarioArrangement, result: stypes.ScenarioResult, context: RuntimeContext):
+        if result.benchmark is not None:
+            context.reporter.on_benchmark(result.scenario, result)
+
+        if not result.is_success:
+            if result.is_failure:
+                context.reporter.on_failure(result.scenario, result)
+                if context.options.immediate:
+                    raise ExitFailure(context, result)
+
+            elif result.is_timeout:
+                context.reporter.on_timeout(result.scenario, result)
+                if context.options.immediate:
+                    raise ExitError(context, result, report=False)
+
+            elif result.is_error:
+                context.reporter.on_error(result.scenario, result)
+                if context.options.immediate:
+                    raise ExitError(context, result, report=False)
+
+        context.reporter.on_scenario_done(
+            collector.scenario, result
+        )
+
 
 class BaseResult:
     """Base class for results of scenarios and features. Its entire
     purpose is to allow for distinguishing result-containing objects."""
 
+    # wall-clock time in seconds
+    duration: float = 0.0
+
     def __repr__(self):
         if not hasattr(self, 'label'):
             raise NotImplementedError(f"{self.__class__} MUST define a `label' property or attribute which must be a string")
@@ -724,6 +1268,14 @@ class ScenarioResult(BaseResult):
     error: Optional[Exception]
     failure: Optional[AssertionError]
     location: stypes.TestLocation
+    # statistics of benchmarks, see :class:`~sure.runtime.BenchmarkContainer`
+    benchmark: Optional[Benchmark] = None
+    # see the command-line option ``--profile``
+    profile: Optional[ScenarioProfile] = None
+    # see the command-line option ``--trace-memory``
+    memory: Optional[MemoryTrace] = None
+    # whether the result is that of a setup, test or teardown, see :class:`~sure.runtime.RuntimeRole`
+    role: int = RuntimeRole.Unit
 
     def __init__(
         self,
@@ -732,13 +1284,24 @@ class ScenarioResult(BaseResult):
         context: RuntimeContext,
         error=None,
         return_value=None,
+        duration: float = 0.0,
+        benchmark: Optional[Benchmark] = None,
+        profile: Optional[ScenarioProfile] = None,
+        memory: Optional[MemoryTrace] = None,
+        role: int = RuntimeRole.Unit,
     ):
         self.scenario = scenario
         self.location = location
         self.context = context
+        self.duration = duration
+        self.benchmark = benchmark
+        self.profile = profile
+        self.memory = memory
+        self.role = role
         self.exc_info = sys.exc_info()
 
-        self.stack = ErrorStack(location, error, self.exc_info)
+        self.__stack__ = None
+        self.__exception__ = error
         self.__error__ = None
         self.__failure__ = None
 
@@ -753,6 +1316,8 @@ class ScenarioResult(BaseResult):
             return "OK"
         if self.is_failure:
             return "FAILURE"
+        if self.is_timeout:
+            return "TIMEOUT"
         if self.is_error:
             return "ERROR"
 
@@ -775,6 +1340,10 @@ class ScenarioResult(BaseResult):
         if not isinstance(self.__error__, AssertionError):
             return self.__error__
 
+    @property
+    def is_timeout(self) -> bool:
+        return isinstance(self.error, ScenarioTimeout)
+
     @property
     def is_failure(self):
         return isinstance(self.__failure__, AssertionError)
@@ -792,10 +1361,31 @@ class ScenarioResult(BaseResult):
     def ok(self):
         return self.is_success
 
+    @property
+    def stack(self) -> Optional[ErrorStack]:
+        """the :class:`~sure.runtime.ErrorStack` of failures and errors,
+        created only when first accessed. ``None`` for successful
+        results."""
+        if self.__stack__ is None and not self.is_success:
+            self.__stack__ = ErrorStack(self.location, self.__exception__, self.exc_info)
+
+        return self.__stack__
+
     @property
     def succinct_failure(self) -> str:
         return self.stack.location_specific_error()
 
+    def __getstate__(self):
+        # the traceback is formatted before leaving the worker process
+        # as it cannot travel along with the result
+        self.stack
+        state = portable_state(self, "context", "exc_info", "__exception__")
+        for name in ("__error__", "__failure__"):
+            if name in state:
+                state[name] = portable_exception(state[name])
+
+        return state
+
 
 class ScenarioResultSet(ScenarioResult):
     error: Optional[ScenarioResult]
@@ -805,6 +1395,7 @@ class ScenarioResultSet(ScenarioResult):
         self.scenario_results = scenario_results
         self.failed_scenarios = []
         self.errored_scenarios = []
+        self.duration = sum(result.duration for result in scenario_results)
 
         for result in scenario_results:
             if result.is_failure:
@@ -820,6 +1411,24 @@ class ScenarioResultSet(ScenarioResult):
 
         return ""
 
+    @property
+    def origin(self) -> Optional[ScenarioResult]:
+        """the first failed or errored result within this set"""
+        for result in self.failed_scenarios + self.errored_scenarios:
+            return result
+
+    @property
+    def scenario(self):
+        return getattr(self.origin, "scenario", None)
+
+    @property
+    def location(self) -> Optional[stypes.TestLocation]:
+        return getattr(self.origin, "location", None)
+
+    @property
+    def stack(self) -> Optional[ErrorStack]:
+        return getattr(self.origin, "stack", None)
+
     @property
     def is_error(self):
         return len(self.errored_scenarios) > 0
@@ -850,6 +1459,7 @@ class FeatureResult(ScenarioResultSet):
         self.scenario_results = scenario_results
         self.failed_scenarios = []
         self.errored_scenarios = []
+        self.duration = sum(result.duration for result in scenario_results)
 
         for scenario in scenario_results:
             if scenario.is_error:
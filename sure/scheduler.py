@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""persisted durations of features and scenarios as well as the
+scheduling of features based on those durations"""
+import os
+import heapq
+import zlib
+
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from sure.cache import JSONCache
+from sure.types import Feature, FeatureResult
+
+Item = TypeVar("Item")
+
+SCHEDULES = ("path", "longest-first", "balanced")
+
+
+def relative_key(path: Union[str, Path]) -> str:
+    """the given path relative to the current working directory in
+    POSIX form, such that keys derived from it are the same within
+    every checkout of a repository"""
+    return Path(os.path.relpath(Path(path).absolute())).as_posix()
+
+
+class Durations(object):
+    """Wall-clock durations, in seconds, recorded during previous test
+    runs. Features are keyed by the path of their module relative to
+    the current working directory and scenarios by ``<path>::<name>``.
+
+    Durations read from a file given explicitly, see
+    :meth:`~sure.scheduler.Durations.read`, are never written back.
+    """
+
+    def __init__(self, cache: Optional[JSONCache] = None, readonly: bool = False):
+        self.cache = cache or JSONCache("durations")
+        self.readonly = readonly
+        data = self.cache.load()
+        self.features = data.get("features") or {}
+        self.scenarios = data.get("scenarios") or {}
+
+    @classmethod
+    def read(cls, path: Union[str, Path]) -> "Durations":
+        """reads durations from the given file, e.g.: a copy of
+        ``.sure_cache/durations.json`` kept along with the test suite"""
+        cache = JSONCache("durations")
+        cache.path = Path(path)
+        return cls(cache, readonly=True)
+
+    def __repr__(self):
+        return f"<Durations {len(self.features)} features>"
+
+    def get(self, path: Union[str, Path, None]) -> Optional[float]:
+        """returns the duration recorded for the feature at the given path"""
+        if path is None:
+            return None
+
+        return self.features.get(relative_key(path))
+
+    def estimate(self, path: Union[str, Path, None]) -> float:
+        """returns the duration recorded for the feature at the given
+        path or the average of all recorded durations otherwise"""
+        duration = self.get(path)
+        if duration is not None:
+            return duration
+
+        if not self.features:
+            return 0.0
+
+        return sum(self.features.values()) / len(self.features)
+
+    def record(self, feature: Feature, result: FeatureResult):
+        path = getattr(feature, "path", None)
+        if path is None:
+            return
+
+        path = relative_key(path)
+        self.features[path] = result.duration
+        for scenario_result in iterate_scenario_results(result):
+            location = getattr(scenario_result, "location", None)
+            if location is None:
+                continue
+            self.scenarios[f"{path}::{location.name}"] = scenario_result.duration
+
+    def save(self):
+        if self.readonly:
+            return
+
+        self.cache.save({"features": self.features, "scenarios": self.scenarios})
+
+
+def iterate_scenario_results(result) -> Iterable:
+    """yields the innermost results nested within the given result"""
+    pending = [result]
+    while pending:
+        result = pending.pop(0)
+        nested = getattr(result, "scenario_results", None)
+        if nested is None:
+            yield result
+        else:
+            pending[:0] = nested
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """parses a string such as ``"2/5"`` into a 2-item tuple of
+    :class:`int` indicating the shard number, starting at 1, and the
+    total of shards"""
+    try:
+        index, total = map(int, str(value).split("/"))
+    except ValueError:
+        raise ValueError(f"{repr(value)} is not a shard in the form K/N, e.g.: 1/4")
+
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"{repr(value)} must satisfy 1 <= K <= N")
+
+    return index, total
+
+
+def shard_of(path: Union[str, Path], total: int) -> int:
+    """stable shard number, starting at 1, of the given path relative
+    to the current working directory"""
+    return zlib.crc32(relative_key(path).encode("utf-8")) % total + 1
+
+
+def select_shard(
+    paths: Iterable[Union[str, Path]],
+    shard: Tuple[int, int],
+    durations: Optional[Durations] = None,
+) -> List[Union[str, Path]]:
+    """returns the paths which belong to the given shard.
+
+    Each path is assigned by :func:`shard_of` unless durations are
+    given and contain a record for every path, in which case paths
+    are packed into balanced shards by :func:`balanced_buckets`.
+    Either way the assignment only depends on the given paths and
+    durations. Durations must therefore not change between the runs
+    of different shards, which is why the
+    :class:`~sure.runner.Runner` only balances shards by durations
+    read from a file given explicitly, see
+    :meth:`~sure.scheduler.Durations.read`.
+    """
+    index, total = shard
+    paths = sorted(paths, key=lambda path: Path(path).absolute().as_posix())
+    if durations is not None and paths and all(
+        durations.get(path) is not None for path in paths
+    ):
+        return balanced_buckets(paths, durations.get, total)[index - 1]
+
+    return [path for path in paths if shard_of(path, total) == index]
+
+
+def longest_first(items: Iterable[Item], duration_of: Callable[[Item], float]) -> List[Item]:
+    """sorts items by descending duration, stable among equal durations"""
+    return sorted(items, key=duration_of, reverse=True)
+
+
+def balanced_buckets(
+    items: Iterable[Item], duration_of: Callable[[Item], float], count: int
+) -> List[List[Item]]:
+    """packs items into ``count`` buckets whose sums of durations are
+    as close as possible to one another by assigning the longest
+    items first to the bucket with the lowest sum (LPT).
+    """
+    count = max(int(count), 1)
+    buckets = [[] for _ in range(count)]
+    totals = [(0.0, index) for index in range(count)]
+    for item in longest_first(items, duration_of):
+        total, index = heapq.heappop(totals)
+        buckets[index].append(item)
+        heapq.heappush(totals, (total + duration_of(item), index))
+
+    return buckets
+
+
+def schedule(
+    items: Iterable[Item],
+    duration_of: Callable[[Item], float],
+    mode: str = "path",
+    buckets: int = 1,
+) -> List[Item]:
+    """orders items according to one of :data:`SCHEDULES`:
+
+    - ``path`` - keeps the given order
+    - ``longest-first`` - descending duration
+    - ``balanced`` - interleaves the ``buckets`` balanced by
+      :func:`balanced_buckets` such that the first item of each
+      bucket comes first
+    """
+    items = list(items)
+    if mode == "path":
+        return items
+
+    if mode == "longest-first":
+        return longest_first(items, duration_of)
+
+    if mode == "balanced":
+        ordered = []
+        packed = balanced_buckets(items, duration_of, buckets)
+        for index in range(max(map(len, packed), default=0)):
+            ordered.extend(bucket[index] for bucket in packed if index < len(bucket))
+        return ordered
+
+    raise ValueError(f"unknown schedule {repr(mode)}, options are: {', '.join(SCHEDULES)}")
@@ -16,8 +16,22 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
 import sys
+import atexit
 import platform
+import threading
+import weakref
 from functools import cache
+from typing import Optional, TextIO
+from couleur import Shell
+
+# amount of characters buffered by :class:`~sure.terminal.BufferedShell`
+# beyond which they are written at once
+BATCH_SIZE = 64 * 1024
+# maximum amount of seconds during which characters remain buffered by
+# :class:`~sure.terminal.BufferedShell` when writing to a terminal and
+# to anything else, such as the log of a continuous integration job
+TTY_FLUSH_INTERVAL = 0.1
+FLUSH_INTERVAL = 1.0
 
 
 @cache
@@ -59,3 +73,108 @@ def green(msg):
     if not has_ansi_support():
         return msg
     return r"\033[1;32m{0}\033[0m".format(msg)
+
+
+def isatty(stream: TextIO) -> bool:
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+# instances of :class:`~sure.terminal.BufferedShell` whose buffered
+# text is written before the interpreter exits
+buffered_shells = weakref.WeakSet()
+
+
+@atexit.register
+def flush_buffered_shells():
+    for shell in list(buffered_shells):
+        shell.flush()
+
+
+class BufferedShell(Shell):
+    """:class:`couleur.Shell` whose printers, such as ``bold_green()``,
+    accumulate text in memory rather than writing it right away. The
+    accumulated text is written into the given output, which defaults
+    to :data:`sys.stdout`, at once as soon as it exceeds
+    :data:`~sure.terminal.BATCH_SIZE` characters or within
+    :data:`~sure.terminal.FLUSH_INTERVAL` seconds of being printed,
+    or :data:`~sure.terminal.TTY_FLUSH_INTERVAL` seconds when the
+    output is a terminal, whichever happens first.
+
+    Printers are created once per color rather than once per call and
+    ANSI escape sequences are not generated at all unless the output
+    is a terminal and the environment variable ``SURE_NO_COLORS`` is
+    not set.
+    """
+
+    def __init__(
+        self,
+        output: Optional[TextIO] = None,
+        batch_size: int = BATCH_SIZE,
+        interval: Optional[float] = None,
+    ):
+        output = output or sys.stdout
+        colored = isatty(output) and not os.getenv("SURE_NO_COLORS")
+        if interval is None:
+            interval = colored and TTY_FLUSH_INTERVAL or FLUSH_INTERVAL
+
+        self.stream = output
+        self.batch_size = batch_size
+        self.interval = interval
+        self.buffer = []
+        self.buffered = 0
+        self.timer = None
+        self.lock = threading.RLock()
+        super().__init__(output=self, disabled=not colored)
+        self.printers = {}
+        buffered_shells.add(self)
+
+    def __getattr__(self, attr):
+        printers = self.__dict__.get("printers")
+        if printers is None or attr.startswith("_"):
+            return super().__getattr__(attr)
+
+        printer = printers.get(attr)
+        if printer is None:
+            printer = printers[attr] = super().__getattr__(attr)
+
+        return printer
+
+    def indent(self):
+        super().indent()
+        self.printers.clear()
+
+    def dedent(self):
+        super().dedent()
+        self.printers.clear()
+
+    def write(self, data: str):
+        if not data:
+            return
+
+        with self.lock:
+            self.buffer.append(data)
+            self.buffered += len(data)
+            if self.buffered >= self.batch_size:
+                self.flush()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.interval, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+            if not self.buffer:
+                return
+
+            data = "".join(self.buffer)
+            self.buffer.clear()
+            self.buffered = 0
+            self.stream.write(data)
+            self.stream.flush()
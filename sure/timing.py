@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""monotonic high-resolution measurement of the time taken by
+callables, see :meth:`sure.AssertionBuilder.run_within`"""
+
+import time
+import math
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from sure.errors import WrongUsageError
+
+NANOSECONDS = {
+    "ns": 1,
+    "us": 1000,
+    "ms": 1000 * 1000,
+    "s": 1000 * 1000 * 1000,
+}
+
+
+def parse_limit(**units: Union[int, float]) -> int:
+    """returns the amount of nanoseconds described by a single
+    keyword-argument whose name is one of the keys of
+    :data:`~sure.timing.NANOSECONDS`, e.g.: ``parse_limit(ms=5)``
+    """
+    if len(units) != 1 or not set(units).issubset(NANOSECONDS):
+        raise WrongUsageError(
+            f"expected a single keyword-argument among {', '.join(NANOSECONDS)}, e.g.: ms=5 "
+            f"but got {', '.join(units) or 'none'}"
+        )
+
+    ((unit, value),) = units.items()
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+        raise WrongUsageError(f"{unit}={repr(value)} is not a positive number")
+
+    return int(value * NANOSECONDS[unit])
+
+
+def parse_percentile(percentile: Union[int, float, str]) -> float:
+    """returns the number of the given percentile which might be
+    written as ``95`` or ``"p95"``
+    """
+    value = percentile
+    if isinstance(value, str):
+        value = value.lower().lstrip("p")
+        try:
+            value = float(value)
+        except ValueError:
+            value = None
+
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or not 0 < value <= 100:
+        raise WrongUsageError(
+            f"{repr(percentile)} is not a percentile between 0 and 100, e.g.: 95 or \"p95\""
+        )
+
+    return value
+
+
+def percentile_of(samples: List[int], percentile: Union[int, float]) -> int:
+    """returns the nearest-rank percentile of the given samples"""
+    ordered = sorted(samples)
+    rank = math.ceil(percentile / 100.0 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def measure(
+    function: Callable,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+    warmup: int = 0,
+    repeat: int = 1,
+) -> List[int]:
+    """calls the given function ``warmup + repeat`` times and returns
+    the nanoseconds taken by each of the last ``repeat`` calls
+    """
+    kwargs = kwargs or {}
+    for _ in range(warmup):
+        function(*args, **kwargs)
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        function(*args, **kwargs)
+        samples.append(time.perf_counter_ns() - started)
+
+    return samples
+
+
+def format_nanoseconds(nanoseconds: Union[int, float]) -> str:
+    """returns a human-readable representation of the given amount of
+    nanoseconds in the largest unit wherein it is at least 1"""
+    for unit in ("s", "ms", "us"):
+        if nanoseconds >= NANOSECONDS[unit]:
+            return f"{nanoseconds / NANOSECONDS[unit]:.3f}{unit}"
+
+    return f"{nanoseconds:.0f}ns"
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""watch mode of :mod:`sure`: keeps the :class:`~sure.runner.Runner`
+resident and re-runs only the test modules affected by files changed
+since the previous run.
+
+Changes are detected by polling the modification time of candidate
+test modules and of the files they transitively import, see
+:class:`~sure.loader.dependencies.DependencyGraph`. Modules which
+import changed files are removed from :data:`sys.modules` such that
+they are executed again while every other module already imported,
+e.g.: third-party libraries, is reused.
+"""
+import os
+import sys
+import time
+import traceback
+
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+
+from sure.loader import __MODULES__, __MODULE_SPECS__
+from sure.loader.dependencies import DependencyGraph, get_dependency_graph
+from sure.runtime import FeatureResultSet
+
+
+class Watcher(object):
+    """Runs the test modules found within ``lookup_paths`` once and
+    then again whenever they or the files which they import change"""
+
+    def __init__(
+        self,
+        runner,
+        lookup_paths: Iterable[Union[str, Path]],
+        interval: float = 0.5,
+        graph: Optional[DependencyGraph] = None,
+    ):
+        self.runner = runner
+        self.lookup_paths = list(lookup_paths)
+        self.interval = interval
+        self.graph = graph or get_dependency_graph()
+        self.mtimes = None
+
+    def __repr__(self):
+        return f"<Watcher {self.lookup_paths}>"
+
+    def find_candidate_paths(self) -> List[Path]:
+        return [
+            Path(path).absolute()
+            for path in self.runner.find_candidate_paths(self.lookup_paths)
+        ]
+
+    def snapshot(self, paths: Iterable[Path]) -> Dict[str, int]:
+        """returns the modification time in nanoseconds of the given
+        paths and of every file which they transitively import, keyed
+        by absolute path"""
+        mtimes = {}
+        pending = [str(path) for path in paths]
+        while pending:
+            path = pending.pop()
+            if path in mtimes:
+                continue
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            pending.extend(self.graph.dependencies_of(path))
+
+        return mtimes
+
+    def changes(self, mtimes: Dict[str, int]) -> Set[str]:
+        """returns the paths which were added, removed or modified
+        since :attr:`mtimes` was last recorded"""
+        previous = self.mtimes or {}
+        return set(
+            path
+            for path in set(mtimes).union(previous)
+            if mtimes.get(path) != previous.get(path)
+        )
+
+    def invalidate(self, changed: Set[str]):
+        """removes modules which are changed or which transitively
+        import changed files from :data:`sys.modules` and from the
+        modules tracked by :mod:`sure.loader`"""
+        loaded = {}
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if path and os.path.abspath(path) in (self.mtimes or {}):
+                loaded.setdefault(os.path.abspath(path), []).append(name)
+
+        for path in self.graph.affected(list(loaded), changed.__contains__):
+            for name in loaded[path]:
+                module = sys.modules.pop(name, None)
+                __MODULES__.pop(name, None)
+                __MODULE_SPECS__.pop(module, None)
+
+    def poll(self) -> List[Path]:
+        """returns the candidate paths affected by files changed since
+        the previous poll after invalidating the stale modules, every
+        candidate path is returned in the first poll"""
+        paths = self.find_candidate_paths()
+        mtimes = self.snapshot(paths)
+        if self.mtimes is None:
+            self.mtimes = mtimes
+            return paths
+
+        changed = self.changes(mtimes)
+        if not changed:
+            return []
+
+        self.invalidate(changed)
+        self.mtimes = mtimes
+        self.graph.save()
+        return self.graph.affected(paths, changed.__contains__)
+
+    def run(self, paths: List[Path]) -> Optional[FeatureResultSet]:
+        """runs the given paths with a new instance of the reporter of
+        :attr:`runner` such that each run is reported from scratch.
+
+        Errors, including those which would otherwise exit the
+        process in "immediate" mode, are reported without interrupting
+        the watch.
+        """
+        self.runner.reporter = self.runner.reporter.__class__(self.runner)
+        # the context of the previous run refers to its reporter
+        self.runner.__dict__.pop("context", None)
+        try:
+            return self.runner.run(paths)
+        except (Exception, SystemExit):
+            traceback.print_exc()
+
+    def watch(
+        self,
+        iterations: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """polls for changes every :attr:`interval` seconds and runs
+        the affected test modules until interrupted or until the given
+        amount of ``iterations`` is reached"""
+        iteration = 0
+        while iterations is None or iteration < iterations:
+            if iteration:
+                sleep(self.interval)
+
+            paths = self.poll()
+            if paths:
+                self.run(paths)
+
+            iteration += 1
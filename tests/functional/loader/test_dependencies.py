@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"functional tests for :mod:`sure.loader.dependencies`"
+
+import os
+import tempfile
+from pathlib import Path
+from mock import patch
+from sure import expects
+from sure.cache import JSONCache
+from sure.loader.dependencies import DependencyGraph, get_changed_files
+
+
+def write_project(directory):
+    root = Path(directory)
+    root.joinpath("package", "sub").mkdir(parents=True)
+    root.joinpath("tests").mkdir()
+    root.joinpath("package", "__init__.py").write_text("")
+    root.joinpath("package", "sub", "__init__.py").write_text("")
+    root.joinpath("package", "models.py").write_text("import os\n")
+    root.joinpath("package", "sub", "views.py").write_text("from ..models import *\n")
+    root.joinpath("package", "utils.py").write_text("import json\n")
+    root.joinpath("tests", "test_views.py").write_text("from package.sub import views\n")
+    root.joinpath("tests", "test_utils.py").write_text("import package.utils\n")
+    return root
+
+
+def test_dependency_graph_dependencies_of():
+    "sure.loader.dependencies.DependencyGraph.dependencies_of() should resolve absolute and relative imports within its roots"
+
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as directory:
+        root = write_project(directory)
+        graph = DependencyGraph([directory], JSONCache("dependencies", directory=cache_dir))
+
+        expects(graph.dependencies_of(root.joinpath("tests", "test_views.py"))).to.equal(
+            [
+                str(root.joinpath("package", "__init__.py")),
+                str(root.joinpath("package", "sub", "__init__.py")),
+                str(root.joinpath("package", "sub", "views.py")),
+            ]
+        )
+        expects(graph.dependencies_of(root.joinpath("package", "sub", "views.py"))).to.equal(
+            [
+                str(root.joinpath("package", "__init__.py")),
+                str(root.joinpath("package", "models.py")),
+            ]
+        )
+        expects(graph.dependencies_of(root.joinpath("package", "models.py"))).to.be.empty
+
+
+def test_dependency_graph_is_updated_incrementally():
+    "sure.loader.dependencies.DependencyGraph should parse files only when their modification time or size changes"
+
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as directory:
+        root = write_project(directory)
+        path = root.joinpath("tests", "test_utils.py")
+        graph = DependencyGraph([directory], JSONCache("dependencies", directory=cache_dir))
+        expects(graph.dependencies_of(path)).to.have.length_of(2)
+        graph.save()
+
+        graph = DependencyGraph([directory], JSONCache("dependencies", directory=cache_dir))
+        with patch("sure.loader.dependencies.gather_imports_from_module_path") as gather_imports:
+            expects(graph.dependencies_of(path)).to.have.length_of(2)
+            gather_imports.assert_not_called()
+
+        path.write_text("import package\n")
+        expects(graph.dependencies_of(path)).to.equal([str(root.joinpath("package", "__init__.py"))])
+
+        graph = DependencyGraph([cache_dir], JSONCache("dependencies", directory=cache_dir))
+        expects(graph.files).to.be.empty
+
+
+def test_dependency_graph_affected():
+    "sure.loader.dependencies.DependencyGraph.affected() should return the paths which transitively import changed files"
+
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as directory:
+        root = write_project(directory)
+        graph = DependencyGraph([directory], JSONCache("dependencies", directory=cache_dir))
+        tests = [root.joinpath("tests", "test_utils.py"), root.joinpath("tests", "test_views.py")]
+
+        def changed(*names):
+            return lambda path: path in [str(root.joinpath(*name.split("/"))) for name in names]
+
+        expects(graph.affected(tests, changed("package/models.py"))).to.equal(tests[1:])
+        expects(graph.affected(tests, changed("package/utils.py"))).to.equal(tests[:1])
+        expects(graph.affected(tests, changed("package/__init__.py"))).to.equal(tests)
+        expects(graph.affected(tests, changed("tests/test_utils.py"))).to.equal(tests[:1])
+        expects(graph.affected(tests, changed())).to.be.empty
+
+
+def test_get_changed_files_since_modification_time_of_file():
+    "sure.loader.dependencies.get_changed_files() should consider files modified after the given file as changed"
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = write_project(directory)
+        marker = root.joinpath(".last-run")
+        marker.write_text("")
+        os.utime(marker, ns=(2000000000, 2000000000))
+        os.utime(root.joinpath("package", "utils.py"), ns=(1000000000, 1000000000))
+
+        is_changed = get_changed_files(str(marker))
+
+        expects(is_changed(str(root.joinpath("package", "utils.py")))).to.be.false
+        expects(is_changed(str(root.joinpath("package", "models.py")))).to.be.true
+        expects(is_changed(str(root.joinpath("missing.py")))).to.be.false
+
+
+def test_get_changed_files_since_git_ref():
+    "sure.loader.dependencies.get_changed_files() should consider files differing from the given git ref as changed"
+
+    is_changed = get_changed_files("HEAD")
+    expects(is_changed(__file__)).to.be.a(bool)
+    expects(get_changed_files).when.called_with("not-a-ref-of-sure").to.throw(ValueError)
@@ -336,3 +336,25 @@ def test_module_path_is_module_true_when_pointing_to_path_to_python_file():
 
     module_path = ModulePath(Path(__file__).parent)
     assert module_path.is_module() == True
+
+
+def test_loader_find_python_paths():
+    "sure.loader.loader.find_python_paths() finds paths of python files without importing them"
+
+    gawk_path = fake_packages_path.joinpath("unsure/gawk")
+    with patch("sure.loader.loader.load_python_path") as load_python_path:
+        paths = loader.find_python_paths(gawk_path, glob_pattern="*.py", excludes=["symptoms.py"])
+        load_python_path.assert_not_called()
+
+    expects(paths).to.equal(
+        [
+            gawk_path.joinpath("a.py"),
+            gawk_path.joinpath("b.py"),
+            gawk_path.joinpath("clanging.py"),
+            gawk_path.joinpath("clanging/__init__.py"),
+        ]
+    )
+    expects(loader.find_python_paths(gawk_path.joinpath("a.py"), glob_pattern="*.py")).to.equal(
+        [gawk_path.joinpath("a.py")]
+    )
+    expects(loader.find_python_paths(gawk_path.joinpath("a.py"), glob_pattern="*.txt")).to.be.empty
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"functional tests for :mod:`sure.loader.manifest`"
+
+import os
+import tempfile
+from pathlib import Path
+from mock import patch
+from sure import expects
+from sure.cache import JSONCache
+from sure.loader.manifest import DiscoveryManifest
+
+
+def test_discovery_manifest_list_directory():
+    "sure.loader.manifest.DiscoveryManifest.list_directory() should list directories only when their modification time changes"
+
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as directory:
+        Path(directory).joinpath("package").mkdir()
+        Path(directory).joinpath("test_a.py").write_text("")
+
+        manifest = DiscoveryManifest(JSONCache("discovery", directory=cache_dir))
+        expects(manifest.list_directory(directory)).to.equal((["package"], ["test_a.py"]))
+        expects(list(manifest.walk(directory))).to.have.length_of(2)
+        manifest.save()
+
+        manifest = DiscoveryManifest(JSONCache("discovery", directory=cache_dir))
+        with patch("sure.loader.manifest.os.scandir") as scandir:
+            expects(manifest.list_directory(directory)).to.equal((["package"], ["test_a.py"]))
+            expects(list(manifest.walk(directory))).to.equal(
+                [
+                    (directory, ["package"], ["test_a.py"]),
+                    (os.path.join(directory, "package"), [], []),
+                ]
+            )
+            scandir.assert_not_called()
+
+        Path(directory).joinpath("test_b.py").write_text("")
+        os.utime(directory, ns=(0, 0))
+        expects(manifest.list_directory(directory)).to.equal((["package"], ["test_a.py", "test_b.py"]))
+
+
+def test_discovery_manifest_class_definitions():
+    "sure.loader.manifest.DiscoveryManifest.class_definitions() should parse files only when their modification time or size changes"
+
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("test_module.py")
+        path.write_text("import unittest\n\n\nclass TestCase(unittest.TestCase):\n    pass\n")
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        manifest = DiscoveryManifest(JSONCache("discovery", directory=cache_dir))
+        expects(manifest.class_definitions(path, key)).to.equal({"TestCase": (4, ("unittest.TestCase",))})
+        manifest.save()
+
+        manifest = DiscoveryManifest(JSONCache("discovery", directory=cache_dir))
+        with patch("sure.loader.manifest.gather_class_definitions_from_module_path") as gather:
+            expects(manifest.class_definitions(path, key)).to.equal({"TestCase": (4, ("unittest.TestCase",))})
+            gather.assert_not_called()
+
+            manifest.class_definitions(path, (stat.st_mtime_ns + 1, stat.st_size))
+            gather.assert_called_once_with(path)
+
+        path.unlink()
+        manifest.save()
+        expects(DiscoveryManifest(JSONCache("discovery", directory=cache_dir)).files).to.be.empty
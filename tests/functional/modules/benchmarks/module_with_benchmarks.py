@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import json
+
+
+def bench_sum():
+    sum(range(100))
+
+
+def test_sum():
+    assert sum(range(100)) == 4950, "sum of the first 100 numbers should be 4950"
+
+
+class BenchSerialization(object):
+    def setup(self):
+        self.document = {"name": "sure", "tags": ["testing", "benchmarks"]}
+
+    def bench_dumps(self):
+        json.dumps(self.document)
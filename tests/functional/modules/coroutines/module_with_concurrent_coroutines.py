@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import asyncio
+
+concurrency = "asyncio"
+concurrency_limit = 2
+
+running = set()
+max_running = []
+
+
+async def sleep_while_running(name):
+    running.add(name)
+    max_running.append(len(running))
+    await asyncio.sleep(0.2)
+    running.discard(name)
+
+
+async def test_concurrent_coroutine_a():
+    await sleep_while_running("a")
+
+
+async def test_concurrent_coroutine_b():
+    await sleep_while_running("b")
+
+
+def test_serial_function():
+    assert not running, "coroutines still running"
+
+
+async def test_concurrent_coroutine_c():
+    await sleep_while_running("c")
+
+
+async def test_concurrent_coroutine_d():
+    await sleep_while_running("d")
+    assert 1 == 2, "contrived concurrent failure"
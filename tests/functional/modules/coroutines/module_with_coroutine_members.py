@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import asyncio
+
+
+async def test_coroutine_success():
+    await asyncio.sleep(0)
+
+
+async def test_coroutine_failure():
+    await asyncio.sleep(0)
+    assert 1 == 2, "contrived coroutine failure"
+
+
+async def test_coroutine_error():
+    await asyncio.sleep(0)
+    raise RuntimeError("contrived coroutine error")
+
+
+class TestCoroutineMethods(object):
+    async def setup(self):
+        await asyncio.sleep(0)
+        self.loop = asyncio.get_running_loop()
+
+    async def test_setup_ran_within_the_same_loop(self):
+        await asyncio.sleep(0)
+        assert self.loop is asyncio.get_running_loop(), "setup and test ran within different event loops"
+
+    async def teardown(self):
+        await asyncio.sleep(0)
+        assert self.loop is asyncio.get_running_loop(), "teardown and setup ran within different event loops"
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+class ContrivedFailure(AssertionError):
+    def __init__(self, code: int, reason: str):
+        super().__init__(f"{code}: {reason}")
+
+
+def test_function_success():
+    pass
+
+
+def test_function_failure():
+    assert 1 == 2, "contrived failure"
+
+
+def test_function_custom_failure():
+    raise ContrivedFailure(1, "contrived custom failure")
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import time
+import threading
+
+concurrency = "threads"
+concurrency_limit = 4
+
+thread_names = set()
+
+
+def block(seconds=0.2):
+    thread_names.add(threading.current_thread().name)
+    time.sleep(seconds)
+
+
+def test_blocking_function_a():
+    block()
+
+
+def test_blocking_function_b():
+    block()
+
+
+def test_blocking_function_c():
+    block()
+    assert 1 == 2, "contrived threaded failure"
+
+
+class TestBlockingMethods(object):
+    def setup(self):
+        self.thread = threading.current_thread()
+
+    def test_within_the_thread_of_setup(self):
+        block()
+        assert self.thread is threading.current_thread(), "setup and test ran within different threads"
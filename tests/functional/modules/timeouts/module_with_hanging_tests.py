@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import time
+import asyncio
+
+from sure import timeout
+
+
+@timeout(0.1)
+def test_sleeps_beyond_its_timeout():
+    time.sleep(5)
+
+
+@timeout(1)
+def test_returns_within_its_timeout():
+    time.sleep(0.01)
+
+
+def test_sleeps_without_timeout():
+    time.sleep(0.3)
+
+
+@timeout(0.1)
+async def test_awaits_beyond_its_timeout():
+    await asyncio.sleep(5)
+
+
+@timeout(0.1)
+class TestHangingMethods(object):
+    def test_sleeps_beyond_the_timeout_of_its_class(self):
+        time.sleep(5)
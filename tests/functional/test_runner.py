@@ -17,12 +17,20 @@
 "functional tests for :mod:`sure.runner`"
 
 import os
+import sys
+import pickle
+import pstats
+import tempfile
 import unittest
 from pathlib import Path
+from xml.etree import ElementTree
+from collections import defaultdict
+from mock import patch
 from sure import expects
 from sure.doubles.dummies import anything_of_type
 from sure.errors import collapse_path
-from sure.runner import Runner
+from sure.loader import loader
+from sure.runner import Runner, execute_feature_in_worker
 from sure.runtime import (
     Feature,
     FeatureResult,
@@ -35,11 +43,17 @@ from sure.runtime import (
     RuntimeContext,
 )
 from sure.reporters import test
+from sure.cache import JSONCache
+from sure.scheduler import Durations, relative_key
 
 modules_path = Path(__file__).parent.joinpath("modules")
 success_modules_path = modules_path.joinpath("success")
 failure_modules_path = modules_path.joinpath("failure")
 error_modules_path = modules_path.joinpath("error")
+coroutine_modules_path = modules_path.joinpath("coroutines")
+thread_modules_path = modules_path.joinpath("threads")
+timeout_modules_path = modules_path.joinpath("timeouts")
+benchmark_modules_path = modules_path.joinpath("benchmarks")
 
 
 def test_runner_load_features_from_module_containing_unittest_cases():
@@ -324,3 +338,590 @@ def test_runner_execute_success_tests():
             "on_finish": [(anything_of_type(float), anything_of_type(RuntimeContext))],
         }
     )
+
+
+def test_execute_feature_in_worker():
+    "sure.runner.execute_feature_in_worker() should run the features of the given path and return picklable features, events and results"
+
+    options = RuntimeOptions(immediate=False, glob_pattern="**module_with*.py")
+    outcome = execute_feature_in_worker(
+        Path(os.getcwd()),
+        success_modules_path.joinpath("module_with_function_members.py"),
+        options,
+    )
+    outcome = pickle.loads(pickle.dumps(outcome))
+    expects(outcome).to.have.length_of(1)
+
+    ((feature, events, result),) = outcome
+    expects(feature).to.be.a(Feature)
+    expects(feature.module).to.be.none
+    expects(feature.title).to.equal(
+        "tests.functional.modules.success.module_with_function_members"
+    )
+    expects(result).to.be.a(FeatureResult)
+    expects(result.is_success).to.be.true
+    expects(result.scenario_results).to.have.length_of(6)
+    expects(result.scenario_results[0]).to.be.a(ScenarioResultSet)
+    expects([(name, args[0].name) for name, args in events]).to.equal(
+        [
+            ("on_scenario", "test_function_A"),
+            ("on_scenario_done", "test_function_A"),
+            ("on_scenario", "test_function_B"),
+            ("on_scenario_done", "test_function_B"),
+            ("on_scenario", "test_function_C"),
+            ("on_scenario_done", "test_function_C"),
+            ("on_scenario", "test_function_X"),
+            ("on_scenario_done", "test_function_X"),
+            ("on_scenario", "test_function_Y"),
+            ("on_scenario_done", "test_function_Y"),
+            ("on_scenario", "test_function_Z"),
+            ("on_scenario_done", "test_function_Z"),
+        ]
+    )
+
+
+def execute_and_gather_events(lookup_paths, workers, **options):
+    runner = Runner(
+        base_path=Path(os.getcwd()),
+        reporter="test",
+        options=RuntimeOptions(
+            immediate=False, glob_pattern="**module_with*.py", workers=workers, **options
+        ),
+    )
+    with patch("sure.reporters.test.events", new_callable=lambda: defaultdict(list)) as events:
+        try:
+            result = runner.execute(lookup_paths)
+        except Exception as error:
+            result = error
+
+        return result, dict(
+            (name, [occurrence[1:] for occurrence in occurrences])
+            for name, occurrences in events.items()
+            if name != "on_finish"
+        )
+
+
+def test_runner_execute_success_tests_with_workers():
+    "sure.runner.Runner.execute(path) with more than one worker should report the same events as when running serially"
+
+    serial_result_set, serial_events = execute_and_gather_events([success_modules_path], workers=1)
+    parallel_result_set, parallel_events = execute_and_gather_events([success_modules_path], workers=2)
+
+    expects(parallel_result_set).to.be.a(FeatureResultSet)
+    expects(parallel_result_set).to.have.property("feature_results").being.length_of(4)
+    expects(parallel_result_set).to.have.property("failed_features").being.empty
+    expects(parallel_result_set).to.have.property("errored_features").being.empty
+    expects(parallel_events).to.equal(serial_events)
+
+
+def test_runner_execute_failure_and_error_tests_with_workers():
+    "sure.runner.Runner.execute(path) with more than one worker should report failures and errors of user-defined exception classes just like when running serially"
+
+    lookup_paths = [failure_modules_path, error_modules_path]
+    serial_result_set, serial_events = execute_and_gather_events(lookup_paths, workers=1)
+    parallel_result_set, parallel_events = execute_and_gather_events(lookup_paths, workers=2)
+
+    expects(parallel_result_set).to.be.a(FeatureResultSet)
+    expects(parallel_result_set).to.have.property("failed_features").being.length_of(1)
+    expects(parallel_result_set).to.have.property("errored_features").being.length_of(1)
+    expects(parallel_events).to.equal(serial_events)
+    expects(parallel_events["on_failure"]).to.equal(
+        [
+            ("test_function_custom_failure", "failure"),
+            ("test_function_failure", "failure"),
+        ]
+    )
+    expects(parallel_events["on_error"]).to.equal(
+        [
+            ("test_function_custom_error", "error"),
+        ]
+    )
+    expects(parallel_events["on_feature_done"]).to.equal(
+        [
+            ("tests.functional.modules.failure.module_with_failing_function_members", "failure"),
+            ("tests.functional.modules.error.module_with_erroring_function_members", "error"),
+        ]
+    )
+
+
+def test_runner_execute_with_workers_reraises_errors_of_workers():
+    "sure.runner.Runner.execute(path) with more than one worker should report the features of other workers and then re-raise errors which occur within a worker"
+
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory).joinpath("module_with_syntax_error.py").write_text("def test_syntax_error(:\n")
+        result, events = execute_and_gather_events(
+            [Path(directory), success_modules_path], workers=2
+        )
+
+    expects(result).to.be.a(SyntaxError)
+    expects(result.__cause__).to.be.none
+    expects(events["on_feature_done"]).to.have.length_of(4)
+
+
+def test_runner_records_durations_and_schedules_longest_first():
+    "sure.runner.Runner.execute(path) should record durations of features and order them longest-first in later runs when so scheduled"
+
+    with tempfile.TemporaryDirectory() as directory:
+        durations = Durations(JSONCache("durations", directory=directory))
+        runner = Runner(
+            base_path=Path(os.getcwd()),
+            reporter="test",
+            options=RuntimeOptions(immediate=False, glob_pattern="**module_with*.py"),
+        )
+        runner.durations = durations
+        feature_result_set = runner.execute([success_modules_path])
+
+        expects(feature_result_set.duration).to.be.greater_than(0)
+        for feature_result in feature_result_set.feature_results:
+            expects(feature_result.duration).to.be.greater_than(0)
+
+        recorded = Durations(JSONCache("durations", directory=directory))
+        expects(recorded.features).to.have.length_of(4)
+
+        paths = sorted(recorded.features)
+        recorded.features = dict((path, float(index)) for index, path in enumerate(paths))
+        runner = Runner(
+            base_path=Path(os.getcwd()),
+            reporter="test",
+            options=RuntimeOptions(
+                immediate=False, glob_pattern="**module_with*.py", schedule="longest-first"
+            ),
+        )
+        runner.durations = recorded
+        features = runner.load_features([success_modules_path])
+        expects([relative_key(feature.path) for feature in features]).to.equal(list(reversed(paths)))
+
+
+def test_runner_find_candidates_of_shards():
+    "sure.runner.Runner.find_candidates(path) should only import the modules which belong to the given shard"
+
+    def find_candidate_names(shard):
+        runner = Runner(
+            base_path=Path(os.getcwd()),
+            reporter="test",
+            options=RuntimeOptions(
+                immediate=False, glob_pattern="**module_with*.py", shard=shard
+            ),
+        )
+        runner.durations = Durations(JSONCache("durations", directory=directory))
+        with patch("sure.runner.loader.load_recursive", wraps=loader.load_recursive) as load_recursive:
+            modules = runner.find_candidates([success_modules_path])
+
+        if shard is not None:
+            loaded_paths = [call.args[0] for call in load_recursive.call_args_list]
+            expects(loaded_paths).to.equal(runner.find_candidate_paths([success_modules_path]))
+            expects(loaded_paths).to.have.length_of(len(modules))
+        return sorted(module.__name__ for module in modules)
+
+    with tempfile.TemporaryDirectory() as directory:
+        everything = find_candidate_names(None)
+        shards = [find_candidate_names((index, 2)) for index in (1, 2)]
+
+    expects(everything).to.have.length_of(4)
+    expects(shards[0]).to_not.be.empty
+    expects(shards[1]).to_not.be.empty
+    expects(sorted(shards[0] + shards[1])).to.equal(everything)
+
+
+def test_runner_execute_shards_with_workers():
+    "sure.runner.Runner.execute(path) with shards and more than one worker should run every module within exactly one shard"
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorded = Durations(JSONCache("shard-durations", directory=directory))
+        for index, path in enumerate(sorted(success_modules_path.glob("module_with*.py")), start=1):
+            recorded.features[relative_key(path)] = float(index)
+        recorded.save()
+
+        with patch.dict(os.environ, {"SURE_CACHE_DIR": directory}):
+            _, serial_events = execute_and_gather_events([success_modules_path], workers=1)
+            shards = [
+                execute_and_gather_events(
+                    [success_modules_path],
+                    workers=2,
+                    shard=(index, 3),
+                    shard_durations=recorded.cache.path,
+                )[1]
+                for index in (1, 2, 3)
+            ]
+
+    everything = sorted(title for (title,) in serial_events["on_feature"])
+    executed = sorted(title for events in shards for (title,) in events.get("on_feature", []))
+    expects(everything).to.have.length_of(4)
+    expects(executed).to.equal(everything)
+
+
+def test_runner_select_stable_shards_across_runs():
+    "sure.runner.Runner.find_candidate_paths(path) should select the same shards regardless of the durations recorded by previous runs"
+
+    def find_shards():
+        shards = []
+        for index in (1, 2, 3):
+            runner = Runner(
+                base_path=Path(os.getcwd()),
+                reporter="test",
+                options=RuntimeOptions(
+                    immediate=False, glob_pattern="**module_with*.py", shard=(index, 3)
+                ),
+            )
+            shards.append(runner.find_candidate_paths([success_modules_path]))
+        return shards
+
+    with tempfile.TemporaryDirectory() as directory:
+        with patch.dict(os.environ, {"SURE_CACHE_DIR": directory}):
+            before = find_shards()
+            for index in (1, 2, 3):
+                execute_and_gather_events([success_modules_path], workers=1, shard=(index, 3))
+            expects(Durations().features).to.have.length_of(4)
+            after = find_shards()
+
+    expects(after).to.equal(before)
+
+
+def test_runner_shard_durations_are_only_read():
+    "sure.runner.Runner.execute(path) should balance shards by the durations given as shard_durations without writing them"
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorded = Durations(JSONCache("shard-durations", directory=directory))
+        paths = sorted(success_modules_path.glob("module_with*.py"))
+        for index, path in enumerate(paths, start=1):
+            recorded.features[relative_key(path)] = float(index)
+        recorded.save()
+        contents = recorded.cache.path.read_text()
+
+        with patch.dict(os.environ, {"SURE_CACHE_DIR": directory}):
+            runner = Runner(
+                base_path=Path(os.getcwd()),
+                reporter="test",
+                options=RuntimeOptions(
+                    immediate=False,
+                    glob_pattern="**module_with*.py",
+                    shard=(1, 2),
+                    shard_durations=str(recorded.cache.path),
+                ),
+            )
+            runner.execute([success_modules_path])
+
+        expects(recorded.cache.path.read_text()).to.equal(contents)
+        expects(Path(directory).joinpath("durations.json").exists()).to.be.true
+        expects(sorted(runner.find_candidate_paths([success_modules_path]))).to.equal(
+            [paths[0], paths[3]]
+        )
+
+
+def test_runner_find_candidates_changed_since():
+    "sure.runner.Runner.find_candidates(path) should only import the modules affected by files changed since the given reference"
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        root.joinpath("helpers_for_changed_since.py").write_text("VALUE = 1\n")
+        root.joinpath("module_with_changed_dependency.py").write_text("from .helpers_for_changed_since import VALUE\n\ndef test_value():\n    assert VALUE\n")
+        root.joinpath("module_with_unchanged_code.py").write_text("def test_nothing():\n    pass\n")
+        marker = root.joinpath("last-run")
+        marker.write_text("")
+        for path in root.iterdir():
+            os.utime(path, ns=(1000000000, 1000000000))
+        os.utime(marker, ns=(2000000000, 2000000000))
+
+        runner = Runner(
+            base_path=Path(os.getcwd()),
+            reporter="test",
+            options=RuntimeOptions(
+                immediate=False, glob_pattern="**module_with*.py", changed_since=str(marker)
+            ),
+        )
+        with patch.dict(os.environ, {"SURE_CACHE_DIR": directory}):
+            expects(runner.find_candidate_paths([root])).to.be.empty
+
+            root.joinpath("helpers_for_changed_since.py").write_text("VALUE = 2\n")
+            expects(runner.find_candidate_paths([root])).to.equal(
+                [root.joinpath("module_with_changed_dependency.py")]
+            )
+
+
+def test_runner_execute_coroutine_tests():
+    "sure.runner.Runner.execute(path) should await coroutines of tests, setup and teardown within the event loop of each feature"
+
+    result, events = execute_and_gather_events(
+        [coroutine_modules_path.joinpath("module_with_coroutine_members.py")], workers=1
+    )
+
+    expects(result).to.be.a(FeatureResultSet)
+    expects(events["on_failure"]).to.equal([("test_coroutine_failure", "failure")])
+    expects(events["on_error"]).to.equal([("test_coroutine_error", "error")])
+    expects(events["on_scenario_done"]).to.equal(
+        [
+            ("TestCoroutineMethods", "ok"),
+            ("TestCoroutineMethods", "ok"),
+            ("TestCoroutineMethods", "ok"),
+            ("test_coroutine_error", "error"),
+            ("test_coroutine_failure", "failure"),
+            ("test_coroutine_success", "ok"),
+        ]
+    )
+
+
+def test_runner_execute_coroutine_tests_concurrently():
+    "sure.runner.Runner.execute(path) should run coroutines of tests concurrently up to the limit of modules which declare concurrency = \"asyncio\" and report them in order"
+
+    path = coroutine_modules_path.joinpath("module_with_concurrent_coroutines.py")
+    result, events = execute_and_gather_events([path], workers=1)
+
+    expects(result.feature_results).to.have.length_of(1)
+    expects(result.duration).to.be.lower_than(0.7)
+    expects(events["on_scenario"]).to.equal(
+        [
+            ("test_concurrent_coroutine_a",),
+            ("test_concurrent_coroutine_b",),
+            ("test_concurrent_coroutine_c",),
+            ("test_concurrent_coroutine_d",),
+            ("test_serial_function",),
+        ]
+    )
+    expects(events["on_scenario_done"]).to.equal(
+        [
+            ("test_concurrent_coroutine_a", "ok"),
+            ("test_concurrent_coroutine_b", "ok"),
+            ("test_concurrent_coroutine_c", "ok"),
+            ("test_concurrent_coroutine_d", "failure"),
+            ("test_serial_function", "ok"),
+        ]
+    )
+    expects(events["on_failure"]).to.equal([("test_concurrent_coroutine_d", "failure")])
+
+    module = sys.modules["tests.functional.modules.coroutines.module_with_concurrent_coroutines"]
+    expects(max(module.max_running)).to.equal(2)
+
+
+def test_runner_execute_tests_in_threads():
+    "sure.runner.Runner.execute(path) should run the scenarios of modules which declare concurrency = \"threads\" within a pool of threads and report them in order"
+
+    path = thread_modules_path.joinpath("module_with_blocking_functions.py")
+    result, events = execute_and_gather_events([path], workers=1)
+
+    expects(result.feature_results).to.have.length_of(1)
+    expects(result.duration).to.be.lower_than(0.6)
+    expects(events["on_scenario"]).to.equal(
+        [
+            ("TestBlockingMethods",),
+            ("test_blocking_function_a",),
+            ("test_blocking_function_b",),
+            ("test_blocking_function_c",),
+        ]
+    )
+    expects(events["on_scenario_done"]).to.equal(
+        [
+            ("TestBlockingMethods", "ok"),
+            ("TestBlockingMethods", "ok"),
+            ("test_blocking_function_a", "ok"),
+            ("test_blocking_function_b", "ok"),
+            ("test_blocking_function_c", "failure"),
+        ]
+    )
+    expects(events["on_failure"]).to.equal([("test_blocking_function_c", "failure")])
+
+    module = sys.modules["tests.functional.modules.threads.module_with_blocking_functions"]
+    expects(len(module.thread_names)).to.be.greater_than(1)
+
+
+def test_runner_execute_tests_with_timeouts():
+    "sure.runner.Runner.execute(path) should interrupt tests which run for longer than given to :func:`sure.timeout` and report them as timed out"
+
+    path = timeout_modules_path.joinpath("module_with_hanging_tests.py")
+    result, events = execute_and_gather_events([path], workers=1)
+
+    expects(result.duration).to.be.lower_than(2)
+    expects(events["on_scenario_done"]).to.equal(
+        [
+            ("TestHangingMethods", "timeout"),
+            ("test_awaits_beyond_its_timeout", "timeout"),
+            ("test_returns_within_its_timeout", "ok"),
+            ("test_sleeps_beyond_its_timeout", "timeout"),
+            ("test_sleeps_without_timeout", "ok"),
+        ]
+    )
+    expects(events["on_timeout"]).to.equal(
+        [
+            ("TestHangingMethods", "timeout"),
+            ("test_awaits_beyond_its_timeout", "timeout"),
+            ("test_sleeps_beyond_its_timeout", "timeout"),
+        ]
+    )
+    expects(events).to_not.have.key("on_error")
+
+
+def test_runner_execute_tests_with_timeout_option():
+    "sure.runner.Runner.execute(path) should interrupt tests which run for longer than given to :class:`~sure.runtime.RuntimeOptions` as ``timeout``, within worker processes as well"
+
+    path = timeout_modules_path.joinpath("module_with_hanging_tests.py")
+    result, events = execute_and_gather_events([path], workers=2, timeout=0.1)
+
+    expects(result.is_error).to.be.true
+    expects(events["on_timeout"]).to.equal(
+        [
+            ("TestHangingMethods", "timeout"),
+            ("test_awaits_beyond_its_timeout", "timeout"),
+            ("test_sleeps_beyond_its_timeout", "timeout"),
+            ("test_sleeps_without_timeout", "timeout"),
+        ]
+    )
+
+
+def test_runner_execute_benchmarks():
+    "sure.runner.Runner.execute(path) should measure functions and methods whose names start with `bench', report their statistics and record them in the baseline"
+
+    path = benchmark_modules_path.joinpath("module_with_benchmarks.py")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with patch.dict(os.environ, {"SURE_CACHE_DIR": cache_dir}):
+            result, events = execute_and_gather_events([path], workers=1)
+            baseline = JSONCache("benchmarks").load()["benchmarks"]
+
+    expects(result.is_success).to.be.true
+    expects(events["on_benchmark"]).to.equal([("bench_dumps", "ok"), ("bench_sum", "ok")])
+    expects(events["on_scenario_done"]).to.equal(
+        [
+            ("BenchSerialization", "ok"),
+            ("BenchSerialization", "ok"),
+            ("bench_sum", "ok"),
+            ("test_sum", "ok"),
+        ]
+    )
+    expects(baseline).to.have.key(
+        "tests.functional.modules.benchmarks.module_with_benchmarks.bench_sum"
+    )
+    statistics = baseline["tests.functional.modules.benchmarks.module_with_benchmarks.BenchSerialization.bench_dumps"]
+    expects(statistics["mean"]).to.be.greater_than(0)
+    expects(statistics["iterations"]).to.be.greater_than(1)
+    expects(sorted(statistics)).to.equal(["iterations", "mean", "min", "ops_per_second", "stddev"])
+
+
+def test_runner_execute_benchmarks_regressed():
+    "sure.runner.Runner.execute(path) should fail benchmarks which regress by more than the threshold in relation to the baseline, within worker processes as well"
+
+    path = benchmark_modules_path.joinpath("module_with_benchmarks.py")
+    key = "tests.functional.modules.benchmarks.module_with_benchmarks.bench_sum"
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with patch.dict(os.environ, {"SURE_CACHE_DIR": cache_dir}):
+            JSONCache("benchmarks").save({"benchmarks": {key: {"mean": 1.0}}})
+            result, events = execute_and_gather_events([path], workers=2)
+            baseline = JSONCache("benchmarks").load()["benchmarks"]
+
+    expects(result.is_failure).to.be.true
+    expects(str(result.failure)).to.match(
+        r"^benchmark bench_sum regressed by [0-9.]+%, from 1ns to .+ per iteration, which exceeds the threshold of 20%$"
+    )
+    expects(events["on_failure"]).to.equal([("bench_sum", "failure")])
+    expects(events["on_benchmark"]).to.equal([("bench_dumps", "ok"), ("bench_sum", "failure")])
+    expects(baseline[key]).to.equal({"mean": 1.0})
+
+
+def test_runner_execute_with_profile():
+    "sure.runner.Runner.execute(path) should profile each test and aggregate the statistics into the file given to :class:`~sure.runtime.RuntimeOptions` as ``profile``, within worker processes as well"
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("sure.prof")
+        result, events = execute_and_gather_events(
+            [success_modules_path.joinpath("module_with_function_members.py")],
+            workers=2,
+            profile=str(path),
+        )
+        stats = pstats.Stats(str(path))
+
+    expects(result.is_success).to.be.true
+    profiles = [
+        scenario_result.profile
+        for feature_result in result.feature_results
+        for scenario_result_set in feature_result.scenario_results
+        for scenario_result in scenario_result_set.scenario_results
+    ]
+    expects(profiles).to.have.length_of(6)
+    expects(all(profile.profiled for profile in profiles)).to.be.true
+    expects(
+        sorted(function[2] for function in stats.stats if function[2].startswith("test_function_"))
+    ).to.equal(
+        [
+            "test_function_A",
+            "test_function_B",
+            "test_function_C",
+            "test_function_X",
+            "test_function_Y",
+            "test_function_Z",
+        ]
+    )
+
+
+def test_runner_execute_with_trace_memory():
+    "sure.runner.Runner.execute(path) should measure the peak of memory allocated by each test as well as the memory it retained when :class:`~sure.runtime.RuntimeOptions` has ``trace_memory``"
+
+    import tracemalloc
+
+    result, events = execute_and_gather_events(
+        [modules_path.joinpath("memory", "module_with_allocations.py")],
+        workers=1,
+        trace_memory=True,
+    )
+
+    expects(result.is_success).to.be.true
+    expects(tracemalloc.is_tracing()).to.be.false
+    temporary, retaining = [
+        scenario_result.memory
+        for feature_result in result.feature_results
+        for scenario_result_set in feature_result.scenario_results
+        for scenario_result in scenario_result_set.scenario_results
+    ]
+    megabytes = 1024 * 1024
+    expects(temporary.peak).to.be.greater_than_or_equal_to(2 * megabytes)
+    expects(temporary.retained).to.be.lower_than(megabytes)
+    expects(retaining.peak).to.be.greater_than_or_equal_to(2 * megabytes)
+    expects(retaining.retained).to.be.greater_than_or_equal_to(2 * megabytes)
+
+
+def test_runner_execute_with_junit_reporter():
+    "sure.runner.Runner.execute(path) with the junit reporter should write a testsuite per feature and a testcase per scenario into the report file, within worker processes as well"
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("junit.xml")
+        runner = Runner(
+            base_path=Path(os.getcwd()),
+            reporter="junit",
+            options=RuntimeOptions(
+                immediate=False, glob_pattern="**module_with*.py", workers=2, report_file=str(path)
+            ),
+        )
+        result = runner.execute(
+            [
+                success_modules_path.joinpath("module_with_function_members.py"),
+                failure_modules_path.joinpath("module_with_failing_function_members.py"),
+            ]
+        )
+        root = ElementTree.parse(path).getroot()
+
+    expects(result.is_failure).to.be.true
+    expects([suite.get("name") for suite in root.findall("testsuite")]).to.equal(
+        [
+            "tests.functional.modules.success.module_with_function_members",
+            "tests.functional.modules.failure.module_with_failing_function_members",
+        ]
+    )
+    succeeding, failing = root.findall("testsuite")
+    expects([testcase.get("name") for testcase in succeeding.findall("testcase")]).to.equal(
+        [
+            "test_function_A",
+            "test_function_B",
+            "test_function_C",
+            "test_function_X",
+            "test_function_Y",
+            "test_function_Z",
+        ]
+    )
+    expects(
+        dict(
+            (testcase.get("name"), [child.tag for child in testcase])
+            for testcase in failing.findall("testcase")
+        )
+    ).to.equal(
+        {
+            "test_function_success": [],
+            "test_function_failure": ["failure"],
+            "test_function_custom_failure": ["failure"],
+        }
+    )
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"functional tests for :mod:`sure.watcher`"
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from collections import defaultdict
+from mock import Mock as Spy, patch
+from sure import expects
+from sure.cache import JSONCache
+from sure.loader import __MODULES__
+from sure.loader.dependencies import DependencyGraph
+from sure.runner import Runner
+from sure.runtime import FeatureResultSet, RuntimeOptions
+from sure.watcher import Watcher
+
+
+def write_package(directory):
+    package = Path(directory).joinpath("watched_package")
+    package.mkdir()
+    package.joinpath("__init__.py").write_text("")
+    package.joinpath("helpers.py").write_text("VALUE = 1\n")
+    package.joinpath("module_with_helper.py").write_text(
+        "from .helpers import VALUE\n\n\ndef test_value():\n    assert VALUE == 1, \"VALUE changed\"\n"
+    )
+    package.joinpath("module_with_nothing.py").write_text(
+        "def test_nothing():\n    pass\n"
+    )
+    return package
+
+
+def create_watcher(directory, cache_dir):
+    runner = Runner(
+        base_path=Path(os.getcwd()),
+        reporter="test",
+        options=RuntimeOptions(immediate=False, glob_pattern="**module_with*.py"),
+    )
+    graph = DependencyGraph([directory], JSONCache("dependencies", directory=cache_dir))
+    return Watcher(runner, [directory], graph=graph)
+
+
+def test_watcher_poll_returns_affected_paths_and_invalidates_modules():
+    "sure.watcher.Watcher.poll() should return every candidate path at first and then only those affected by changed files"
+
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as directory, patch.object(sys, "path", [directory] + sys.path):
+        package = write_package(directory)
+        watcher = create_watcher(directory, cache_dir)
+
+        expects(watcher.poll()).to.equal(
+            [
+                package.joinpath("module_with_helper.py"),
+                package.joinpath("module_with_nothing.py"),
+            ]
+        )
+        with patch("sure.reporters.test.events", new_callable=lambda: defaultdict(list)):
+            result = watcher.run(watcher.find_candidate_paths())
+
+        expects(result).to.be.a(FeatureResultSet)
+        expects(result.is_success).to.be.true
+        expects(sys.modules).to.have.key("watched_package.helpers")
+        expects(watcher.poll()).to.be.empty
+
+        package.joinpath("helpers.py").write_text("VALUE = 2\n")
+        os.utime(package.joinpath("helpers.py"), ns=(1, 1))
+
+        expects(watcher.poll()).to.equal([package.joinpath("module_with_helper.py")])
+        expects(sys.modules).to_not.have.key("watched_package.helpers")
+        expects(sys.modules).to.have.key("watched_package")
+        expects(__MODULES__).to_not.have.key("watched_package.module_with_helper")
+
+        with patch("sure.reporters.test.events", new_callable=lambda: defaultdict(list)):
+            result = watcher.run([package.joinpath("module_with_helper.py")])
+
+        expects(result.is_failure).to.be.true
+
+    for name in [name for name in sys.modules if name.startswith("watched_package")]:
+        del sys.modules[name]
+
+
+def test_watcher_watch():
+    "sure.watcher.Watcher.watch() should run the candidate paths at first and then sleep between each poll"
+
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as directory:
+        Path(directory).joinpath("module_with_nothing.py").write_text(
+            "def test_nothing():\n    pass\n"
+        )
+        watcher = create_watcher(directory, cache_dir)
+        watcher.run = Spy(name="run")
+        sleep = Spy(name="sleep")
+
+        watcher.watch(iterations=3, sleep=sleep)
+
+        watcher.run.assert_called_once_with([Path(directory).joinpath("module_with_nothing.py")])
+        expects(sleep.call_count).to.equal(2)
+        sleep.assert_called_with(0.5)
+
+
+def test_watcher_run_reports_through_new_reporter():
+    "sure.watcher.Watcher.run() should report each run through the context of its own instance of the reporter"
+
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("module_with_nothing.py")
+        path.write_text("def test_nothing():\n    pass\n")
+        watcher = create_watcher(directory, cache_dir)
+
+        reporters = []
+        for _ in range(2):
+            with patch("sure.reporters.test.events", new_callable=lambda: defaultdict(list)):
+                watcher.run([path])
+            reporters.append(watcher.runner.reporter)
+            expects(watcher.runner.context.reporter).to.be(watcher.runner.reporter)
+
+    expects(reporters[0]).to_not.be(reporters[1])
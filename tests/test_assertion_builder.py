@@ -927,3 +927,126 @@ def test_list_should_equal_list_empty_or_different_size():
     expect(compare_with_longer_length).when.called.to.throw(
         "Y has 4 items whereas X has only 3"
     )
+
+
+def test_assertion_builder_defers_caller_location_and_helper_until_needed():
+    "AssertionBuilder() should not resolve the caller location nor build an AssertionHelper for successful assertions"
+
+    with mock.patch("sure.CallerLocation") as CallerLocation, mock.patch("sure.AssertionHelper") as AssertionHelper:
+        builder = AssertionBuilder("expect")
+        builder(4).to.equal(4)
+        builder([]).to.be.empty
+
+        CallerLocation.from_code.assert_not_called()
+        AssertionHelper.assert_not_called()
+
+
+def test_assertion_builder_resolves_caller_location_upon_failure():
+    "AssertionBuilder() should describe the source line of the caller when an assertion fails"
+
+    builder = AssertionBuilder("expect")
+    builders = []
+
+    def assertion_of_none():
+        builders.append(builder(7))
+        builders[0].to.be.none
+
+    expect(assertion_of_none).when.called.to.throw(
+        AssertionError, "builders.append(builder(7)) expects `7' to be None"
+    )
+    expect(builders[0].__caller__.name).to.equal("assertion_of_none")
+    expect(builders[0].__caller__.filename).to.equal(__file__)
+
+
+def test_assertion_builder_call_returns_independent_builders():
+    "AssertionBuilder() calls should return new builders rather than mutating the shared instance"
+
+    first = expect(1)
+    second = expect(2).when.called_with(3)
+
+    expect(first is expect).to.be.false
+    expect(isinstance(first, AssertionBuilder)).to.be.true
+    expect(first.actual).to.equal(1)
+    expect(first._callable_args).to.be.empty
+    expect(second.actual).to.equal(2)
+    expect(second._callable_args).to.equal((3,))
+    expect(expect.actual).to.be.none
+    expect(setattr).when.called_with(first, "arbitrary", 1).to.throw(AttributeError)
+
+
+def test_assertion_builder_concurrent_assertions():
+    "AssertionBuilder() should keep assertions of concurrent threads independent of each other"
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    def assert_many(value):
+        for _ in range(2000):
+            builder = expect(value)
+            time.sleep(0)
+            builder.to.equal(value)
+
+        return value
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        expect(list(pool.map(assert_many, range(8)))).to.equal(list(range(8)))
+
+
+def test_assertion_builder_run_within():
+    "expect(callable).to.run_within(ms=N) should measure the time taken by calls to the callable, optionally at a percentile of repeated calls after warmup"
+
+    calls = []
+
+    def sleepy(seconds):
+        calls.append(seconds)
+        time.sleep(seconds)
+
+    expect(sleepy).when.called_with(0).to.run_within(s=1, warmup=2, repeat=3, percentile="p95")
+    expect(calls).to.have.length_of(5)
+
+    expect(sleepy).when.called_with(0.01).to_not.run_within(ms=1)
+    expect(expect(sleepy).when.called_with(0.01).to.run_within).when.called_with(us=10).to.throw(
+        AssertionError, re.compile(r"`sleepy' should run within 10[.]000us but took [0-9.]+ms at p100 of 1 call$")
+    )
+    expect(expect(sleepy).when.called_with(0).to_not.run_within).when.called_with(s=1, repeat=2, percentile=50).to.throw(
+        AssertionError, re.compile(r"`sleepy' should not run within 1[.]000s but took .+ at p50 of 2 calls$")
+    )
+
+
+def test_assertion_builder_run_within_wrong_usage():
+    "expect(callable).to.run_within() should raise WrongUsageError when given wrong arguments"
+
+    from sure.errors import WrongUsageError
+
+    expect(expect(1).to.run_within).when.called_with(ms=1).to.throw(
+        WrongUsageError, "1 should be callable in order to measure how long it runs"
+    )
+    expect(expect(time.time).to.run_within).when.called_with(ms=1, minutes=2).to.throw(
+        WrongUsageError, "expected a single keyword-argument among ns, us, ms, s, e.g.: ms=5 but got ms, minutes"
+    )
+    expect(expect(time.time).to.run_within).when.called_with(ms=-1).to.throw(
+        WrongUsageError, "ms=-1 is not a positive number"
+    )
+    expect(expect(time.time).to.run_within).when.called_with(ms=1, percentile="p101").to.throw(
+        WrongUsageError, "'p101' is not a percentile between 0 and 100, e.g.: 95 or \"p95\""
+    )
+    expect(expect(time.time).to.run_within).when.called_with(ms=1, repeat=0).to.throw(
+        WrongUsageError, "run_within() takes a positive int `repeat' and a non-negative int `warmup' but got repeat=0 and warmup=0"
+    )
+
+
+def test_assertion_builder_allocate_less_than():
+    "expect(callable).to.allocate_less_than(mb=N) should measure the peak of memory allocated by calling the callable"
+
+    from sure.errors import WrongUsageError
+
+    expect(bytearray).when.called_with(1024).to.allocate_less_than(kb=64)
+    expect(bytearray).when.called_with(2 * 1024 * 1024).to_not.allocate_less_than(mb=1)
+    expect(expect(bytearray).when.called_with(2 * 1024 * 1024).to.allocate_less_than).when.called_with(mb=1).to.throw(
+        AssertionError, re.compile(r"^`bytearray' should allocate less than 1[.]0MB but allocated 2[.]0MB at its peak$")
+    )
+    expect(expect(bytearray).when.called_with(1024).to_not.allocate_less_than).when.called_with(mb=1).to.throw(
+        AssertionError, re.compile(r"^`bytearray' should not allocate less than 1[.]0MB but allocated .+ at its peak$")
+    )
+    expect(expect(1).to.allocate_less_than).when.called_with(mb=1).to.throw(
+        WrongUsageError, "1 should be callable in order to measure how much memory it allocates"
+    )
@@ -14,18 +14,25 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import tempfile
 import unittest
+from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch
 from sure import expects
-from sure.loader.astutil import gather_class_definitions_from_module_path, gather_class_definitions_node
+from sure.loader.astutil import (
+    gather_class_definitions_from_module_path,
+    gather_class_definitions_node,
+    gather_imports_from_module_path,
+    index_class_definitions_from_module_path,
+)
 
 
 class TestLoaderAstUtilBaseClassName(TestCase):
     def test_gather_class_definitions_from_module_path(self):
         classes = gather_class_definitions_from_module_path(__file__)
         expects(classes).to.equal(
-            {'TestLoaderAstUtilBaseClassName': (24, ('TestCase',)), 'TestLoaderAstUtilBaseClassAttributeAndName': (32, ('unittest.TestCase',))}
+            {'TestLoaderAstUtilBaseClassName': (31, ('TestCase',)), 'TestLoaderAstUtilBaseClassAttributeAndName': (39, ('unittest.TestCase',))}
         )
 
 
@@ -33,7 +40,7 @@ class TestLoaderAstUtilBaseClassAttributeAndName(unittest.TestCase):
     def test_gather_class_definitions_from_module_path(self):
         classes = gather_class_definitions_from_module_path(__file__)
         expects(classes).to.equal(
-            {'TestLoaderAstUtilBaseClassName': (24, ('TestCase',)), 'TestLoaderAstUtilBaseClassAttributeAndName': (32, ('unittest.TestCase',))}
+            {'TestLoaderAstUtilBaseClassName': (31, ('TestCase',)), 'TestLoaderAstUtilBaseClassAttributeAndName': (39, ('unittest.TestCase',))}
         )
 
 
@@ -55,3 +62,58 @@ def test_gather_class_definitions_from_module_path_symlink(Path, send_runtime_wa
     expects(gather_class_definitions_from_module_path("path")).to.equal({})
     Path.assert_called_once_with("path")
     send_runtime_warning.assert_called_once_with("parsing skipped of irregular file `absolute-path-dummy'")
+
+
+@patch('sure.loader.astutil.gather_class_definitions_from_module_path')
+def test_index_class_definitions_from_module_path(gather_class_definitions_from_module_path):
+    "sure.loader.astutil.index_class_definitions_from_module_path() parses a file only once until its modification time or size changes"
+
+    gather_class_definitions_from_module_path.side_effect = lambda path: {"path": str(path)}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("test_module.py")
+        path.write_text("class TestCase(object):\n    pass\n")
+
+        expects(index_class_definitions_from_module_path(path)).to.equal({"path": str(path)})
+        expects(index_class_definitions_from_module_path(path)).to.equal({"path": str(path)})
+        expects(gather_class_definitions_from_module_path.call_count).to.equal(1)
+
+        path.write_text("class TestCase(object):\n    pass\n\n\nclass TestAnother(object):\n    pass\n")
+        index_class_definitions_from_module_path(path)
+        expects(gather_class_definitions_from_module_path.call_count).to.equal(2)
+
+
+def test_index_class_definitions_from_module_path_returns_copy():
+    "sure.loader.astutil.index_class_definitions_from_module_path() returns a copy of the cached mapping"
+
+    classes = index_class_definitions_from_module_path(__file__)
+    classes.clear()
+
+    expects(index_class_definitions_from_module_path(__file__)).to.have.key("TestLoaderAstUtilBaseClassName")
+
+
+def test_gather_imports_from_module_path():
+    "sure.loader.astutil.gather_imports_from_module_path() returns the level, module name and imported names of every import statement"
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("module.py")
+        path.write_text(
+            "import os.path, sys\n"
+            "from . import sibling\n"
+            "from ..base import Model, Field\n"
+            "from package.module import *\n"
+            "\n"
+            "def function():\n"
+            "    import json\n"
+        )
+
+        expects(gather_imports_from_module_path(path)).to.equal(
+            [
+                (0, "os.path", ()),
+                (0, "sys", ()),
+                (1, "", ("sibling",)),
+                (2, "base", ("Model", "Field")),
+                (0, "package.module", ()),
+                (0, "json", ()),
+            ]
+        )
@@ -1543,55 +1543,55 @@ def test_word_to_number():
 
 
 def test_microsecond_unit():
-    "testing microseconds convertion"
+    "testing microseconds convertion from and to nanoseconds"
     cfrom, cto = sure.UNITS[sure.microsecond]
 
-    expects(cfrom(1)).to.equal(100000)
-    expects(cto(1)).to.equal(1)
+    expects(cfrom(1)).to.equal(1000)
+    expects(cto(1000)).to.equal(1)
 
     cfrom, cto = sure.UNITS[sure.microseconds]
 
-    expects(cfrom(1)).to.equal(100000)
-    expects(cto(1)).to.equal(1)
+    expects(cfrom(1)).to.equal(1000)
+    expects(cto(1000)).to.equal(1)
 
 
 def test_milisecond_unit():
-    "testing miliseconds convertion"
+    "testing miliseconds convertion from and to nanoseconds"
     cfrom, cto = sure.UNITS[sure.milisecond]
 
-    expects(cfrom(1)).to.equal(1000)
-    expects(cto(100)).to.equal(1)
+    expects(cfrom(1)).to.equal(1000000)
+    expects(cto(1000000)).to.equal(1)
 
     cfrom, cto = sure.UNITS[sure.miliseconds]
 
-    expects(cfrom(1)).to.equal(1000)
-    expects(cto(100)).to.equal(1)
+    expects(cfrom(1)).to.equal(1000000)
+    expects(cto(1000000)).to.equal(1)
 
 
 def test_second_unit():
-    "testing seconds convertion"
+    "testing seconds convertion from and to nanoseconds"
     cfrom, cto = sure.UNITS[sure.second]
 
-    expects(cfrom(1)).to.equal(1)
-    expects(cto(100000)).to.equal(1)
+    expects(cfrom(1)).to.equal(1000000000)
+    expects(cto(1000000000)).to.equal(1)
 
     cfrom, cto = sure.UNITS[sure.seconds]
 
-    expects(cfrom(1)).to.equal(1)
-    expects(cto(100000)).to.equal(1)
+    expects(cfrom(1)).to.equal(1000000000)
+    expects(cto(1000000000)).to.equal(1)
 
 
 def test_minute_unit():
-    "testing minutes convertion"
+    "testing minutes convertion from and to nanoseconds"
     cfrom, cto = sure.UNITS[sure.minute]
 
-    expects(cfrom(60)).to.equal(1)
-    expects(cto(1)).to.equal(6000000)
+    expects(cfrom(1)).to.equal(60000000000)
+    expects(cto(60000000000)).to.equal(1)
 
     cfrom, cto = sure.UNITS[sure.minutes]
 
-    expects(cfrom(60)).to.equal(1)
-    expects(cto(1)).to.equal(6000000)
+    expects(cfrom(1)).to.equal(60000000000)
+    expects(cto(60000000000)).to.equal(1)
 
 
 def test_within_wrong_usage():
@@ -1653,3 +1653,14 @@ def test_assertion_helper_equals():
     test = AssertionHelper(Test)
 
     assert expects(test.the_attribute("_attribute").equals).when.called_with("unknown").raises(AssertionError)
+
+
+def test_within_accounts_for_whole_seconds():
+    "within(one=second) should fail when the decorated function takes longer than a whole second, regardless of the fraction of the second"
+    from mock import patch
+
+    with patch("sure.time") as time_mock:
+        time_mock.perf_counter_ns.side_effect = [0, 1000000000 + 1000]
+        expects(within(one=second)(lambda: None)).when.called.to.have.raised(
+            AssertionError, "did not run within one seconds"
+        )
@@ -144,3 +144,27 @@ def test_error_stack_assertion_error_nonlocation_specific_error_traceback():
     )
     expects(stack.full()).to.equal(f'  File "{collapse_path(__file__)}", line 132, in synthesize_error_stack\n    raise RuntimeError("error 2")\n')
     expects(str(stack)).to.equal(f'  File "{collapse_path(__file__)}", line 132, in synthesize_error_stack\n    raise RuntimeError("error 2")\n')
+
+
+def test_error_stack_formats_traceback_once():
+    """sure.runtime.ErrorStack formats its traceback at most once regardless of how many times it is rendered"""
+    from mock import patch
+
+    def synthesize_error_stack():
+        try:
+            raise RuntimeError("error")
+        except Exception as e:
+            return e, sys.exc_info()
+
+    error, info = synthesize_error_stack()
+    location = TestLocation(synthesize_error_stack, sys.modules[__name__])
+    stack = ErrorStack(location, error, info)
+
+    with patch("sure.runtime.traceback.format_tb", wraps=__import__("traceback").format_tb) as format_tb:
+        full = stack.full()
+        expects(stack.full()).to.be(full)
+        expects(stack.location_specific_error()).to.equal(full)
+        expects(stack.nonlocation_specific_stack()).to.be.empty
+        expects(str(stack)).to.be(full)
+
+    expects(format_tb.call_count).to.equal(1)
@@ -17,7 +17,12 @@
 from sure import expects
 
 from sure.loader import collapse_path
-from sure.runtime import is_class_initializable_without_params
+from sure.runtime import (
+    appears_to_be_runnable,
+    is_class_initializable_without_params,
+    seem_to_indicate_benchmark,
+    seem_to_indicate_test,
+)
 
 
 description = "tests generally heuristic functions within :mod:`sure.runtime`"
@@ -35,3 +40,12 @@ def test_is_class_initializable_without_params():
     expects(is_class_initializable_without_params(ParamFreeClass)).to.not_be.false
     expects(is_class_initializable_without_params(ParamClass)).to.not_be.true
     expects(is_class_initializable_without_params({})).to.not_be.true
+
+
+def test_seem_to_indicate_benchmark():
+    expects(seem_to_indicate_benchmark("bench_sorting")).to.be.true
+    expects(seem_to_indicate_benchmark("BenchSorting")).to.be.true
+    expects(seem_to_indicate_benchmark("test_sorting")).to.be.false
+    expects(seem_to_indicate_benchmark("bench")).to.be.false
+    expects(seem_to_indicate_test("bench_sorting")).to.be.true
+    expects(appears_to_be_runnable("bench_sorting")).to.be.true
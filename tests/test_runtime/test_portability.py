@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""tests for the portability of runtime objects across processes"""
+
+import pickle
+from sure import expects
+from sure.doubles import stub
+from sure.loader import collapse_path
+from sure.errors import PortableAssertionError, PortableException, portable_exception
+from sure.runtime import (
+    Feature,
+    ScenarioResult,
+    ScenarioResultSet,
+    Scenario,
+    TestLocation,
+    RuntimeContext,
+)
+
+
+description = "tests for the portability of runtime objects across processes"
+
+
+class ContrivedError(Exception):
+    def __init__(self, code: int, reason: str):
+        super().__init__(f"{code}: {reason}")
+
+
+def contrive_failure():
+    "contrived failure"
+    raise AssertionError("contrived failure")
+
+
+def contrive_result(unit=contrive_failure):
+    location = TestLocation(contrive_failure)
+    try:
+        unit()
+    except Exception as e:
+        return ScenarioResult(
+            scenario=Scenario(contrive_failure, None),
+            location=location,
+            context=stub(RuntimeContext),
+            error=e,
+        )
+
+
+def test_scenario_result_failure_survives_pickle_round_trip():
+    ":class:`sure.runtime.ScenarioResult` should retain the information used by reporters when pickled"
+
+    scenario_result = contrive_result()
+    portable = pickle.loads(pickle.dumps(scenario_result))
+
+    expects(portable).to.be.a(ScenarioResult)
+    expects(portable.label).to.equal("FAILURE")
+    expects(portable.is_failure).to.be.true
+    expects(portable.is_error).to.be.false
+    expects(portable.context).to.be.none
+    expects(portable.failure).to.be.an(AssertionError)
+    expects(str(portable.failure)).to.equal("contrived failure")
+    expects(portable.scenario.name).to.equal("contrive_failure")
+    expects(portable.scenario.object).to.be.none
+    expects(portable.location.test).to.be.none
+    expects(repr(portable.location)).to.equal(repr(scenario_result.location))
+    expects(str(portable.location)).to.equal(str(scenario_result.location))
+    expects(portable.location.path_and_lineno).to.equal(
+        f"{collapse_path(__file__)}:{contrive_failure.__code__.co_firstlineno}"
+    )
+    expects(portable.stack.traceback).to.be.none
+    expects(portable.stack.full()).to.equal(scenario_result.stack.full())
+    expects(portable.succinct_failure).to.equal(scenario_result.succinct_failure)
+
+
+def test_scenario_result_shares_identity_within_pickle():
+    "runtime objects referenced more than once should remain the same object after being pickled together"
+
+    scenario_result = contrive_result()
+    portable_result, portable_location = pickle.loads(
+        pickle.dumps((scenario_result, scenario_result.location))
+    )
+    expects(portable_result.location).to.be(portable_location)
+
+
+def test_scenario_result_error_of_user_defined_class():
+    ":class:`sure.runtime.ScenarioResult` should represent errors of user-defined classes with :class:`sure.errors.PortableException`"
+
+    def contrive_error():
+        raise ContrivedError(1, "contrived error")
+
+    portable = pickle.loads(pickle.dumps(contrive_result(contrive_error)))
+
+    expects(portable.is_error).to.be.true
+    expects(portable.error).to.be.a(PortableException)
+    expects(portable.error).to.have.property("module").being.equal(__name__)
+    expects(portable.error).to.have.property("qualname").being.equal("ContrivedError")
+    expects(repr(portable.error)).to.equal("ContrivedError('1: contrived error')")
+    expects(str(portable.error)).to.equal("1: contrived error")
+    expects(portable.stack.exception).to.be.a(PortableException)
+
+
+def test_portable_exception():
+    "sure.errors.portable_exception() should keep builtin exceptions and replace user-defined ones, preserving the distinction between failures and errors"
+
+    expects(portable_exception(None)).to.be.none
+    expects(portable_exception(ValueError("value"))).to.be.a(ValueError)
+    expects(portable_exception(ContrivedError(1, "error"))).to.be.a(PortableException)
+    expects(portable_exception(ContrivedError(1, "error"))).to_not.be.an(AssertionError)
+
+    class ContrivedFailure(AssertionError):
+        pass
+
+    failure = pickle.loads(pickle.dumps(portable_exception(ContrivedFailure("failure"))))
+    expects(failure).to.be.a(PortableAssertionError)
+    expects(failure).to.be.an(AssertionError)
+    expects(failure.qualname).to.equal(
+        "test_portable_exception.<locals>.ContrivedFailure"
+    )
+
+
+def test_scenario_result_set_delegates_to_first_unsuccessful_result():
+    ":class:`sure.runtime.ScenarioResultSet` should take the scenario, location and stack of its first unsuccessful result"
+
+    success = stub(ScenarioResult, __error__=None, __failure__=None)
+    failure = contrive_result()
+    result_set = ScenarioResultSet([success, failure], context=stub(RuntimeContext))
+
+    expects(result_set.origin).to.be(failure)
+    expects(result_set.scenario).to.be(failure.scenario)
+    expects(result_set.location).to.be(failure.location)
+    expects(result_set.stack).to.be(failure.stack)
+
+    successful_set = ScenarioResultSet([success], context=stub(RuntimeContext))
+    expects(successful_set.origin).to.be.none
+    expects(successful_set.location).to.be.none
+    expects(successful_set.stack).to.be.none
+
+
+def test_feature_drops_module_when_pickled():
+    ":class:`sure.runtime.Feature` should not carry its module nor its scenarios when pickled"
+
+    feature = pickle.loads(pickle.dumps(Feature(__import__(__name__, fromlist=["*"]))))
+    expects(feature.title).to.equal(__name__)
+    expects(feature.description).to.equal(description)
+    expects(feature.module).to.be.none
+    expects(feature.scenarios).to.be.none
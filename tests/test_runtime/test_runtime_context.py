@@ -16,11 +16,12 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 "tests for :class:`sure.runtime.RuntimeContext`"
 
+import asyncio
 from mock import patch
 from sure import expects
 from sure.doubles import stub
 from sure.runtime import RuntimeContext, RuntimeOptions
-from sure.reporter import Reporter
+from sure.reporter import Reporter, EventRecorder
 
 
 description = "tests for :class:`sure.runtime.RuntimeContext`"
@@ -53,3 +54,41 @@ def test_runtime_context(WarningReaper):
         'dummy-warning-a',
         'dummy-warning-b',
     ])
+
+
+def test_runtime_context_event_loop():
+    "sure.runtime.RuntimeContext.loop should be created on first use, reused until closed and closed only if created"
+
+    async def running_loop():
+        return asyncio.get_running_loop()
+
+    context = RuntimeContext(stub(Reporter), RuntimeOptions(immediate=False))
+    context.close()
+
+    loop = context.loop
+    expects(context.loop).to.be(loop)
+    expects(context.run_until_complete(running_loop())).to.be(loop)
+
+    context.close()
+    expects(loop.is_closed()).to.be.true
+    expects(context.loop).to_not.be(loop)
+    context.close()
+
+
+def test_runtime_context_isolated():
+    "sure.runtime.RuntimeContext.isolated() should return a copy which records reporter events and creates its own event loop"
+
+    reporter_stub = stub(Reporter)
+    options = RuntimeOptions(immediate=False)
+    context = RuntimeContext(reporter_stub, options)
+    loop = context.loop
+
+    isolated = context.isolated()
+
+    expects(isolated.reporter).to.be.an(EventRecorder)
+    expects(isolated.options).to.be(options)
+    expects(isolated.loop).to_not.be(loop)
+    expects(context.reporter).to.be(reporter_stub)
+
+    isolated.close()
+    context.close()
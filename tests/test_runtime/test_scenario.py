@@ -131,6 +131,7 @@ def test_scenario_run_when_result_is_error_and_runtime_options_immediate(
         is_error=True,
         is_success=False,
         is_failure=False,
+        is_timeout=False,
         scenario=scenario_stub,
     )
     scenario_arrangement.run.return_value = [(scenario_result, RuntimeRole.Unit)]
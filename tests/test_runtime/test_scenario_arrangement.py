@@ -298,3 +298,39 @@ def test_scenario_arrangement_run_container_error_and_immediate_context_option()
     expects(list).when.called_with(scenario_arrangement.run_container(container, context)).to.throw(
         ImmediateError, "error"
     )
+
+
+def test_scenario_arrangement_run_results_carry_their_role():
+    "sure.runtime.ScenarioArrangement.run() should yield results whose role matches the RuntimeRole of their container"
+
+    class TestCaseRunRoles:
+        def setup(self):
+            pass
+
+        def test_method(self):
+            assert not False
+
+        def teardown(self):
+            pass
+
+    runner = stub(Runner)
+    reporter = Reporter.from_name_and_runner("test", runner)
+    context = RuntimeContext(
+        reporter=reporter,
+        options=RuntimeOptions(
+            immediate=False,
+        )
+    )
+    scenario_arrangement = ScenarioArrangement.from_generic_object(
+        TestCaseRunRoles,
+        context=context,
+        scenario=stub(Scenario),
+    )
+
+    results = list(scenario_arrangement.run(context))
+    expects([role for _, role in results]).to.equal(
+        [RuntimeRole.Setup, RuntimeRole.Unit, RuntimeRole.Teardown]
+    )
+    expects([result.role for result, _ in results]).to.equal(
+        [RuntimeRole.Setup, RuntimeRole.Unit, RuntimeRole.Teardown]
+    )
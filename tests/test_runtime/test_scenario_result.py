@@ -49,3 +49,26 @@ def test_scenario_result_printable():
             f"{collapse_path(__file__)}:35"
         )
     )
+
+
+def test_scenario_result_stack_is_created_lazily_for_failures_and_errors_only():
+    "ScenarioResult.stack is created only when first accessed and only for failures and errors"
+
+    location = TestLocation(test_scenario_result_stack_is_created_lazily_for_failures_and_errors_only)
+    success = ScenarioResult(
+        scenario=stub(Scenario), location=location, context=stub(RuntimeContext), error=None
+    )
+    try:
+        raise AssertionError("contrived failure")
+    except AssertionError as failure:
+        failed = ScenarioResult(
+            scenario=stub(Scenario), location=location, context=stub(RuntimeContext), error=failure
+        )
+
+    expects(success.__dict__["__stack__"]).to.be.none
+    expects(failed.__dict__["__stack__"]).to.be.none
+    expects(success.stack).to.be.none
+    expects(failed.stack).to.be.an(ErrorStack)
+    expects(failed.stack).to.be(failed.stack)
+    expects(failed.stack.exception).to.be(failed.failure)
+    expects(failed.succinct_failure).to.contain('raise AssertionError("contrived failure")')
@@ -208,3 +208,22 @@ def test_test_location_nonsupported_types():
         TypeError,
         f"{[]} of type {list} is not supported by {TestLocation}"
     )
+
+
+def test_test_location_classname():
+    """TestLocation().classname is the dotted name of the class which defines the test or of the module of test functions"""
+
+    class DummyTestCaseClassname(unittest.TestCase):
+        def test_dummy(self):
+            pass
+
+    def test_function():
+        pass
+
+    expects(TestLocation(test_function).classname).to.equal(__name__)
+    expects(TestLocation(DummyTestCaseClassname("test_dummy").test_dummy).classname).to.equal(
+        f"{__name__}.DummyTestCaseClassname"
+    )
+    expects(TestLocation(DummyTestCaseClassname("test_dummy")).classname).to.equal(
+        f"{__name__}.DummyTestCaseClassname"
+    )
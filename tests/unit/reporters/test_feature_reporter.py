@@ -99,6 +99,7 @@ def test_feature_reporter_on_scenario():
             call.bold_green("\n   Scenario: "),
             call.normal("Location of Scenario Stub"),
             call.reset(" "),
+            call.flush(),
         ]
     )
 
@@ -119,6 +120,7 @@ def test_feature_reporter_on_scenario_avoids_reporting_twice():
             call.bold_green("\n   Scenario: "),
             call.normal("Location of Scenario Stub"),
             call.reset(" "),
+            call.flush(),
         ]
     )
     reporter.on_scenario(scenario_stub)
@@ -140,6 +142,7 @@ def test_feature_reporter_on_scenario_test():
             call.green("\n     Test: "),
             call.normal("test"),
             call.reset(" "),
+            call.flush(),
         ]
     )
 
@@ -279,8 +282,8 @@ def test_feature_reporter_on_failure_failure():
             call.reset("\n"),
             call.reset("       "),
             call.yellow(
-                f'Failure: contrived failure\n  File "{collapse_path(__file__)}", line 253, in contrive_exception_info\n    ErrorStack()\n'
-            ) if sys.version_info < (3, 13) else call.yellow(f'Failure: contrived failure\n  File "{collapse_path(__file__)}", line 253, in contrive_exception_info\n    ErrorStack()\n    ~~~~~~~~~~^^\n'),
+                f'Failure: contrived failure\n  File "{collapse_path(__file__)}", line 256, in contrive_exception_info\n    ErrorStack()\n'
+            ) if sys.version_info < (3, 13) else call.yellow(f'Failure: contrived failure\n  File "{collapse_path(__file__)}", line 256, in contrive_exception_info\n    ErrorStack()\n    ~~~~~~~~~~^^\n'),
             call.reset("         "),
             call.bold_blue("\n          Scenario:"),
             call.bold_blue(
@@ -343,12 +346,12 @@ def test_feature_reporter_on_error():
             call.reset("\n"),
             call.bold_red("Error SystemError('loudhighpitch')\n"),
             call.bold_red(
-                f'  File \"{collapse_path(__file__)}\", line 319, in contrive_exception_info\n    raise SystemError("loudhighpitch")\n'
+                f'  File \"{collapse_path(__file__)}\", line 322, in contrive_exception_info\n    raise SystemError("loudhighpitch")\n'
             ),
             call.reset("  "),
             call.reset("\n"),
             call.bold_red(
-                f"{collapse_path(__file__)}:316\n"
+                f"{collapse_path(__file__)}:319\n"
             ),
         ]
     )
@@ -409,7 +412,7 @@ def test_feature_reporter_on_internal_runtime_error(exit):
         [
             call.bold_red("NoneType: None\n"),
             call.bold_red(
-                f'  File "{collapse_path(__file__)}", line 398, in contrive_special_syntax_disabled_error\n    raise InternalRuntimeError(context, RuntimeError("fail"))\n'
+                f'  File "{collapse_path(__file__)}", line 401, in contrive_special_syntax_disabled_error\n    raise InternalRuntimeError(context, RuntimeError("fail"))\n'
             ),
         ]
     )
@@ -450,6 +453,7 @@ def test_feature_reporter_on_finish():
             call.green("8 successful"),
             call.reset("\n"),
             call.reset(""),
+            call.flush(),
         ]
     )
 
@@ -488,5 +492,250 @@ def test_feature_reporter_on_finish_with_warnings():
             call.yellow("ResourceWarning: "),
             call.bold_black("dangerous\n"),
             call.reset("\n"),
+            call.flush(),
         ]
     )
+
+
+def test_feature_reporter_on_finish_with_profiles():
+    "FeatureReporter.on_finish() displays the functions with the highest internal time of each profiled test"
+
+    profile = Spy(name="ScenarioProfile")
+    profile.top.return_value = [("~/tests/helpers.py:7(parse)", 1200, 0.25)]
+    location_stub = stub(TestLocation, name="test_parse", path_and_lineno="~/tests/test_parse.py:3")
+    scenario_stub = stub(Scenario, location=location_stub, description="")
+    scenario_result_stub = stub(ScenarioResult, __error__=None, __failure__=None, location=location_stub, profile=profile)
+
+    reporter = FeatureReporter(stub(Runner))
+    sh = Spy(name="Shell")
+    reporter.sh = sh
+    reporter.indentation = 4
+    reporter.on_scenario_done(scenario_stub, scenario_result_stub)
+    options = RuntimeOptions(immediate=False, profile="sure.prof", profile_top=3)
+    context = stub(
+        RuntimeContext,
+        reporter=reporter,
+        options=options,
+        warnings=[],
+    )
+    sh.reset_mock()
+
+    reporter.on_finish(context)
+    profile.top.assert_called_once_with(3)
+    expects(sh.mock_calls).to.equal(
+        [
+            call.reset(""),
+            call.green("1 successful"),
+            call.reset("\n"),
+            call.reset(""),
+            call.bold_blue("\nTop 3 functions by internal time per test "),
+            call.normal("(aggregated into sure.prof)\n"),
+            call.bold_white("\n  test_parse "),
+            call.bold_black("~/tests/test_parse.py:3\n"),
+            call.yellow("      0.250000s "),
+            call.normal("    1200 calls  ~/tests/helpers.py:7(parse)\n"),
+            call.reset("\n"),
+            call.flush(),
+        ]
+    )
+
+
+def test_feature_reporter_on_finish_with_memory():
+    "FeatureReporter.on_finish() flags tests which retained more memory than the threshold"
+    from sure.memory import MemoryTrace
+
+    reporter = FeatureReporter(stub(Runner))
+    sh = Spy(name="Shell")
+    reporter.sh = sh
+    reporter.indentation = 4
+    for name, retained in (("test_small", 1024), ("test_leaky", 3 * 1024 * 1024), ("test_leakier", 5 * 1024 * 1024)):
+        location_stub = stub(TestLocation, name=name, path_and_lineno=f"~/tests/test_memory.py:{retained}")
+        scenario_stub = stub(Scenario, location=location_stub, description="")
+        memory = stub(MemoryTrace, retained=retained, peak=retained * 2)
+        reporter.on_scenario_done(
+            scenario_stub,
+            stub(ScenarioResult, __error__=None, __failure__=None, location=location_stub, memory=memory),
+        )
+
+    options = RuntimeOptions(immediate=False, trace_memory=True, memory_threshold=2)
+    context = stub(RuntimeContext, reporter=reporter, options=options, warnings=[])
+    sh.reset_mock()
+
+    reporter.on_finish(context)
+    expects(sh.mock_calls).to.equal(
+        [
+            call.reset(""),
+            call.green("3 successful"),
+            call.reset("\n"),
+            call.reset(""),
+            call.bold_yellow("\n2 tests retained more than 2.0MB\n"),
+            call.yellow("       5.0MB retained "),
+            call.normal("    10.0MB peak  test_leakier "),
+            call.bold_black("~/tests/test_memory.py:5242880\n"),
+            call.yellow("       3.0MB retained "),
+            call.normal("     6.0MB peak  test_leaky "),
+            call.bold_black("~/tests/test_memory.py:3145728\n"),
+            call.reset("\n"),
+            call.flush(),
+        ]
+    )
+
+
+def test_duration_histogram():
+    "sure.reporters.feature.duration_histogram() counts durations within each bucket"
+    from sure.reporters.feature import duration_histogram
+
+    expects(duration_histogram([0.0001, 0.0005, 0.05, 0.5, 12.0])).to.equal(
+        [
+            ("< 1ms", 2),
+            ("< 10ms", 0),
+            ("< 100ms", 1),
+            ("< 1s", 1),
+            ("< 10s", 0),
+            (">= 10s", 1),
+        ]
+    )
+
+
+def test_feature_reporter_on_finish_with_durations():
+    "FeatureReporter.on_finish() reports the slowest scenarios and features along with a histogram of durations"
+    from sure.runtime import FeatureResult
+
+    reporter = FeatureReporter(stub(Runner))
+    sh = Spy(name="Shell")
+    reporter.sh = sh
+    reporter.indentation = 4
+    for name, duration in (("test_fast", 0.0005), ("test_slow", 0.5), ("test_slower", 2.0)):
+        location_stub = stub(TestLocation, name=name, path_and_lineno=f"~/tests/test_durations.py:{name}")
+        scenario_stub = stub(Scenario, location=location_stub, description="")
+        reporter.on_scenario_done(
+            scenario_stub,
+            stub(ScenarioResult, __error__=None, __failure__=None, location=location_stub, duration=duration),
+        )
+
+    reporter.on_feature_done(
+        stub(Feature, title="tests.test_durations", path="/tmp/tests/test_durations.py"),
+        stub(FeatureResult, duration=2.5005),
+    )
+    options = RuntimeOptions(immediate=False, durations=2)
+    context = stub(RuntimeContext, reporter=reporter, options=options, warnings=[])
+    sh.reset_mock()
+
+    reporter.on_finish(context)
+    expects(sh.mock_calls).to.equal(
+        [
+            call.reset(""),
+            call.green("3 successful"),
+            call.reset("\n"),
+            call.reset(""),
+            call.bold_blue("\nSlowest 2 scenarios\n"),
+            call.yellow("       2.000s "),
+            call.normal("test_slower "),
+            call.bold_black("~/tests/test_durations.py:test_slower\n"),
+            call.yellow("       0.500s "),
+            call.normal("test_slow "),
+            call.bold_black("~/tests/test_durations.py:test_slow\n"),
+            call.bold_blue("\nSlowest 1 features\n"),
+            call.yellow("       2.501s "),
+            call.normal("tests.test_durations "),
+            call.bold_black("/tmp/tests/test_durations.py\n"),
+            call.bold_blue("\nDurations of 3 scenarios\n"),
+            call.normal("     < 1ms "),
+            call.green("████████████████████████████████████████"),
+            call.normal(" 1\n"),
+            call.normal("    < 10ms "),
+            call.green(""),
+            call.normal(" 0\n"),
+            call.normal("   < 100ms "),
+            call.green(""),
+            call.normal(" 0\n"),
+            call.normal("      < 1s "),
+            call.green("████████████████████████████████████████"),
+            call.normal(" 1\n"),
+            call.normal("     < 10s "),
+            call.green("████████████████████████████████████████"),
+            call.normal(" 1\n"),
+            call.normal("    >= 10s "),
+            call.green(""),
+            call.normal(" 0\n"),
+            call.reset("\n"),
+            call.flush(),
+        ]
+    )
+
+
+def test_feature_reporter_on_error_avoids_reporting_the_same_error_twice():
+    "FeatureReporter.on_error() should avoid reporting errors with the same stack twice, keeping only hashes of reported stacks"
+
+    reporter = FeatureReporter(stub(Runner))
+    sh = Spy(name="Shell")
+    reporter.sh = sh
+    location_stub = stub(TestLocation, name="test_error", path_and_lineno="~/tests/test_error.py:3")
+    result = stub(
+        ScenarioResult,
+        __error__=SpecialSyntaxDisabledError("contrived"),
+        __failure__=None,
+        location=location_stub,
+        stack=stub(ErrorStack, full=lambda self: "Traceback\n"),
+    )
+    scenario = stub(Scenario, location=location_stub)
+
+    reporter.on_error(scenario, result)
+    expects(sh.mock_calls).to_not.be.empty
+    sh.reset_mock()
+    reporter.on_error(scenario, result)
+
+    expects(sh.mock_calls).to.be.empty
+    expects(reporter.reported_errors).to.equal({hash("Traceback\n")})
+    expects(reporter.errors).to.equal([scenario])
+
+
+def test_feature_reporter_on_scenario_done_records_each_test_once():
+    "FeatureReporter.on_scenario_done() should only record the durations, profiles and memory traces of tests, once per result"
+    from sure.runtime import RuntimeRole
+
+    reporter = FeatureReporter(stub(Runner))
+    reporter.sh = Spy(name="Shell")
+    scenario = stub(Scenario, location=stub(TestLocation, name="TestCase"), description="")
+
+    def result_of(name, role):
+        location = stub(TestLocation, name=name, path_and_lineno=f"~/tests/test_roles.py:{name}")
+        return stub(
+            ScenarioResult,
+            __error__=None,
+            __failure__=None,
+            location=location,
+            duration=0.1,
+            role=role,
+            profile=Spy(name="ScenarioProfile"),
+            memory=Spy(name="MemoryTrace"),
+        )
+
+    test_one = result_of("test_one", RuntimeRole.Unit)
+    test_two = result_of("test_two", RuntimeRole.Unit)
+    for result in (
+        result_of("setUp", RuntimeRole.Setup),
+        test_one,
+        test_one,
+        test_two,
+        test_two,
+        result_of("tearDown", RuntimeRole.Teardown),
+    ):
+        reporter.on_scenario_done(scenario, result)
+
+    expects([name for _, name, _ in reporter.scenario_durations]).to.equal(["test_one", "test_two"])
+    expects(reporter.profiled).to.equal([test_one, test_two])
+    expects(reporter.traced).to.equal([test_one, test_two])
+
+
+def test_feature_reporter_on_scenario_flushes_before_each_test():
+    "FeatureReporter.on_scenario() should flush the text so far before every test of a scenario runs, even when the scenario was already reported"
+
+    location_stub = stub(TestLocation, description="Location of Scenario Stub")
+    scenario_stub = stub(Scenario, location=location_stub)
+    reporter = FeatureReporter(stub(Runner))
+    reporter.on_scenario(scenario_stub)
+    reporter.sh = Spy(name="Shell")
+    reporter.on_scenario(scenario_stub)
+
+    expects(reporter.sh.mock_calls).to.equal([call.flush()])
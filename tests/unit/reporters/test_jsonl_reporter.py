@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"unit tests for :mod:`sure.reporters.jsonl`"
+import json
+import tempfile
+from pathlib import Path
+from sure import expects
+from sure.runner import Runner
+from sure.benchmark import Benchmark
+from sure.runtime import (
+    Feature,
+    FeatureResult,
+    Scenario,
+    TestLocation,
+    RuntimeContext,
+    RuntimeOptions,
+    ScenarioResult,
+    ErrorStack,
+)
+from sure.reporters import JSONLinesReporter
+from sure.doubles import stub
+
+
+def test_jsonl_reporter_writes_one_object_per_event():
+    "JSONLinesReporter writes one JSON object per line for each event, along with monotonic timestamps, locations and durations"
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("events.jsonl")
+        reporter = JSONLinesReporter(
+            stub(Runner, options=RuntimeOptions(immediate=False, report_file=str(path)))
+        )
+        location = stub(
+            TestLocation,
+            name="test_parse",
+            filename="/tmp/tests/test_parse.py",
+            line=7,
+            description="parses things",
+        )
+        feature = stub(Feature, title="tests.test_parse", path="/tmp/tests/test_parse.py")
+        scenario = stub(Scenario, name="test_parse", location=location)
+        success = stub(ScenarioResult, __error__=None, __failure__=None, location=location, duration=0.5)
+        failure = stub(
+            ScenarioResult,
+            __error__=None,
+            __failure__=AssertionError("1 != 2"),
+            location=location,
+            duration=0.25,
+            stack=stub(ErrorStack, full=lambda self: "Traceback\n"),
+        )
+        reporter.on_start()
+        reporter.on_feature(feature)
+        reporter.on_scenario(scenario)
+        reporter.on_scenario_done(scenario, success)
+        reporter.on_scenario_done(scenario, success)
+        reporter.on_failure(scenario, failure)
+        reporter.on_scenario_done(scenario, failure)
+        reporter.on_feature_done(feature, stub(FeatureResult, label="FAILURE", duration=0.75))
+        reporter.on_finish(stub(RuntimeContext))
+        reporter.on_error(scenario, failure)
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+
+    expects([record.pop("event") for record in records]).to.equal(
+        [
+            "on_start",
+            "on_feature",
+            "on_scenario",
+            "on_scenario_done",
+            "on_scenario_done",
+            "on_failure",
+            "on_scenario_done",
+            "on_feature_done",
+            "on_finish",
+        ]
+    )
+    monotonic = [record.pop("monotonic") for record in records]
+    expects(monotonic).to.equal(sorted(monotonic))
+    expects(all(isinstance(record.pop("time"), float) for record in records)).to.be.true
+    expects(records[-1].pop("duration")).to.be.greater_than_or_equal_to(0)
+    location_record = {
+        "name": "test_parse",
+        "filename": "/tmp/tests/test_parse.py",
+        "line": 7,
+        "description": "parses things",
+    }
+    feature_record = {"title": "tests.test_parse", "path": "/tmp/tests/test_parse.py"}
+    expects(records).to.equal(
+        [
+            {},
+            {"feature": feature_record},
+            {"scenario": "test_parse", "location": location_record},
+            {"scenario": "test_parse", "label": "ok", "duration": 0.5, "location": location_record},
+            {"scenario": "test_parse", "label": "ok", "duration": 0.5, "location": location_record},
+            {
+                "scenario": "test_parse",
+                "failure": {"type": "AssertionError", "message": "1 != 2", "stack": "Traceback\n"},
+                "label": "failure",
+                "duration": 0.25,
+                "location": location_record,
+            },
+            {"scenario": "test_parse", "label": "failure", "duration": 0.25, "location": location_record},
+            {"feature": feature_record, "label": "failure", "duration": 0.75},
+            {"results": {"ok": 1, "failure": 1}},
+        ]
+    )
+
+
+def test_jsonl_reporter_on_benchmark():
+    "JSONLinesReporter.on_benchmark() writes the statistics of the benchmark"
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("events.jsonl")
+        reporter = JSONLinesReporter(
+            stub(Runner, options=RuntimeOptions(immediate=False, report_file=str(path)))
+        )
+        location = stub(TestLocation, name="bench_parse", filename="/tmp/bench.py", line=3, description="")
+        benchmark = Benchmark("tests.bench.bench_parse", "bench_parse", 10, [100.0, 300.0])
+        result = stub(
+            ScenarioResult, __error__=None, __failure__=None, location=location, duration=0.5, benchmark=benchmark
+        )
+        reporter.on_start()
+        reporter.on_benchmark(stub(Scenario, name="bench_parse"), result)
+        reporter.on_finish(stub(RuntimeContext))
+
+        (start, record, finish) = [json.loads(line) for line in path.read_text().splitlines()]
+
+    expects(record["event"]).to.equal("on_benchmark")
+    expects(record["benchmark"]).to.equal(dict(name="bench_parse", **benchmark.to_dict()))
+
+
+def test_jsonl_reporter_counts_only_tests_in_results():
+    "JSONLinesReporter counts neither setups nor teardowns among the results of a TestCase with setUp and tearDown"
+    import os
+
+    with tempfile.TemporaryDirectory() as directory:
+        module = Path(directory).joinpath("test_jsonl_setup_and_teardown.py")
+        module.write_text(
+            "import unittest\n\n\n"
+            "class TestWithSetUpAndTearDown(unittest.TestCase):\n"
+            "    def setUp(self):\n        self.value = 1\n\n"
+            "    def tearDown(self):\n        self.value = None\n\n"
+            "    def test_one(self):\n        assert self.value == 1\n\n"
+            "    def test_two(self):\n        assert self.value == 1\n"
+        )
+        path = Path(directory).joinpath("events.jsonl")
+        runner = Runner(
+            base_path=Path(os.getcwd()),
+            reporter="jsonl",
+            options=RuntimeOptions(immediate=False, report_file=str(path)),
+        )
+        runner.execute([module])
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+
+    (finish,) = [record for record in records if record["event"] == "on_finish"]
+    expects(finish["results"]).to.equal({"ok": 2})
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"unit tests for :mod:`sure.reporters.junit`"
+import tempfile
+from pathlib import Path
+from xml.etree import ElementTree
+from mock import patch
+from sure import expects
+from sure.runner import Runner
+from sure.runtime import (
+    Feature,
+    FeatureResult,
+    Scenario,
+    TestLocation,
+    RuntimeContext,
+    RuntimeOptions,
+    ScenarioResult,
+    ErrorStack,
+    RuntimeRole,
+)
+from sure.reporters import JUnitReporter
+from sure.reporters.junit import xml_attribute, xml_text
+from sure.doubles import stub
+
+
+def scenario_result_stub(name, line, duration=0.5, error=None, role=RuntimeRole.Unit):
+    location = stub(
+        TestLocation,
+        name=name,
+        classname="tests.test_junit.TestJUnit",
+        filename="/tmp/tests/test_junit.py",
+        line=line,
+    )
+    return stub(
+        ScenarioResult,
+        __error__=error,
+        __failure__=error if isinstance(error, AssertionError) else None,
+        location=location,
+        duration=duration,
+        role=role,
+        stack=stub(ErrorStack, full=lambda self: f"Traceback of {name}\n"),
+    )
+
+
+def test_xml_text_and_attribute_escape_markup_and_illegal_characters():
+    "sure.reporters.junit.xml_text() and xml_attribute() escape markup and replace characters which are illegal in XML"
+
+    expects(xml_text("1 < 2 & \x1b[31mred")).to.equal("1 &lt; 2 &amp; ?[31mred")
+    expects(xml_attribute('say "hi"\x00')).to.equal("'say \"hi\"?'")
+
+
+def test_junit_reporter_writes_testcases_as_scenarios_finish():
+    "JUnitReporter writes each <testcase> as soon as its scenario finishes, once per result"
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("reports", "junit.xml")
+        reporter = JUnitReporter(
+            stub(Runner, options=RuntimeOptions(immediate=False, report_file=str(path)))
+        )
+        feature = stub(Feature, title="tests.test_junit", path="/tmp/tests/test_junit.py")
+        scenario = stub(Scenario)
+        success = scenario_result_stub("test_success", 3)
+        failure = scenario_result_stub("test_failure", 7, 0.25, AssertionError("1 != 2"))
+        error = scenario_result_stub("test_error", 11, 0.125, ValueError("<bad>"))
+
+        reporter.on_start()
+        reporter.on_feature(feature)
+        reporter.on_scenario(scenario)
+        reporter.on_scenario_done(scenario, success)
+        reporter.on_scenario_done(scenario, success)
+        reporter.on_failure(scenario, failure)
+        reporter.on_scenario_done(scenario, failure)
+
+        reporter.output.flush()
+        expects(path.read_text().count("<testcase ")).to.equal(2)
+
+        reporter.on_error(scenario, error)
+        reporter.on_scenario_done(scenario, error)
+        reporter.on_feature_done(feature, stub(FeatureResult))
+        reporter.on_finish(stub(RuntimeContext))
+        reporter.on_error(scenario, error)
+
+        root = ElementTree.parse(path).getroot()
+
+    expects(root.tag).to.equal("testsuites")
+    (suite,) = root.findall("testsuite")
+    expects(suite.attrib).to.equal({"name": "tests.test_junit", "file": "/tmp/tests/test_junit.py"})
+    expects([testcase.attrib for testcase in suite.findall("testcase")]).to.equal(
+        [
+            {
+                "classname": "tests.test_junit.TestJUnit",
+                "name": "test_success",
+                "file": "/tmp/tests/test_junit.py",
+                "line": "3",
+                "time": "0.500000",
+            },
+            {
+                "classname": "tests.test_junit.TestJUnit",
+                "name": "test_failure",
+                "file": "/tmp/tests/test_junit.py",
+                "line": "7",
+                "time": "0.250000",
+            },
+            {
+                "classname": "tests.test_junit.TestJUnit",
+                "name": "test_error",
+                "file": "/tmp/tests/test_junit.py",
+                "line": "11",
+                "time": "0.125000",
+            },
+        ]
+    )
+    success_case, failure_case, error_case = suite.findall("testcase")
+    expects(list(success_case)).to.be.empty
+    expects(failure_case.find("failure").attrib).to.equal({"type": "AssertionError", "message": "1 != 2"})
+    expects(failure_case.find("failure").text).to.equal("Traceback of test_failure\n")
+    expects(error_case.find("error").attrib).to.equal({"type": "ValueError", "message": "<bad>"})
+
+
+def test_junit_reporter_writes_to_stdout_without_report_file():
+    "JUnitReporter writes to sys.stdout when no report file is given and leaves it open"
+
+    reporter = JUnitReporter(stub(Runner, options=RuntimeOptions(immediate=False)))
+    with patch("sure.reporter.sys.stdout") as stdout:
+        reporter.on_start()
+        reporter.on_finish(stub(RuntimeContext))
+
+    expects(stdout.write.call_count).to.equal(2)
+    expects(stdout.close.called).to.be.false
+
+
+def test_junit_reporter_writes_only_tests_as_testcases():
+    "JUnitReporter writes neither setups nor teardowns as <testcase> elements and writes the file of test cases and suites alike"
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("junit.xml")
+        reporter = JUnitReporter(
+            stub(Runner, options=RuntimeOptions(immediate=False, report_file=str(path)))
+        )
+        feature = stub(Feature, title="tests.test_junit", path="~/tests/test_junit.py")
+        scenario = stub(Scenario)
+        setup = scenario_result_stub("setUp", 2, role=RuntimeRole.Setup)
+        test = scenario_result_stub("test_success", 3)
+        test.location.filename = "~/tests/test_junit.py"
+        failed_teardown = scenario_result_stub("tearDown", 5, 0.25, ValueError("boom"), RuntimeRole.Teardown)
+
+        reporter.on_start()
+        reporter.on_feature(feature)
+        reporter.on_scenario_done(scenario, setup)
+        reporter.on_scenario_done(scenario, test)
+        reporter.on_error(scenario, failed_teardown)
+        reporter.on_scenario_done(scenario, failed_teardown)
+        reporter.on_feature_done(feature, stub(FeatureResult))
+        reporter.on_finish(stub(RuntimeContext))
+
+        (suite,) = ElementTree.parse(path).getroot().findall("testsuite")
+
+    (testcase,) = suite.findall("testcase")
+    expects(testcase.attrib["name"]).to.equal("test_success")
+    expects(testcase.attrib["file"]).to.equal(suite.attrib["file"])
+    expects(testcase.attrib["file"]).to.equal(str(Path("~/tests/test_junit.py").expanduser()))
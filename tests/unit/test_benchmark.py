@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"unit tests for :mod:`sure.benchmark`"
+
+import tempfile
+from mock import patch
+from sure import expects
+from sure.cache import JSONCache
+from sure.errors import WrongUsageError
+from sure.benchmark import Baseline, Benchmark, calibrate
+
+
+@patch("sure.benchmark.run_iterations")
+def test_calibrate(run_iterations):
+    "sure.benchmark.calibrate() doubles the amount of iterations until they take at least the minimum time"
+
+    run_iterations.side_effect = lambda function, iterations: iterations * 1000
+    expects(calibrate(lambda: None, min_time=0.000005)).to.equal(8)
+
+
+def test_benchmark_statistics():
+    "sure.benchmark.Benchmark computes statistics of nanoseconds per iteration"
+
+    benchmark = Benchmark("module.bench_something", "bench_something", 64, [100.0, 200.0, 300.0])
+
+    expects(benchmark.mean).to.equal(200.0)
+    expects(benchmark.stddev).to.equal(100.0)
+    expects(benchmark.min).to.equal(100.0)
+    expects(benchmark.ops_per_second).to.equal(5000000.0)
+    expects(benchmark.change).to.be.none
+    expects(benchmark.summary()).to.equal("200ns ± 100ns (min 100ns, 5,000,000 ops/sec, 3 rounds of 64)")
+
+    benchmark.baseline = 80.0
+    expects(benchmark.change).to.equal(25.0)
+    expects(benchmark.summary()).to.equal("200ns ± 100ns (min 100ns, 5,000,000 ops/sec, 3 rounds of 64) +25.0% of baseline")
+
+
+def test_benchmark_measure():
+    "sure.benchmark.Benchmark.measure() runs the calibrated amount of iterations in each round"
+
+    calls = []
+
+    def bench_append():
+        calls.append(None)
+
+    benchmark = Benchmark.measure(bench_append, rounds=3, min_time=0.0001)
+
+    expects(benchmark.key).to.equal("tests.unit.test_benchmark.test_benchmark_measure.<locals>.bench_append")
+    expects(benchmark.name).to.equal("bench_append")
+    expects(benchmark.samples).to.have.length_of(3)
+    expects(len(calls)).to.be.greater_than_or_equal_to(benchmark.iterations * 3)
+
+
+def test_benchmark_measure_coroutine_function():
+    "sure.benchmark.Benchmark.measure() refuses coroutine functions"
+
+    async def bench_coroutine():
+        pass
+
+    expects(Benchmark.measure).when.called_with(bench_coroutine).to.have.raised(
+        WrongUsageError,
+        "benchmark test_benchmark_measure_coroutine_function.<locals>.bench_coroutine must not be a coroutine function"
+    )
+
+
+def test_baseline_check_and_record():
+    "sure.benchmark.Baseline compares benchmarks against the recorded ones and records new ones"
+
+    with tempfile.TemporaryDirectory() as directory:
+        baseline = Baseline(JSONCache("benchmarks", directory=directory))
+        benchmark = Benchmark("module.bench_a", "bench_a", 1, [130.0])
+
+        baseline.check(benchmark, threshold=20)
+        expects(benchmark.baseline).to.be.none
+
+        baseline.record(benchmark)
+        baseline.save()
+        benchmark.samples = [100.0]
+        baseline.record(benchmark)
+        baseline.save()
+
+        recorded = Baseline(JSONCache("benchmarks", directory=directory))
+        expects(recorded.benchmarks["module.bench_a"]["mean"]).to.equal(130.0)
+
+        benchmark.samples = [150.0]
+        recorded.check(benchmark, threshold=20)
+        expects(benchmark.baseline).to.equal(130.0)
+        recorded.check(benchmark, threshold=None)
+
+        benchmark.samples = [260.0]
+        expects(recorded.check).when.called_with(benchmark, threshold=20).to.have.raised(
+            AssertionError,
+            "benchmark bench_a regressed by 100.0%, from 130ns to 260ns per iteration, which exceeds the threshold of 20%"
+        )
+
+        recorded.record(benchmark, overwrite=True)
+        expects(recorded.benchmarks["module.bench_a"]["mean"]).to.equal(260.0)
+
+
+def test_baseline_check_compares_fastest_rounds():
+    "sure.benchmark.Baseline.check() compares the fastest round of benchmarks such that rounds slowed down by interference do not fail them"
+
+    with tempfile.TemporaryDirectory() as directory:
+        baseline = Baseline(JSONCache("benchmarks", directory=directory))
+        baseline.record(Benchmark("module.bench_a", "bench_a", 1, [100.0, 102.0, 101.0]))
+
+        noisy = Benchmark("module.bench_a", "bench_a", 1, [101.0, 180.0, 175.0])
+        baseline.check(noisy, threshold=20)
+        expects(noisy.baseline).to.equal(100.0)
+        expects(noisy.change).to.equal(1.0)
+
+        slower = Benchmark("module.bench_a", "bench_a", 1, [130.0, 131.0, 135.0])
+        expects(baseline.check).when.called_with(slower, threshold=20).to.have.raised(
+            AssertionError,
+            "benchmark bench_a regressed by 30.0%, from 100ns to 130ns per iteration, which exceeds the threshold of 20%"
+        )
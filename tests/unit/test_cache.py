@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"unit tests for :mod:`sure.cache`"
+
+import tempfile
+from pathlib import Path
+from mock import patch
+from sure import expects
+from sure.cache import JSONCache, get_cache_dir
+
+
+def test_json_cache_save_and_load():
+    "sure.cache.JSONCache should load the data it saved as long as its version is the same"
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = JSONCache("dummy", version=1, directory=directory)
+        expects(cache.load()).to.equal({})
+        expects(cache.save({"key": ["value"]})).to.be.true
+        expects(cache.path).to.equal(Path(directory).joinpath("dummy.json"))
+
+        expects(JSONCache("dummy", version=1, directory=directory).load()).to.equal({"key": ["value"]})
+        expects(JSONCache("dummy", version=2, directory=directory).load()).to.equal({})
+
+        cache.path.write_text("{corrupted")
+        expects(cache.load()).to.equal({})
+
+
+@patch.dict("os.environ", {"SURE_NO_CACHE": "1"})
+def test_json_cache_disabled():
+    "sure.cache.JSONCache.save() should not write anything when SURE_NO_CACHE is set"
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = JSONCache("dummy", directory=directory)
+        expects(cache.save({"key": "value"})).to.be.false
+        expects(cache.path.exists()).to.be.false
+
+
+@patch.dict("os.environ", {"SURE_CACHE_DIR": "/tmp/sure-cache-dummy"})
+def test_get_cache_dir():
+    "sure.cache.get_cache_dir() should respect SURE_CACHE_DIR"
+
+    expects(get_cache_dir()).to.equal(Path("/tmp/sure-cache-dummy"))
+    expects(repr(JSONCache("dummy"))).to.equal("<JSONCache /tmp/sure-cache-dummy/dummy.json>")
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"unit tests for :mod:`sure.core`"
+
+import gc
+import sys
+import weakref
+from sure import expects
+from sure.core import DeepComparison, Explanation
+
+
+def nest(value, depth):
+    for index in range(depth):
+        value = [{"key": value}]
+    return value
+
+
+def test_deep_comparison_beyond_recursion_limit():
+    "sure.core.DeepComparison should compare datastructures nested deeper than the recursion limit"
+
+    depth = sys.getrecursionlimit()
+    expects(DeepComparison(nest(1, depth), nest(1, depth)).compare()).to_not.be.an(Explanation)
+    expects(DeepComparison(nest(1.0, depth), nest(1.05, depth), epsilon=0.1).compare()).to_not.be.an(Explanation)
+
+
+def test_deep_comparison_wide_structures():
+    "sure.core.DeepComparison should point to the key-path of the first difference within wide datastructures"
+
+    X = [{"id": index, "tags": ["a", "b"]} for index in range(10000)]
+    Y = [{"id": index, "tags": ["a", "b"]} for index in range(10000)]
+    Y[9999]["tags"] = ["a", "c"]
+
+    expects(DeepComparison(X, Y).compare).when.called.to.throw(
+        AssertionError,
+        "X[9999]['tags'][1] is 'b' whereas Y[9999]['tags'][1] is 'c'",
+    )
+
+
+def test_deep_comparison_explanation_of_nested_complex_values():
+    "sure.core.DeepComparison.compare() should return an :class:`~sure.core.Explanation` of differences between nested complex values"
+
+    comparison = DeepComparison({"a": [1, {"b": 2.0}]}, {"a": [1, {"b": 2.5}]}, epsilon=0.1).compare()
+    expects(comparison).to.be.an(Explanation)
+    expects(comparison).to.equal("X['a'][1]['b']±0.1 != Y['a'][1]['b']±0.1")
+
+    comparison = DeepComparison({"a": [{"b": 1}]}, {"a": [{"c": 1}]}).compare()
+    expects(comparison).to.equal("X['a'][0] has the key \"'b'\" whereas Y['a'][0] does not")
+
+
+def test_deep_comparison_does_not_retain_operands():
+    "sure.core.DeepComparison should release its operands as soon as the comparison is over, without relying on the garbage collector"
+
+    class Operand(dict):
+        pass
+
+    gc.disable()
+    try:
+        X = Operand(a=[1, {"b": 2}])
+        reference = weakref.ref(X)
+        comparison = DeepComparison(X, Operand(a=[1, {"b": 3}]))
+        expects(comparison.compare()).to.equal("X != Y")
+
+        del X, comparison
+        expects(reference()).to.be.none
+    finally:
+        gc.enable()
@@ -279,3 +279,16 @@ def test_exception_manager_bypass_raising_special_syntax_disabled_when_attribute
 
     expects(exc).to.be.an(AttributeError)
     expects(str(exc)).to.equal("eye-twitch")
+
+
+@patch("sure.errors.linecache")
+def test_caller_location_display_info_is_read_lazily(linecache):
+    "sure.errors.CallerLocation.display_info should be read from :mod:`linecache` only when accessed and only once"
+
+    linecache.getline.return_value = "    expects(value).to.equal(value)\n"
+    location = CallerLocation.most_recent()
+    linecache.getline.assert_not_called()
+
+    expects(location.display_info).to.equal("expects(value).to.equal(value)")
+    expects(location.display_info).to.equal("expects(value).to.equal(value)")
+    linecache.getline.assert_called_once_with(__file__, location.lineno)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"unit tests for :mod:`sure.memory`"
+
+import tracemalloc
+from sure import expects
+from sure.errors import WrongUsageError
+from sure.memory import MemoryTrace, format_bytes, measure_allocations, parse_size
+
+
+def test_parse_size():
+    "sure.memory.parse_size() returns bytes"
+
+    expects(parse_size(b=3)).to.equal(3)
+    expects(parse_size(kb=2)).to.equal(2048)
+    expects(parse_size(mb=1.5)).to.equal(1572864)
+    expects(parse_size).when.called_with(mb=1, kb=2).to.have.raised(
+        WrongUsageError, "expected a single keyword-argument among b, kb, mb, gb, e.g.: mb=5 but got mb, kb"
+    )
+    expects(parse_size).when.called_with(mb=0).to.have.raised(
+        WrongUsageError, "mb=0 is not a positive number"
+    )
+
+
+def test_format_bytes():
+    "sure.memory.format_bytes() uses the largest unit wherein the amount is at least 1"
+
+    expects(format_bytes(512)).to.equal("512B")
+    expects(format_bytes(1536)).to.equal("1.5KB")
+    expects(format_bytes(-3 * 1024 * 1024)).to.equal("-3.0MB")
+    expects(format_bytes(2 * 1024 * 1024 * 1024)).to.equal("2.0GB")
+
+
+def test_memory_trace():
+    "sure.memory.MemoryTrace measures peak and retained memory across each time it is entered"
+
+    retained = []
+    trace = MemoryTrace()
+    try:
+        with trace:
+            retained.append(bytearray(1024 * 1024))
+            bytearray(2 * 1024 * 1024)
+        with trace:
+            retained.append(bytearray(1024 * 1024))
+    finally:
+        tracemalloc.stop()
+
+    expects(trace.traced).to.be.true
+    expects(trace.retained).to.be.within(2 * 1024 * 1024, 2 * 1024 * 1024 + 64 * 1024)
+    expects(trace.peak).to.be.within(3 * 1024 * 1024, 3 * 1024 * 1024 + 64 * 1024)
+
+
+def test_memory_trace_disabled():
+    "sure.memory.MemoryTrace(enabled=False) does not trace"
+
+    with MemoryTrace(enabled=False) as trace:
+        bytearray(1024 * 1024)
+
+    expects(trace.traced).to.be.false
+    expects(tracemalloc.is_tracing()).to.be.false
+
+
+def test_measure_allocations():
+    "sure.memory.measure_allocations() traces memory only for the duration of the call unless already tracing"
+
+    trace = measure_allocations(bytearray, (1024 * 1024,))
+
+    expects(trace.peak).to.be.greater_than_or_equal_to(1024 * 1024)
+    expects(tracemalloc.is_tracing()).to.be.false
+
+    tracemalloc.start()
+    try:
+        measure_allocations(bytearray, (1024,))
+        expects(tracemalloc.is_tracing()).to.be.true
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_trace_nested():
+    "sure.memory.MemoryTrace entered within another MemoryTrace does not hide the peak of the enclosing one"
+    from sure.memory import entered_peaks
+
+    try:
+        with MemoryTrace() as outer:
+            bytearray(4 * 1024 * 1024)
+            with MemoryTrace() as first:
+                bytearray(1024 * 1024)
+            with MemoryTrace() as second:
+                bytearray(2 * 1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+    expects(first.peak).to.be.within(1024 * 1024 - 64 * 1024, 1024 * 1024 + 64 * 1024)
+    expects(second.peak).to.be.within(2 * 1024 * 1024 - 64 * 1024, 2 * 1024 * 1024 + 64 * 1024)
+    expects(outer.peak).to.be.within(4 * 1024 * 1024 - 64 * 1024, 4 * 1024 * 1024 + 64 * 1024)
+    expects(entered_peaks).to.be.empty
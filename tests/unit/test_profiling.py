@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"unit tests for :mod:`sure.profiling`"
+
+import pickle
+import pstats
+import tempfile
+from pathlib import Path
+from sure import expects
+from sure.errors import collapse_path
+from sure.profiling import ScenarioProfile, dump_profiles
+
+
+def parse(document):
+    return [line.split(",") for line in document.splitlines()]
+
+
+def test_scenario_profile():
+    "sure.profiling.ScenarioProfile accumulates statistics across each time it is entered and survives pickling"
+
+    profile = ScenarioProfile()
+    with profile:
+        parse("a,b\nc,d")
+    with profile:
+        parse("e,f")
+
+    functions = [function for function, calls, seconds in profile.top(10)]
+    expects(functions).to.contain(f"{collapse_path(__file__)}:28(parse)")
+    expects(functions).to_not.contain("<method 'disable' of '_lsprof.Profiler' objects>")
+    calls = dict((function, calls) for function, calls, seconds in profile.top(10))
+    expects(calls[f"{collapse_path(__file__)}:28(parse)"]).to.equal(2)
+
+    restored = pickle.loads(pickle.dumps(profile))
+    expects(restored.stats).to.equal(profile.stats)
+    expects(restored.profiled).to.be.true
+
+
+def test_scenario_profile_disabled():
+    "sure.profiling.ScenarioProfile(enabled=False) does not profile"
+
+    with ScenarioProfile(enabled=False) as profile:
+        parse("a,b")
+
+    expects(profile.profiled).to.be.false
+    expects(profile.top(5)).to.be.empty
+
+
+def test_dump_profiles():
+    "sure.profiling.dump_profiles() aggregates profiles into a single file without discarding their statistics"
+
+    profiles = [ScenarioProfile(), ScenarioProfile(), ScenarioProfile(enabled=False)]
+    for profile in profiles:
+        with profile:
+            parse("a,b")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("sure.prof")
+        expects(dump_profiles(profiles, path)).to.be.a(pstats.Stats)
+        stats = pstats.Stats(str(path))
+
+    parse_stats = [timings for function, timings in stats.stats.items() if function[2] == "parse"]
+    expects(parse_stats).to.have.length_of(1)
+    expects(parse_stats[0][1]).to.equal(2)
+    expects(profiles[0].profiled).to.be.true
+    expects(dump_profiles(profiles[2:], "unused.prof")).to.be.none
@@ -15,11 +15,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from sure import expects
-from sure.reporter import Reporter
+import os
+import sys
+import tempfile
+from pathlib import Path
+from sure.reporter import Reporter, EventRecorder, ReportFile, open_report_file
 from sure.reporters import FeatureReporter
 from sure.runner import Runner
 from sure.doubles import stub, anything
-from unittest.mock import patch
+from unittest.mock import patch, call
+from unittest.mock import Mock as Spy
 
 description = "tests for :class:`sure.reporter`"
 
@@ -150,3 +155,88 @@ def test_from_name_and_runner(initialize):
     expects(reporter.on_finish).when.called_with(anything).to.have.raised(
         NotImplementedError
     )
+
+
+def test_event_recorder_replay():
+    "sure.reporter.EventRecorder records events and replays them in order into another reporter"
+
+    recorder = EventRecorder(stub(Runner))
+    recorder.on_start()
+    recorder.on_feature("feature")
+    recorder.on_scenario("scenario")
+    recorder.on_success("scenario")
+    recorder.on_scenario_done("scenario", "result")
+    recorder.on_failure("scenario", "failure")
+    recorder.on_error("scenario", "error")
+    recorder.on_internal_runtime_error("context", "exception")
+    recorder.on_feature_done("feature", "result")
+    recorder.on_finish("context")
+
+    reporter = Spy(name="Reporter")
+    recorder.replay(reporter)
+
+    expects(reporter.mock_calls).to.equal([
+        call.on_start(),
+        call.on_feature("feature"),
+        call.on_scenario("scenario"),
+        call.on_success("scenario"),
+        call.on_scenario_done("scenario", "result"),
+        call.on_failure("scenario", "failure"),
+        call.on_error("scenario", "error"),
+        call.on_internal_runtime_error("context", "exception"),
+        call.on_feature_done("feature", "result"),
+        call.on_finish("context"),
+    ])
+
+
+def test_open_report_file():
+    "sure.reporter.open_report_file() opens paths for writing, creating their parent directories, and returns sys.stdout when no path is given"
+
+    expects(open_report_file(None)).to.be(sys.stdout)
+    expects(open_report_file("")).to.be(sys.stdout)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("reports", "report.txt")
+        with open_report_file(str(path)) as stream:
+            stream.write("written")
+
+        expects(path.read_text()).to.equal("written")
+
+
+def test_open_report_file_with_file_descriptor():
+    "sure.reporter.open_report_file() treats integers and strings of digits as file descriptors already open and leaves them open"
+
+    read_fd, write_fd = os.pipe()
+    try:
+        stream = open_report_file(str(write_fd))
+        stream.write("through a pipe")
+        stream.close()
+        os.write(write_fd, b"!")
+        expects(os.read(read_fd, 100)).to.equal(b"through a pipe!")
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_report_file_flushes_periodically():
+    "sure.reporter.ReportFile flushes once sure.reporter.FLUSH_INTERVAL seconds have elapsed since the last flush and when closed"
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("report.txt")
+        output = ReportFile(str(path))
+        with patch("sure.reporter.time.monotonic", return_value=output.last_flush + 0.5):
+            output.write("first ")
+        written_before_interval = path.read_text()
+
+        with patch("sure.reporter.time.monotonic", return_value=output.last_flush + 1):
+            output.write("second ")
+        written_after_interval = path.read_text()
+
+        output.write("third")
+        output.close()
+        written_after_close = path.read_text()
+
+    expects(written_before_interval).to.equal("")
+    expects(written_after_interval).to.equal("first second ")
+    expects(written_after_close).to.equal("first second third")
+    expects(output.stream.closed).to.be.true
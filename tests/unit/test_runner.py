@@ -23,7 +23,8 @@ from mock import Mock as Spy
 from sure import expects
 from sure.errors import ExitError, ExitFailure, ImmediateError, ImmediateFailure
 from sure.doubles import stub, Dummy
-from sure.runner import Runner
+from sure.runner import Runner, initialize_worker
+from sure.reporter import EventRecorder
 from sure.runtime import RuntimeOptions, Feature, FeatureResult, ScenarioResult, TestLocation, ErrorStack
 
 
@@ -72,7 +73,12 @@ def test_runner_find_candidates(loader):
     loader.load_recursive.return_value = [Dummy("dummy-module")]
 
     options_stub = stub(
-        RuntimeOptions, immediate=False, ignore=Dummy("excludes"), glob_pattern="*.py"
+        RuntimeOptions,
+        immediate=False,
+        ignore=Dummy("excludes"),
+        glob_pattern="*.py",
+        shard=None,
+        changed_since=None,
     )
     runner = stub(Runner, options=options_stub)
     modules = runner.find_candidates(["dummy-path"])
@@ -84,6 +90,40 @@ def test_runner_find_candidates(loader):
     )
 
 
+@patch("sure.runner.loader")
+def test_runner_find_candidate_paths(loader):
+    "sure.runner.Runner.find_candidate_paths() should call :meth:`sure.loader.loader.find_python_paths` rather than importing modules"
+
+    loader.find_python_paths.return_value = [Path("dummy-path/test_dummy.py")]
+
+    options_stub = stub(
+        RuntimeOptions,
+        immediate=False,
+        ignore=Dummy("excludes"),
+        glob_pattern="*.py",
+        shard=None,
+        changed_since=None,
+    )
+    runner = stub(Runner, options=options_stub)
+    paths = runner.find_candidate_paths(["dummy-path"])
+
+    expects(paths).to.equal([Path("dummy-path/test_dummy.py")])
+
+    loader.find_python_paths.assert_called_once_with(
+        "dummy-path", glob_pattern="*.py", excludes=Dummy("excludes")
+    )
+    loader.load_recursive.assert_not_called()
+
+
+def test_runner_get_reporter_instance():
+    "sure.runner.Runner.get_reporter() should return the given object when it already is an instance of :class:`sure.reporter.Reporter`"
+
+    runner = stub(Runner)
+    reporter = EventRecorder(runner)
+
+    expects(runner.get_reporter(reporter)).to.be(reporter)
+
+
 def test_runner_is_runnable_test_unittest_testcase():
     "sure.runner.Runner.is_runnable_test() should return ``True`` when receiving a subclass of :class:`unittest.TestCase`"
 
@@ -293,3 +333,14 @@ def test_runner_run_behavior_on_immediate_error(execute):
     expects(runner.run(Dummy("path"))).to.equal(scenario_result_stub)
 
     execute.assert_called_once_with(Dummy("path"))
+
+
+@patch("sure.enable_special_syntax")
+def test_initialize_worker(enable_special_syntax):
+    "sure.runner.initialize_worker() should enable the special syntax within worker processes when enabled within the parent process"
+
+    initialize_worker(False)
+    enable_special_syntax.assert_not_called()
+
+    initialize_worker(True)
+    enable_special_syntax.assert_called_once_with()
@@ -17,11 +17,65 @@
 
 "unit tests for :mod:`sure.runtime`"
 
+import time
+import threading
+
 from collections.abc import Awaitable
-from sure.runtime import object_name
+from sure import expects, timeout
+from sure.errors import ScenarioTimeout
+from sure.runtime import object_name, call_with_timeout, get_timeout
 
 
 def test_object_name_type():
     "calling ``sure.runtime.object_name(X)`` where X is a ``type``"
     assert object_name(Awaitable).should_not.equal("collections.abc.Awaitablea")
     assert object_name(Awaitable).should.equal("collections.abc.Awaitable")
+
+
+def test_call_with_timeout_within_main_thread():
+    "calling ``sure.runtime.call_with_timeout(function, seconds)`` within the main thread interrupts the function once the time is up"
+    expects(call_with_timeout).when.called_with(lambda: time.sleep(5), 0.05).should.have.raised(ScenarioTimeout, "timed out after 0.05 seconds")
+    expects(call_with_timeout(lambda: "value", 0.05)).to.equal("value")
+    expects(call_with_timeout(lambda: "value", None)).to.equal("value")
+
+
+def test_call_with_timeout_within_another_thread():
+    "calling ``sure.runtime.call_with_timeout(function, seconds)`` outside of the main thread watches the function from a watchdog thread"
+    outcome = []
+
+    def hang():
+        time.sleep(5)
+
+    def fail():
+        raise ValueError("contrived error")
+
+    def call():
+        for function in (hang, fail, lambda: "value"):
+            try:
+                outcome.append(call_with_timeout(function, 0.05))
+            except Exception as e:
+                outcome.append(e)
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    thread.join()
+
+    timed_out, error, value = outcome
+    expects(timed_out).to.be.a(ScenarioTimeout)
+    expects(error).to.be.a(ValueError)
+    expects(value).to.equal("value")
+
+
+def test_get_timeout():
+    "calling ``sure.runtime.get_timeout(*sources, default)`` returns the seconds given to :func:`sure.timeout` by the first source decorated thusly"
+
+    @timeout(2)
+    def decorated():
+        pass
+
+    def undecorated():
+        pass
+
+    expects(get_timeout(undecorated, decorated, default=7)).to.equal(2)
+    expects(get_timeout(undecorated, default=7)).to.equal(7)
+    expects(timeout).when.called_with(0).should.have.raised(TypeError, "timeout() takes a positive number of seconds, got 0")
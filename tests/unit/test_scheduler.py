@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"unit tests for :mod:`sure.scheduler`"
+
+import tempfile
+from pathlib import Path
+from sure import expects
+from sure.doubles import stub
+from sure.cache import JSONCache
+from sure.runtime import Feature, FeatureResult, ScenarioResult, ScenarioResultSet, TestLocation
+from sure.scheduler import (
+    Durations,
+    balanced_buckets,
+    longest_first,
+    parse_shard,
+    relative_key,
+    schedule,
+    select_shard,
+    shard_of,
+)
+
+
+durations = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 2.0, "f": 1.0}
+
+
+def test_longest_first():
+    "sure.scheduler.longest_first() sorts items by descending duration preserving the order of equal durations"
+
+    expects(longest_first("fedcba", durations.get)).to.equal(["a", "b", "d", "c", "e", "f"])
+
+
+def test_balanced_buckets():
+    "sure.scheduler.balanced_buckets() packs items into buckets with similar sums of durations"
+
+    buckets = balanced_buckets("abcdef", durations.get, 2)
+    expects(buckets).to.equal([["a", "d", "f"], ["b", "c", "e"]])
+    expects([sum(map(durations.get, bucket)) for bucket in buckets]).to.equal([9.0, 9.0])
+    expects(balanced_buckets("ab", durations.get, 0)).to.equal([["a", "b"]])
+
+
+def test_schedule():
+    "sure.scheduler.schedule() orders items according to the given mode"
+
+    expects(schedule("fedcba", durations.get)).to.equal(list("fedcba"))
+    expects(schedule("fedcba", durations.get, "longest-first")).to.equal(list("abdcef"))
+    expects(schedule("abcdef", durations.get, "balanced", buckets=2)).to.equal(list("abdcfe"))
+    expects(schedule).when.called_with("ab", durations.get, "random").to.throw(
+        ValueError, "unknown schedule 'random', options are: path, longest-first, balanced"
+    )
+
+
+def test_durations_record_and_estimate():
+    "sure.scheduler.Durations should persist the durations of features and of their scenarios"
+
+    location = TestLocation(test_durations_record_and_estimate)
+    scenario_result = stub(ScenarioResult, location=location, duration=0.25, __error__=None, __failure__=None)
+    result = FeatureResult([ScenarioResultSet([scenario_result], context=None)])
+    result.duration = 0.5
+    feature = stub(Feature, path=__file__)
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorded = Durations(JSONCache("durations", directory=directory))
+        expects(recorded.estimate(__file__)).to.equal(0.0)
+        recorded.record(feature, result)
+        recorded.record(stub(Feature, path=None), result)
+        recorded.save()
+
+        recorded = Durations(JSONCache("durations", directory=directory))
+        expects(recorded.get(__file__)).to.equal(0.5)
+        expects(recorded.get(None)).to.be.none
+        expects(recorded.estimate("unknown.py")).to.equal(0.5)
+        expects(recorded.scenarios).to.equal(
+            {f"{relative_key(__file__)}::test_durations_record_and_estimate": 0.25}
+        )
+
+
+def test_parse_shard():
+    "sure.scheduler.parse_shard() parses K/N strings into a tuple of integers"
+
+    expects(parse_shard("1/4")).to.equal((1, 4))
+    expects(parse_shard("4/4")).to.equal((4, 4))
+    expects(parse_shard).when.called_with("0/4").to.throw(ValueError, "'0/4' must satisfy 1 <= K <= N")
+    expects(parse_shard).when.called_with("5/4").to.throw(ValueError, "'5/4' must satisfy 1 <= K <= N")
+    expects(parse_shard).when.called_with("4").to.throw(ValueError, "'4' is not a shard in the form K/N, e.g.: 1/4")
+
+
+def test_select_shard_by_stable_hash():
+    "sure.scheduler.select_shard() assigns every path to exactly one shard by a stable hash of its relative path"
+
+    paths = [Path(f"tests/test_module_{index}.py") for index in range(20)]
+    shards = [select_shard(reversed(paths), (index, 3)) for index in (1, 2, 3)]
+
+    expects(sorted(sum(shards, []))).to.equal(sorted(paths))
+    for index, shard in enumerate(shards, start=1):
+        for path in shard:
+            expects(shard_of(path, 3)).to.equal(index)
+            expects(shard_of(path.absolute(), 3)).to.equal(index)
+
+    expects(shard_of("tests/test_module_0.py", 3)).to.equal(3)
+    expects(shard_of("tests/test_module_1.py", 3)).to.equal(1)
+
+
+def test_select_shard_by_durations():
+    "sure.scheduler.select_shard() balances shards by recorded durations when every path has a recorded duration"
+
+    paths = [Path(name).absolute() for name in "abcdef"]
+    with tempfile.TemporaryDirectory() as directory:
+        recorded = Durations(JSONCache("durations", directory=directory))
+        recorded.features = dict((relative_key(name), value) for name, value in durations.items())
+
+        expects([path.name for path in select_shard(paths, (1, 2), recorded)]).to.equal(["a", "d", "f"])
+        expects([path.name for path in select_shard(paths, (2, 2), recorded)]).to.equal(["b", "c", "e"])
+
+        del recorded.features[relative_key("f")]
+        expects(select_shard(paths, (1, 2), recorded)).to.equal(select_shard(paths, (1, 2)))
+
+
+def test_durations_read_never_saves():
+    "sure.scheduler.Durations.read() loads durations from the given file without ever writing them back"
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorded = Durations(JSONCache("durations", directory=directory))
+        recorded.features = {"tests/test_a.py": 1.0}
+        recorded.save()
+        path = Path(directory).joinpath("durations.json")
+
+        durations = Durations.read(path)
+        expects(durations.readonly).to.be.true
+        expects(durations.get("tests/test_a.py")).to.equal(1.0)
+
+        durations.features["tests/test_b.py"] = 2.0
+        durations.save()
+        expects(Durations.read(path).features).to.equal({"tests/test_a.py": 1.0})
@@ -14,9 +14,11 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import io
 from sure import expects
 from sure import terminal
 from mock import patch
+from mock import Mock as Spy
 
 
 description = "tests for :class:`sure.terminal`"
@@ -152,3 +154,105 @@ def test_green_without_ansi_support(has_ansi_support):
     has_ansi_support.return_value = False
 
     expects(terminal.green("blue")).to.equal(r"blue")
+
+
+class TerminalOutput(io.StringIO):
+    def isatty(self):
+        return True
+
+
+def test_buffered_shell_accumulates_output_until_flushed():
+    "sure.terminal.BufferedShell accumulates printed text in memory until flushed and omits ANSI escape sequences when not writing to a terminal"
+
+    output = io.StringIO()
+    sh = terminal.BufferedShell(output)
+    sh.bold_green("✓")
+    sh.reset(" ")
+    sh.yellow("1 failed\n")
+
+    expects(output.getvalue()).to.equal("")
+    sh.flush()
+    expects(output.getvalue()).to.equal("✓ 1 failed\n")
+
+
+def test_buffered_shell_writes_in_batches():
+    "sure.terminal.BufferedShell writes accumulated text at once as soon as it exceeds the batch size"
+
+    output = Spy(name="output")
+    output.isatty.return_value = False
+    sh = terminal.BufferedShell(output, batch_size=10)
+    sh.normal("12345")
+    sh.normal("67890")
+    sh.normal("abc")
+
+    output.write.assert_called_once_with("1234567890")
+    expects(sh.buffer).to.equal(["abc"])
+    sh.flush()
+
+
+def test_buffered_shell_flushes_within_interval():
+    "sure.terminal.BufferedShell writes accumulated text within the given interval in seconds"
+
+    output = io.StringIO()
+    sh = terminal.BufferedShell(output, interval=0.05)
+    sh.normal("eventually")
+    timer = sh.timer
+    expects(output.getvalue()).to.equal("")
+    timer.join()
+
+    expects(output.getvalue()).to.equal("eventually")
+    expects(sh.timer).to.be.none
+
+
+def test_buffered_shell_colors_terminals():
+    "sure.terminal.BufferedShell generates ANSI escape sequences when writing to a terminal, unless SURE_NO_COLORS is set"
+
+    output = TerminalOutput()
+    sh = terminal.BufferedShell(output)
+    sh.bold_green("✓")
+    sh.flush()
+    expects(output.getvalue()).to.equal("\x1b[1m\x1b[32m✓\x1b[0m")
+    expects(sh.interval).to.equal(terminal.TTY_FLUSH_INTERVAL)
+
+    output = TerminalOutput()
+    with patch.dict("os.environ", {"SURE_NO_COLORS": "1"}):
+        sh = terminal.BufferedShell(output)
+    sh.bold_green("✓")
+    sh.flush()
+    expects(output.getvalue()).to.equal("✓")
+    expects(sh.interval).to.equal(terminal.FLUSH_INTERVAL)
+
+
+def test_buffered_shell_creates_printers_once():
+    "sure.terminal.BufferedShell creates the printer of each color once and forgets them when the indentation changes"
+
+    sh = terminal.BufferedShell(io.StringIO())
+    expects(sh.bold_red).to.be(sh.bold_red)
+
+    printer = sh.bold_red
+    sh.indent()
+    expects(sh.bold_red).to_not.be(printer)
+    sh.bold_red("indented")
+    sh.dedent()
+    sh.bold_red("dedented")
+    sh.flush()
+    expects(sh.stream.getvalue()).to.equal("  indenteddedented")
+
+
+def test_buffered_shells_are_flushed_at_exit_without_being_kept_alive():
+    "sure.terminal.flush_buffered_shells() flushes every live BufferedShell while the shells themselves are not kept alive by it"
+    import gc
+    import weakref
+
+    output = io.StringIO()
+    sh = terminal.BufferedShell(output, interval=60)
+    sh.normal("pending")
+    timer = sh.timer
+    terminal.flush_buffered_shells()
+    expects(output.getvalue()).to.equal("pending")
+    timer.join()
+
+    reference = weakref.ref(sh)
+    del sh, timer
+    gc.collect()
+    expects(reference()).to.be.none
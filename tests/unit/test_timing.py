@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# <sure - sophisticated automated test library and runner>
+# Copyright (C) <2010-2024>  Gabriel Falcão <gabriel@nacaolivre.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"unit tests for :mod:`sure.timing`"
+
+from mock import patch
+from sure import expects
+from sure.timing import (
+    format_nanoseconds,
+    measure,
+    parse_limit,
+    parse_percentile,
+    percentile_of,
+)
+
+
+def test_parse_limit():
+    "sure.timing.parse_limit() returns nanoseconds"
+
+    expects(parse_limit(ns=3)).to.equal(3)
+    expects(parse_limit(us=3)).to.equal(3000)
+    expects(parse_limit(ms=1.5)).to.equal(1500000)
+    expects(parse_limit(s=2)).to.equal(2000000000)
+
+
+def test_parse_percentile():
+    "sure.timing.parse_percentile() accepts numbers and strings prefixed with p"
+
+    expects(parse_percentile(95)).to.equal(95)
+    expects(parse_percentile("p99")).to.equal(99.0)
+    expects(parse_percentile("P50")).to.equal(50.0)
+
+
+def test_percentile_of():
+    "sure.timing.percentile_of() returns the nearest-rank percentile"
+
+    samples = list(range(100, 0, -1))
+    expects(percentile_of(samples, 50)).to.equal(50)
+    expects(percentile_of(samples, 95)).to.equal(95)
+    expects(percentile_of(samples, 99.5)).to.equal(100)
+    expects(percentile_of(samples, 100)).to.equal(100)
+    expects(percentile_of([7], 1)).to.equal(7)
+
+
+@patch("sure.timing.time")
+def test_measure(time):
+    "sure.timing.measure() excludes warmup calls from the samples"
+
+    calls = []
+    time.perf_counter_ns.side_effect = [10, 15, 20, 40]
+    samples = measure(calls.append, ("call",), warmup=3, repeat=2)
+
+    expects(samples).to.equal([5, 20])
+    expects(calls).to.have.length_of(5)
+
+
+def test_format_nanoseconds():
+    "sure.timing.format_nanoseconds() uses the largest unit wherein the amount is at least 1"
+
+    expects(format_nanoseconds(999)).to.equal("999ns")
+    expects(format_nanoseconds(1500)).to.equal("1.500us")
+    expects(format_nanoseconds(2000000)).to.equal("2.000ms")
+    expects(format_nanoseconds(3000000000)).to.equal("3.000s")